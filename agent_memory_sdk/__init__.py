@@ -44,6 +44,9 @@ def check_pinecone_conflict():
     try:
         import pinecone
     except Exception as e:
+        if isinstance(e, ModuleNotFoundError) and e.name == "pinecone":
+            # Pinecone is optional; StoreFactory reports it when requested
+            return
         if "pinecone-client" in str(e) and "renamed" in str(e):
             print("❌ ERROR: Pinecone package conflict detected!")
             print("🔧 SOLUTION:")
@@ -63,7 +66,16 @@ check_pinecone_conflict()
 
 from .models import MemoryEntry, MemoryType
 from .memory import MemoryManager
-from .store import SQLiteStore, PineconeStore, BaseStore, StoreFactory
+from .store import SQLiteStore, BaseStore, StoreFactory
+
+
+def __getattr__(name):
+    """Import PineconeStore on first use, so the pinecone package stays optional"""
+    if name == "PineconeStore":
+        from .store.pinecone_store import PineconeStore
+        return PineconeStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # LangChain integration
 try:
@@ -7,6 +7,8 @@ This module provides a FastAPI-based REST API for remote memory access.
 from .server import create_app, MemoryAPI
 from .models import (
     MemoryCreateRequest,
+    MemoryBulkCreateRequest,
+    MemoryBulkCreateResponse,
     MemoryUpdateRequest,
     MemoryResponse,
     MemorySearchRequest,
@@ -20,6 +22,8 @@ __all__ = [
     "create_app",
     "MemoryAPI",
     "MemoryCreateRequest",
+    "MemoryBulkCreateRequest",
+    "MemoryBulkCreateResponse",
     "MemoryUpdateRequest", 
     "MemoryResponse",
     "MemorySearchRequest",
@@ -10,6 +10,7 @@ from urllib.parse import urljoin
 
 from .models import (
     MemoryCreateRequest,
+    MemoryBulkCreateRequest,
     MemoryUpdateRequest,
     MemoryResponse,
     MemorySearchRequest,
@@ -54,9 +55,15 @@ class MemoryAPIClient:
     
     def create_memory(self, request: MemoryCreateRequest) -> MemoryResponse:
         """Create a new memory"""
-        response = self._make_request('POST', '/memories', json=request.dict())
+        response = self._make_request('POST', '/memories', json=request.model_dump(mode="json"))
         return MemoryResponse(**response.json())
     
+    def create_memories(self, requests: List[MemoryCreateRequest]) -> List[MemoryResponse]:
+        """Create several memories in a single request"""
+        payload = MemoryBulkCreateRequest(memories=requests).model_dump(mode="json")
+        response = self._make_request('POST', '/memories/bulk', json=payload)
+        return [MemoryResponse(**memory) for memory in response.json()['memories']]
+    
     def get_memory(self, memory_id: str) -> MemoryResponse:
         """Get a specific memory by ID"""
         response = self._make_request('GET', f'/memories/{memory_id}')
@@ -64,7 +71,7 @@ class MemoryAPIClient:
     
     def update_memory(self, memory_id: str, request: MemoryUpdateRequest) -> MemoryResponse:
         """Update an existing memory"""
-        response = self._make_request('PUT', f'/memories/{memory_id}', json=request.dict())
+        response = self._make_request('PUT', f'/memories/{memory_id}', json=request.model_dump(mode="json"))
         return MemoryResponse(**response.json())
     
     def delete_memory(self, memory_id: str) -> Dict[str, str]:
@@ -74,7 +81,7 @@ class MemoryAPIClient:
     
     def search_memories(self, request: MemorySearchRequest) -> MemorySearchResponse:
         """Search memories with semantic and filtering"""
-        response = self._make_request('POST', '/memories/search', json=request.dict())
+        response = self._make_request('POST', '/memories/search', json=request.model_dump(mode="json"))
         return MemorySearchResponse(**response.json())
     
     def quick_search(self, query: str, **kwargs) -> MemorySearchResponse:
@@ -91,7 +98,7 @@ class MemoryAPIClient:
     
     def create_agent_memory(self, agent_id: str, request: MemoryCreateRequest) -> MemoryResponse:
         """Create a new memory for a specific agent"""
-        response = self._make_request('POST', f'/agents/{agent_id}/memories', json=request.dict())
+        response = self._make_request('POST', f'/agents/{agent_id}/memories', json=request.model_dump(mode="json"))
         return MemoryResponse(**response.json())
     
     def list_memories(self, skip: int = 0, limit: int = 50, **filters) -> Dict[str, Any]:
@@ -120,16 +127,19 @@ class MemoryAPIClient:
 class AsyncMemoryAPIClient:
     """Async client for interacting with the Agent Memory OS REST API"""
     
-    def __init__(self, base_url: str = "http://localhost:8000", timeout: int = 30):
+    def __init__(self, base_url: str = "http://localhost:8000", timeout: int = 30,
+                 max_connections: int = 16):
         """
         Initialize the async API client
         
         Args:
             base_url: Base URL of the API server
             timeout: Request timeout in seconds
+            max_connections: Size of the keep-alive connection pool
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        self.max_connections = max_connections
         self.session = None
     
     async def _get_session(self):
@@ -137,6 +147,10 @@ class AsyncMemoryAPIClient:
         if self.session is None:
             import aiohttp
             self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections,
+                ),
                 timeout=aiohttp.ClientTimeout(total=self.timeout),
                 headers={
                     'Content-Type': 'application/json',
@@ -161,9 +175,15 @@ class AsyncMemoryAPIClient:
     
     async def create_memory(self, request: MemoryCreateRequest) -> MemoryResponse:
         """Create a new memory"""
-        data = await self._make_request('POST', '/memories', json=request.dict())
+        data = await self._make_request('POST', '/memories', json=request.model_dump(mode="json"))
         return MemoryResponse(**data)
     
+    async def create_memories(self, requests: List[MemoryCreateRequest]) -> List[MemoryResponse]:
+        """Create several memories in a single request"""
+        payload = MemoryBulkCreateRequest(memories=requests).model_dump(mode="json")
+        data = await self._make_request('POST', '/memories/bulk', json=payload)
+        return [MemoryResponse(**memory) for memory in data['memories']]
+    
     async def get_memory(self, memory_id: str) -> MemoryResponse:
         """Get a specific memory by ID"""
         data = await self._make_request('GET', f'/memories/{memory_id}')
@@ -171,7 +191,7 @@ class AsyncMemoryAPIClient:
     
     async def update_memory(self, memory_id: str, request: MemoryUpdateRequest) -> MemoryResponse:
         """Update an existing memory"""
-        data = await self._make_request('PUT', f'/memories/{memory_id}', json=request.dict())
+        data = await self._make_request('PUT', f'/memories/{memory_id}', json=request.model_dump(mode="json"))
         return MemoryResponse(**data)
     
     async def delete_memory(self, memory_id: str) -> Dict[str, str]:
@@ -180,7 +200,7 @@ class AsyncMemoryAPIClient:
     
     async def search_memories(self, request: MemorySearchRequest) -> MemorySearchResponse:
         """Search memories with semantic and filtering"""
-        data = await self._make_request('POST', '/memories/search', json=request.dict())
+        data = await self._make_request('POST', '/memories/search', json=request.model_dump(mode="json"))
         return MemorySearchResponse(**data)
     
     async def quick_search(self, query: str, **kwargs) -> MemorySearchResponse:
@@ -197,7 +217,7 @@ class AsyncMemoryAPIClient:
     
     async def create_agent_memory(self, agent_id: str, request: MemoryCreateRequest) -> MemoryResponse:
         """Create a new memory for a specific agent"""
-        data = await self._make_request('POST', f'/agents/{agent_id}/memories', json=request.dict())
+        data = await self._make_request('POST', f'/agents/{agent_id}/memories', json=request.model_dump(mode="json"))
         return MemoryResponse(**data)
     
     async def list_memories(self, skip: int = 0, limit: int = 50, **filters) -> Dict[str, Any]:
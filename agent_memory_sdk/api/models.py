@@ -20,6 +20,11 @@ class MemoryCreateRequest(BaseModel):
     tags: Optional[List[str]] = Field(None, description="Tags for categorization")
 
 
+class MemoryBulkCreateRequest(BaseModel):
+    """Request model for creating several memories in one call"""
+    memories: List[MemoryCreateRequest] = Field(..., min_length=1, max_length=1000, description="Memories to create")
+
+
 class MemoryUpdateRequest(BaseModel):
     """Request model for updating an existing memory"""
     content: Optional[str] = Field(None, description="The content of the memory")
@@ -44,6 +49,12 @@ class MemoryResponse(BaseModel):
     last_accessed: Optional[datetime] = Field(None, description="Last access timestamp")
 
 
+class MemoryBulkCreateResponse(BaseModel):
+    """Response model for bulk memory creation"""
+    memories: List[MemoryResponse] = Field(..., description="Created memories, in request order")
+    total_count: int = Field(..., description="Number of memories created")
+
+
 class MemorySearchRequest(BaseModel):
     """Request model for searching memories"""
     query: str = Field(..., description="Search query")
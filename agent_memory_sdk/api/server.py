@@ -25,6 +25,8 @@ from fastapi.responses import FileResponse
 
 from .models import (
     MemoryCreateRequest,
+    MemoryBulkCreateRequest,
+    MemoryBulkCreateResponse,
     MemoryUpdateRequest,
     MemoryResponse,
     MemorySearchRequest,
@@ -80,6 +82,24 @@ class MemoryAPI:
         )
         return self._memory_to_response(memory)
     
+    def create_memories(self, request: MemoryBulkCreateRequest) -> MemoryBulkCreateResponse:
+        """Create several memories with a single store write"""
+        memories = self.memory_manager.add_memories([
+            {
+                "content": item.content,
+                "memory_type": item.memory_type,
+                "agent_id": item.agent_id,
+                "metadata": item.metadata,
+                "importance": item.importance,
+                "tags": item.tags,
+            }
+            for item in request.memories
+        ])
+        return MemoryBulkCreateResponse(
+            memories=[self._memory_to_response(m) for m in memories],
+            total_count=len(memories),
+        )
+    
     def get_memory(self, memory_id: str) -> MemoryResponse:
         """Get a specific memory by ID"""
         memory = self.memory_manager.get_memory(memory_id)
@@ -233,8 +253,20 @@ async def lifespan(app: FastAPI):
     memory_api = None
 
 
-def create_app(db_path: str = "agent_memory.db") -> FastAPI:
-    """Create and configure the FastAPI application"""
+def create_app(db_path: Optional[str] = None) -> FastAPI:
+    """
+    Create and configure the FastAPI application
+    
+    Also usable as a zero-argument app factory (uvicorn --factory), so each
+    worker process builds its own app.
+    
+    Args:
+        db_path: SQLite database path; defaults to the AGENT_MEMORY_DB
+            environment variable, then "agent_memory.db"
+    """
+    if db_path is None:
+        db_path = os.getenv("AGENT_MEMORY_DB", "agent_memory.db")
+    
     app = FastAPI(
         title="Agent Memory OS API",
         description="REST API for persistent, semantic, and episodic memory for AI agents",
@@ -269,6 +301,11 @@ def create_app(db_path: str = "agent_memory.db") -> FastAPI:
         """Create a new memory"""
         return memory_api.create_memory(request)
     
+    @app.post("/memories/bulk", response_model=MemoryBulkCreateResponse, tags=["Memories"])
+    async def create_memories(request: MemoryBulkCreateRequest):
+        """Create several memories in one request"""
+        return memory_api.create_memories(request)
+    
     @app.get("/memories/{memory_id}", response_model=MemoryResponse, tags=["Memories"])
     async def get_memory(memory_id: str = Path(..., description="Memory ID")):
         """Get a specific memory by ID"""
@@ -359,11 +396,9 @@ def create_app(db_path: str = "agent_memory.db") -> FastAPI:
             memories = [m for m in memories if m.memory_type == memory_type]
         # Filter by date range
         if start:
-            from datetime import datetime
             start_dt = datetime.fromisoformat(start)
             memories = [m for m in memories if m.created_at >= start_dt]
         if end:
-            from datetime import datetime
             end_dt = datetime.fromisoformat(end)
             memories = [m for m in memories if m.created_at <= end_dt]
         # Sort by created_at
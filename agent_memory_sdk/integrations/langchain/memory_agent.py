@@ -5,8 +5,8 @@ Provides a wrapper around LangChain agents that automatically integrates
 with Agent Memory OS for persistent memory capabilities.
 """
 
-from typing import Dict, List, Any, Optional, Union
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple, Union
+from datetime import datetime, timedelta
 
 from langchain.agents import AgentExecutor
 from langchain.agents.agent import Agent
@@ -16,6 +16,7 @@ from langchain.callbacks.manager import CallbackManager
 
 from ...memory import MemoryManager
 from ...models import MemoryType
+from ...utils.time_utils import new_session_id
 from .memory_tool import MemoryTool
 from .memory_callback import MemoryCallbackHandler
 
@@ -53,7 +54,7 @@ class MemoryAwareAgent:
         self.agent = agent
         self.memory_manager = memory_manager
         self.agent_id = agent_id
-        self.session_id = session_id or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.session_id = session_id or new_session_id()
         self.include_memory_tool = include_memory_tool
         self.enable_memory_callbacks = enable_memory_callbacks
         
@@ -188,11 +189,7 @@ class MemoryAwareAgent:
         if not memories:
             return "No relevant past context available."
         
-        context_parts = []
-        for memory in memories:
-            context_parts.append(f"- {memory.content}")
-        
-        return "\n".join(context_parts)
+        return "\n".join(f"- {m.content}" for m in memories)
     
     def learn_fact(self, fact: str, category: str = "general") -> None:
         """Learn and store a new fact as semantic memory."""
@@ -206,10 +203,24 @@ class MemoryAwareAgent:
             }
         )
     
+    def learn_facts(self, facts: List[Tuple[str, str]]) -> None:
+        """Learn several (fact, category) pairs with a single store write."""
+        learned_at = datetime.now().isoformat()
+        self.memory_manager.add_memories([
+            {
+                "content": fact,
+                "memory_type": MemoryType.SEMANTIC,
+                "agent_id": self.agent_id,
+                "metadata": {
+                    "category": category,
+                    "learned_at": learned_at
+                }
+            }
+            for fact, category in facts
+        ])
+    
     def get_timeline(self, hours: int = 24) -> List[str]:
         """Get recent timeline of activities."""
-        from datetime import timedelta
-        
         end_time = datetime.now()
         start_time = end_time - timedelta(hours=hours)
         
@@ -228,21 +239,16 @@ class MemoryAwareAgent:
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory statistics for this agent."""
-        # Get counts by memory type
-        episodic_memories = self.memory_manager.get_episodic_memories(
+        # Counted by the store; semantic memories are shared across agents
+        episodic_count = self.memory_manager.count_memories(
             agent_id=self.agent_id,
-            limit=1000  # Large limit to get all
-        )
-        # Get all semantic memories (no agent_id filter)
-        semantic_memories = self.memory_manager.search_memory(
-            query="",
-            memory_type=MemoryType.SEMANTIC,
-            limit=1000
+            memory_type=MemoryType.EPISODIC
         )
+        semantic_count = self.memory_manager.count_memories(memory_type=MemoryType.SEMANTIC)
         return {
             "agent_id": self.agent_id,
             "session_id": self.session_id,
-            "episodic_memories": len(episodic_memories),
-            "semantic_memories": len(semantic_memories),
-            "total_memories": len(episodic_memories) + len(semantic_memories)
+            "episodic_memories": episodic_count,
+            "semantic_memories": semantic_count,
+            "total_memories": episodic_count + semantic_count
         } 
\ No newline at end of file
@@ -6,7 +6,6 @@ LangChain chain and agent execution.
 """
 
 from typing import Dict, List, Any, Optional, Union
-from datetime import datetime
 
 from langchain.callbacks.base import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
@@ -15,6 +14,7 @@ from langchain_core.messages import BaseMessage
 
 from ...memory import MemoryManager
 from ...models import MemoryType
+from ...utils.time_utils import new_session_id
 
 
 class MemoryCallbackHandler(BaseCallbackHandler):
@@ -48,7 +48,7 @@ class MemoryCallbackHandler(BaseCallbackHandler):
         super().__init__()
         self.memory_manager = memory_manager
         self.agent_id = agent_id
-        self.session_id = session_id or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.session_id = session_id or new_session_id()
         self.store_llm_inputs = store_llm_inputs
         self.store_llm_outputs = store_llm_outputs
         self.store_agent_actions = store_agent_actions
@@ -5,8 +5,8 @@ Provides a LangChain chain that automatically stores and retrieves memories
 during chain execution.
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime, timedelta
 
 from langchain.chains.base import Chain
 from langchain_core.language_models import BaseLanguageModel
@@ -15,6 +15,7 @@ from langchain_core.runnables import RunnableConfig
 
 from ...memory import MemoryManager
 from ...models import MemoryType
+from ...utils.time_utils import new_session_id
 
 
 class MemoryChain(Chain):
@@ -34,6 +35,7 @@ class MemoryChain(Chain):
     store_intermediate: bool = False
     retrieve_memories: bool = True
     memory_limit: int = 5
+    hybrid_search: bool = False
     
     @property
     def input_keys(self) -> List[str]:
@@ -53,7 +55,7 @@ class MemoryChain(Chain):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.session_id:
-            self.session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            self.session_id = new_session_id()
     
     def invoke(
         self,
@@ -67,10 +69,9 @@ class MemoryChain(Chain):
         
         # Retrieve relevant memories if enabled
         if self.retrieve_memories:
-            relevant_memories = self.memory_manager.search_memory(
-                query=user_input,
-                limit=self.memory_limit
-            )
+            search = (self.memory_manager.search_hybrid if self.hybrid_search
+                      else self.memory_manager.search_memory)
+            relevant_memories = search(query=user_input, limit=self.memory_limit)
             memories_used = [m.content for m in relevant_memories]
         
         # Build enhanced input with memory context
@@ -152,10 +153,24 @@ Please provide a helpful response that takes into account the past context when
             }
         )
     
+    def learn_facts(self, facts: List[Tuple[str, str]]) -> None:
+        """Learn several (fact, category) pairs with a single store write."""
+        learned_at = datetime.now().isoformat()
+        self.memory_manager.add_memories([
+            {
+                "content": fact,
+                "memory_type": MemoryType.SEMANTIC,
+                "agent_id": self.agent_id,
+                "metadata": {
+                    "category": category,
+                    "learned_at": learned_at
+                }
+            }
+            for fact, category in facts
+        ])
+    
     def get_timeline(self, hours: int = 24) -> List[str]:
         """Get recent timeline of activities."""
-        from datetime import timedelta
-        
         end_time = datetime.now()
         start_time = end_time - timedelta(hours=hours)
         
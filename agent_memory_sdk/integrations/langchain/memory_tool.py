@@ -6,13 +6,14 @@ for storing and retrieving memories.
 """
 
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from langchain_core.tools import BaseTool
 from langchain_core.output_parsers import BaseOutputParser
 
 from ...memory import MemoryManager
 from ...models import MemoryType
+from ...utils.time_utils import new_session_id
 
 
 class MemoryTool(BaseTool):
@@ -39,7 +40,7 @@ class MemoryTool(BaseTool):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.session_id:
-            self.session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            self.session_id = new_session_id()
     
     def _run(self, query: str) -> str:
         """
@@ -123,8 +124,6 @@ class MemoryTool(BaseTool):
             except ValueError:
                 hours = 24
             
-            from datetime import timedelta
-            
             end_time = datetime.now()
             start_time = end_time - timedelta(hours=hours)
             
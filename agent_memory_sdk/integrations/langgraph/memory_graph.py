@@ -4,8 +4,9 @@ Memory Graph for LangGraph Integration
 Provides a complete memory-aware LangGraph workflow wrapper.
 """
 
+import asyncio
 from typing import Dict, List, Any, Optional, Union, Callable
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
@@ -13,6 +14,7 @@ from langgraph.checkpoint.memory import MemorySaver
 
 from ...memory import MemoryManager
 from ...models import MemoryType
+from ...utils.time_utils import new_session_id
 from .memory_state import MemoryState, create_memory_state
 from .memory_node import MemoryNode, create_memory_tool_node
 
@@ -43,7 +45,7 @@ class MemoryGraph:
         """
         self.memory_manager = memory_manager
         self.agent_id = agent_id
-        self.session_id = session_id or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.session_id = session_id or new_session_id()
         self.checkpoint_dir = checkpoint_dir
         
         # Create memory state class
@@ -164,6 +166,54 @@ class MemoryGraph:
         
         return result
     
+    async def arun(
+        self,
+        input_data: Dict[str, Any],
+        config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the memory-aware graph asynchronously.
+        
+        Same as run(), but awaits the graph with ainvoke so other runs can
+        proceed while this one waits on LLM or tool calls.
+        
+        Args:
+            input_data: Input data for the graph
+            config: Optional configuration
+            
+        Returns:
+            Graph execution result
+        """
+        if not self.compiled_graph:
+            self.compile_graph()
+        
+        # Memory reads and writes are local and quick; only the graph is awaited
+        enhanced_input = self._enhance_input_with_memory(input_data)
+        result = await self.compiled_graph.ainvoke(enhanced_input, config=config)
+        self._store_execution_memory(input_data, result)
+        
+        return result
+    
+    async def arun_many(
+        self,
+        inputs: List[Dict[str, Any]],
+        config: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the memory-aware graph on several independent inputs concurrently.
+        
+        The runs overlap, so an input cannot rely on memories stored by
+        another input in the same call.
+        
+        Args:
+            inputs: Input data for each run
+            config: Optional configuration shared by all runs
+            
+        Returns:
+            Graph execution results, in input order
+        """
+        return list(await asyncio.gather(*(self.arun(input_data, config=config) for input_data in inputs)))
+    
     def _enhance_input_with_memory(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Enhance input with relevant memory context."""
         # Search for relevant memories
@@ -238,23 +288,19 @@ class MemoryGraph:
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory statistics for this graph."""
-        episodic_memories = self.memory_manager.get_episodic_memories(
+        # Counted by the store; semantic memories are shared across agents
+        episodic_count = self.memory_manager.count_memories(
             agent_id=self.agent_id,
-            limit=1000
-        )
-        
-        semantic_memories = self.memory_manager.search_memory(
-            query="",
-            memory_type=MemoryType.SEMANTIC,
-            limit=1000
+            memory_type=MemoryType.EPISODIC
         )
+        semantic_count = self.memory_manager.count_memories(memory_type=MemoryType.SEMANTIC)
         
         return {
             "agent_id": self.agent_id,
             "session_id": self.session_id,
-            "episodic_memories": len(episodic_memories),
-            "semantic_memories": len(semantic_memories),
-            "total_memories": len(episodic_memories) + len(semantic_memories)
+            "episodic_memories": episodic_count,
+            "semantic_memories": semantic_count,
+            "total_memories": episodic_count + semantic_count
         }
     
     def search_memories(self, query: str, limit: int = 5) -> List[str]:
@@ -264,8 +310,6 @@ class MemoryGraph:
     
     def get_timeline(self, hours: int = 24) -> List[str]:
         """Get timeline of recent activities."""
-        from datetime import timedelta
-        
         end_time = datetime.now()
         start_time = end_time - timedelta(hours=hours)
         
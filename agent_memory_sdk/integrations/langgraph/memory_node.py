@@ -5,7 +5,7 @@ Provides memory operations as a LangGraph node that can be added to workflows.
 """
 
 from typing import Dict, List, Any, Optional, Union
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
@@ -13,6 +13,7 @@ from langchain_core.tools import tool
 
 from ...memory import MemoryManager
 from ...models import MemoryType
+from ...utils.time_utils import new_session_id
 
 
 class MemoryNode:
@@ -39,7 +40,7 @@ class MemoryNode:
         """
         self.memory_manager = memory_manager
         self.agent_id = agent_id
-        self.session_id = session_id or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.session_id = session_id or new_session_id()
     
     def __call__(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -114,7 +115,6 @@ class MemoryNode:
         """Get timeline of recent activities."""
         hours = memory_op.get("hours", 24)
         
-        from datetime import timedelta
         end_time = datetime.now()
         start_time = end_time - timedelta(hours=hours)
         
@@ -238,8 +238,6 @@ def create_memory_tool_node(
     def get_timeline(hours: int = 24) -> str:
         """Get timeline of recent activities."""
         try:
-            from datetime import timedelta
-            
             end_time = datetime.now()
             start_time = end_time - timedelta(hours=hours)
             
@@ -5,13 +5,14 @@ Provides memory state management for LangGraph workflows.
 """
 
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from langgraph.graph import StateGraph
 from langgraph.checkpoint.memory import MemorySaver
 
 from ...memory import MemoryManager
 from ...models import MemoryType
+from ...utils.time_utils import new_session_id
 
 
 class MemoryState:
@@ -40,7 +41,7 @@ class MemoryState:
         """
         self.memory_manager = memory_manager
         self.agent_id = agent_id
-        self.session_id = session_id or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.session_id = session_id or new_session_id()
         
         # Initialize other state fields
         for key, value in kwargs.items():
@@ -75,8 +76,6 @@ class MemoryState:
         hours: int = 24
     ) -> List[str]:
         """Get recent timeline of activities."""
-        from datetime import timedelta
-        
         end_time = datetime.now()
         start_time = end_time - timedelta(hours=hours)
         
@@ -105,23 +104,19 @@ class MemoryState:
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory statistics for this state."""
-        episodic_memories = self.memory_manager.get_episodic_memories(
+        # Counted by the store; semantic memories are shared across agents
+        episodic_count = self.memory_manager.count_memories(
             agent_id=self.agent_id,
-            limit=1000
-        )
-        
-        semantic_memories = self.memory_manager.search_memory(
-            query="",
-            memory_type=MemoryType.SEMANTIC,
-            limit=1000
+            memory_type=MemoryType.EPISODIC
         )
+        semantic_count = self.memory_manager.count_memories(memory_type=MemoryType.SEMANTIC)
         
         return {
             "agent_id": self.agent_id,
             "session_id": self.session_id,
-            "episodic_memories": len(episodic_memories),
-            "semantic_memories": len(semantic_memories),
-            "total_memories": len(episodic_memories) + len(semantic_memories)
+            "episodic_memories": episodic_count,
+            "semantic_memories": semantic_count,
+            "total_memories": episodic_count + semantic_count
         }
 
 
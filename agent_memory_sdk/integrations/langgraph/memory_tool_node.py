@@ -5,13 +5,14 @@ Provides a simple wrapper for memory tools in LangGraph workflows.
 """
 
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from langgraph.prebuilt import ToolNode
 from langchain_core.tools import tool
 
 from ...memory import MemoryManager
 from ...models import MemoryType
+from ...utils.time_utils import new_session_id
 
 
 class MemoryToolNode:
@@ -38,7 +39,7 @@ class MemoryToolNode:
         """
         self.memory_manager = memory_manager
         self.agent_id = agent_id
-        self.session_id = session_id or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.session_id = session_id or new_session_id()
         
         self._tools = self._create_tools()
         self.tool_node = ToolNode(self._tools)
@@ -81,8 +82,6 @@ class MemoryToolNode:
         def get_timeline(hours: int = 24) -> str:
             """Get timeline of recent activities."""
             try:
-                from datetime import timedelta
-                
                 end_time = datetime.now()
                 start_time = end_time - timedelta(hours=hours)
                 
@@ -121,21 +120,17 @@ class MemoryToolNode:
         def get_memory_stats() -> str:
             """Get memory statistics."""
             try:
-                episodic_memories = self.memory_manager.get_episodic_memories(
+                # Counted by the store; semantic memories are shared across agents
+                episodic_count = self.memory_manager.count_memories(
                     agent_id=self.agent_id,
-                    limit=1000
-                )
-                
-                semantic_memories = self.memory_manager.search_memory(
-                    query="",
-                    memory_type=MemoryType.SEMANTIC,
-                    limit=1000
+                    memory_type=MemoryType.EPISODIC
                 )
+                semantic_count = self.memory_manager.count_memories(memory_type=MemoryType.SEMANTIC)
                 
                 stats = {
-                    "episodic_memories": len(episodic_memories),
-                    "semantic_memories": len(semantic_memories),
-                    "total_memories": len(episodic_memories) + len(semantic_memories)
+                    "episodic_memories": episodic_count,
+                    "semantic_memories": semantic_count,
+                    "total_memories": episodic_count + semantic_count
                 }
                 
                 return f"Memory Statistics:\n" + "\n".join([
@@ -5,9 +5,11 @@ Provides MemoryManager for managing episodic, semantic, and temporal memory acro
 """
 
 import os
+from collections import OrderedDict
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import sqlite3
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 # Load environment variables from .env file
 try:
@@ -20,30 +22,56 @@ except ImportError:
 from .models import MemoryEntry, MemoryType
 from .store.store_factory import StoreFactory
 from .store.sqlite_store import SQLiteStore
-from .store.pinecone_store import PineconeStore
 from .utils.embedding_utils import generate_embedding
+from .utils.vector_index import create_vector_index
+
+# Rank offset for reciprocal rank fusion in search_hybrid
+_RRF_K = 60
+
+
+@lru_cache(maxsize=512)
+def _query_embedding(query: str) -> Tuple[float, ...]:
+    """Embed a search query, reusing the embedding for repeated queries"""
+    # A tuple, so callers cannot mutate the cached embedding
+    return tuple(generate_embedding(query))
 
 
 class MemoryManager:
     """Main memory management class for Agent Memory OS"""
     
-    def __init__(self, store_type: Optional[str] = None, **store_kwargs):
+    def __init__(self, store_type: Optional[str] = None, vector_index: bool = False,
+                 quantize_vectors: bool = False, search_cache_size: int = 0, **store_kwargs):
         """
         Initialize memory manager
         
         Args:
             store_type: Type of store ('sqlite', 'pinecone', or None for auto-detect)
+            vector_index: Keep an in-memory nearest-neighbour index of embeddings
+                for search_similar (FAISS HNSW if installed, else brute force)
+            quantize_vectors: Hold the vector index as int8 codes, cutting its
+                memory (and the bytes scanned per search) by about 4x
+            search_cache_size: Number of recent search results to keep (0 disables).
+                The cache is cleared whenever this manager writes, so only enable
+                it when no other process writes to the same store.
             **store_kwargs: Additional arguments for the store (e.g., db_path for SQLite)
         """
         self._store = StoreFactory.create_store(store_type, **store_kwargs)
         # Set store type based on the actual store created
         if isinstance(self._store, SQLiteStore):
             self.store_type = "sqlite"
-        elif isinstance(self._store, PineconeStore):
+        elif store_type is not None and store_type.lower() == "pinecone":
             self.store_type = "pinecone"
         else:
             self.store_type = "unknown"
         
+        self._vector_index = None
+        if vector_index:
+            self._vector_index = create_vector_index(quantize=quantize_vectors)
+            self._index_memories(self._store.get_all_memories())
+        
+        self._search_cache_size = search_cache_size
+        self._search_cache: "OrderedDict[Tuple, List[MemoryEntry]]" = OrderedDict()
+        
     def add_memory(self, content: str, memory_type: MemoryType = MemoryType.EPISODIC,
                    agent_id: Optional[str] = None, session_id: Optional[str] = None,
                    metadata: Optional[Dict[str, Any]] = None,
@@ -62,6 +90,42 @@ class MemoryManager:
         Returns:
             Created MemoryEntry
         """
+        memory = self._build_memory(content, memory_type, agent_id, session_id,
+                                    metadata, importance, tags)
+        # Store in backend
+        success = self._store.save_memory(memory)
+        if not success:
+            print(f"Warning: Could not save memory to store: {memory.id}")
+        else:
+            self._index_memories([memory])
+            self._search_cache.clear()
+        return memory
+    
+    def add_memories(self, entries: List[Dict[str, Any]]) -> List[MemoryEntry]:
+        """
+        Add several memory entries with a single store write
+        
+        Args:
+            entries: Keyword arguments for add_memory, one dict per memory
+            
+        Returns:
+            List of created MemoryEntry objects
+        """
+        memories = [self._build_memory(**entry) for entry in entries]
+        success = self._store.save_memories(memories)
+        if not success:
+            print(f"Warning: Could not save {len(memories)} memories to store")
+        else:
+            self._index_memories(memories)
+            self._search_cache.clear()
+        return memories
+    
+    def _build_memory(self, content: str, memory_type: MemoryType = MemoryType.EPISODIC,
+                      agent_id: Optional[str] = None, session_id: Optional[str] = None,
+                      metadata: Optional[Dict[str, Any]] = None,
+                      importance: Optional[float] = None,
+                      tags: Optional[list] = None) -> MemoryEntry:
+        """Create a MemoryEntry with its embedding, without storing it"""
         memory = MemoryEntry(
             content=content,
             memory_type=memory_type,
@@ -78,14 +142,23 @@ class MemoryManager:
             memory.embedding = generate_embedding(content)
         except Exception as e:
             print(f"Warning: Could not generate embedding: {e}")
-        # Store in backend
-        success = self._store.save_memory(memory)
-        if not success:
-            print(f"Warning: Could not save memory to store: {memory.id}")
         return memory
     
+    def _index_memories(self, memories: List[MemoryEntry]):
+        """Add the embeddings of memories to the vector index, if enabled"""
+        if self._vector_index is None or not memories:
+            return
+        # Re-embed entries stored without an embedding or by an older model
+        dimension = self._vector_index.dimension
+        embeddings = [
+            m.embedding if m.embedding and len(m.embedding) == dimension
+            else generate_embedding(m.content)
+            for m in memories
+        ]
+        self._vector_index.add([m.id for m in memories], embeddings)
+    
     def search_memory(self, query: str, memory_type: Optional[MemoryType] = None,
-                     limit: int = 10) -> List[MemoryEntry]:
+                     limit: int = 10, agent_id: Optional[str] = None) -> List[MemoryEntry]:
         """
         Search for memories by semantic similarity
         
@@ -93,15 +166,154 @@ class MemoryManager:
             query: Search query
             memory_type: Filter by memory type
             limit: Maximum number of results
+            agent_id: Only return memories of this agent (filtered by the store)
             
         Returns:
             List of relevant MemoryEntry objects
         """
-        return self._store.search_memories(
-            query=query,
-            memory_type=memory_type,
-            limit=limit
-        )
+        key = ("text", query, memory_type, limit, agent_id)
+        results = self._cached_search(key)
+        if results is None:
+            results = self._store.search_memories(
+                query=query,
+                memory_type=memory_type,
+                agent_id=agent_id,
+                limit=limit
+            )
+            self._cache_search(key, results)
+        return list(results)
+    
+    def search_memory_batch(self, queries: List[str], memory_type: Optional[MemoryType] = None,
+                            limit: int = 10, agent_id: Optional[str] = None) -> List[List[MemoryEntry]]:
+        """
+        Run several searches with one store call
+        
+        Equivalent to calling search_memory for each query, but queries that
+        are not already cached are sent to the store together.
+        
+        Args:
+            queries: Search queries
+            memory_type: Filter by memory type
+            limit: Maximum number of results per query
+            agent_id: Only return memories of this agent (filtered by the store)
+            
+        Returns:
+            One list of relevant MemoryEntry objects per query, in query order
+        """
+        keys = [("text", query, memory_type, limit, agent_id) for query in queries]
+        results = [self._cached_search(key) for key in keys]
+        misses = [i for i, cached in enumerate(results) if cached is None]
+        if misses:
+            fetched = self._store.search_memories_batch(
+                [queries[i] for i in misses],
+                memory_type=memory_type,
+                agent_id=agent_id,
+                limit=limit
+            )
+            for i, found in zip(misses, fetched):
+                results[i] = found
+                self._cache_search(keys[i], found)
+        return [list(found) for found in results]
+    
+    def search_similar(self, query: str, memory_type: Optional[MemoryType] = None,
+                       limit: int = 10) -> List[MemoryEntry]:
+        """
+        Search for memories by embedding similarity using the vector index
+        
+        Falls back to search_memory when the manager was created without
+        vector_index=True.
+        
+        Args:
+            query: Search query
+            memory_type: Filter by memory type
+            limit: Maximum number of results
+            
+        Returns:
+            List of MemoryEntry objects, most similar first
+        """
+        if self._vector_index is None:
+            return self.search_memory(query, memory_type=memory_type, limit=limit)
+        
+        # Embeddings are derived from the query text, so the text is the cache key
+        key = ("similar", query, memory_type, limit)
+        cached = self._cached_search(key)
+        if cached is not None:
+            return list(cached)
+        
+        # Over-fetch when filtering so the type filter can still fill the limit
+        k = limit if memory_type is None else limit * 4
+        hits = [memory_id for memory_id, _ in self._vector_index.search(_query_embedding(query), k)]
+        # One store round trip for all hits, then keep the similarity order
+        found = self._store.get_memories(hits)
+        results = []
+        for memory_id in hits:
+            memory = found.get(memory_id)
+            if memory is None or (memory_type is not None and memory.memory_type != memory_type):
+                continue
+            results.append(memory)
+            if len(results) == limit:
+                break
+        self._cache_search(key, results)
+        return list(results)
+    
+    def search_hybrid(self, query: str, memory_type: Optional[MemoryType] = None,
+                      limit: int = 10) -> List[MemoryEntry]:
+        """
+        Search for memories by combining keyword and embedding rankings
+        
+        Keyword matches come from the store's full-text index (BM25) when it
+        has one, otherwise from search_memory. Embedding matches come from
+        search_similar when the manager was created with vector_index=True.
+        The rankings are merged with reciprocal rank fusion, so a memory
+        ranked highly by either search scores well.
+        
+        Args:
+            query: Search query
+            memory_type: Filter by memory type
+            limit: Maximum number of results
+            
+        Returns:
+            List of MemoryEntry objects, best match first
+        """
+        key = ("hybrid", query, memory_type, limit)
+        cached = self._cached_search(key)
+        if cached is not None:
+            return list(cached)
+        
+        # Fetch deeper than the limit so fusion can promote lower-ranked hits
+        k = limit * 2
+        search_keywords = getattr(self._store, "search_keywords", None)
+        if search_keywords is not None:
+            rankings = [search_keywords(query, memory_type=memory_type, limit=k)]
+        else:
+            rankings = [self._store.search_memories(query=query, memory_type=memory_type, limit=k)]
+        if self._vector_index is not None:
+            rankings.append(self.search_similar(query, memory_type=memory_type, limit=k))
+        
+        scores: Dict[str, float] = {}
+        memories: Dict[str, MemoryEntry] = {}
+        for ranking in rankings:
+            for rank, memory in enumerate(ranking, 1):
+                scores[memory.id] = scores.get(memory.id, 0.0) + 1.0 / (_RRF_K + rank)
+                memories.setdefault(memory.id, memory)
+        results = [memories[memory_id] for memory_id in sorted(scores, key=scores.get, reverse=True)[:limit]]
+        self._cache_search(key, results)
+        return list(results)
+    
+    def _cached_search(self, key: Tuple) -> Optional[List[MemoryEntry]]:
+        """Return cached search results for key, marking them recently used"""
+        results = self._search_cache.get(key)
+        if results is not None:
+            self._search_cache.move_to_end(key)
+        return results
+    
+    def _cache_search(self, key: Tuple, results: List[MemoryEntry]):
+        """Remember search results, evicting the least recently used entry"""
+        if self._search_cache_size <= 0:
+            return
+        self._search_cache[key] = results
+        if len(self._search_cache) > self._search_cache_size:
+            self._search_cache.popitem(last=False)
     
     def get_episodic_memories(self, agent_id: Optional[str] = None,
                              session_id: Optional[str] = None,
@@ -124,6 +336,20 @@ class MemoryManager:
             limit=limit
         )
     
+    def count_memories(self, agent_id: Optional[str] = None,
+                       memory_type: Optional[MemoryType] = None) -> int:
+        """
+        Count stored memories without loading them
+        
+        Args:
+            agent_id: Filter by agent ID
+            memory_type: Filter by memory type
+            
+        Returns:
+            Number of matching memories
+        """
+        return self._store.count_memories(memory_type=memory_type, agent_id=agent_id)
+    
     def get_timeline(self, agent_id: Optional[str] = None,
                     start_time: Optional[datetime] = None,
                     end_time: Optional[datetime] = None,
@@ -147,6 +373,24 @@ class MemoryManager:
             limit=limit
         )
     
+    def iter_timeline(self, agent_id: Optional[str] = None,
+                      start_time: Optional[datetime] = None,
+                      end_time: Optional[datetime] = None,
+                      limit: int = 100) -> Iterator[MemoryEntry]:
+        """
+        Lazily walk the temporal timeline of memories
+        
+        Takes the same filters as get_timeline. Stores that can stream rows
+        (SQLite) yield them batch by batch; others return their full list.
+        
+        Yields:
+            MemoryEntry objects in chronological order
+        """
+        iter_timeline = getattr(self._store, "iter_timeline", None)
+        if iter_timeline is None:
+            return iter(self.get_timeline(agent_id, start_time, end_time, limit))
+        return iter_timeline(agent_id=agent_id, start_time=start_time, end_time=end_time, limit=limit)
+    
     def get_memory(self, memory_id: str) -> Optional[MemoryEntry]:
         """
         Get a specific memory by ID
@@ -168,6 +412,24 @@ class MemoryManager:
         """
         return self._store.search_memories(limit=10000)  # Large limit to get all
     
+    def iter_all_memories(self, limit: int = 10000) -> Iterator[MemoryEntry]:
+        """
+        Lazily walk all memories in the system, newest first
+        
+        Stores that can stream rows (SQLite) yield them batch by batch, so
+        only one batch is decoded at a time.
+        
+        Args:
+            limit: Maximum number of memories to yield
+            
+        Yields:
+            MemoryEntry objects
+        """
+        iter_search = getattr(self._store, "iter_search_memories", None)
+        if iter_search is None:
+            return iter(self._store.search_memories(limit=limit))
+        return iter_search(limit=limit)
+    
     def get_memories_by_agent(self, agent_id: str, limit: int = 50) -> List[MemoryEntry]:
         """
         Get all memories for a specific agent
@@ -218,6 +480,10 @@ class MemoryManager:
         
         # Save updated memory
         success = self._store.save_memory(memory)
+        if success:
+            self._search_cache.clear()
+            if 'content' in kwargs:
+                self._index_memories([memory])
         return memory if success else None
     
     def delete_memory(self, memory_id: str) -> bool:
@@ -230,10 +496,83 @@ class MemoryManager:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            with sqlite3.connect(self._store.db_path) as conn:
-                cursor = conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
-                return cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error deleting memory: {e}")
-            return False 
\ No newline at end of file
+        success = self._store.delete_memory(memory_id)
+        if success:
+            self._search_cache.clear()
+            if self._vector_index is not None:
+                self._vector_index.remove(memory_id)
+        return success
+    
+    def delete_memories(self, memory_ids: List[str]) -> int:
+        """
+        Delete several memories by ID with a single store call
+        
+        Args:
+            memory_ids: IDs of the memories to delete
+            
+        Returns:
+            Number of memories deleted
+        """
+        deleted = self._store.delete_memories(memory_ids)
+        if deleted:
+            self._search_cache.clear()
+            if self._vector_index is not None:
+                for memory_id in memory_ids:
+                    self._vector_index.remove(memory_id)
+        return deleted
+    
+    def transaction(self):
+        """
+        Group the store writes made inside a with-block into one transaction
+        
+        With SQLite, add/update/delete calls in the block commit together
+        when it exits. Other stores run the block unchanged. If the block
+        raises, the store rolls back, but the search cache and vector index
+        may still list the discarded memories until they are next rebuilt.
+        
+        Returns:
+            Context manager
+        """
+        transaction = getattr(self._store, "transaction", None)
+        return transaction() if transaction is not None else nullcontext()
+    
+    def bulk_load(self, force: bool = False):
+        """
+        Defer secondary index maintenance while loading many memories
+        
+        SQLite and PostgreSQL drop their secondary indexes on entry and
+        rebuild them once on exit. Stores holding more than 10000 memories
+        keep their indexes unless force is True. Other stores run the block
+        unchanged.
+        
+        Args:
+            force: Drop the indexes regardless of the store size
+            
+        Returns:
+            Context manager
+        """
+        bulk_load = getattr(self._store, "bulk_load", None)
+        return bulk_load(force=force) if bulk_load is not None else nullcontext()
+    
+    def flush(self):
+        """
+        Wait until queued writes are committed to the store
+        
+        Only stores created with write_behind=True queue writes; for other
+        stores this returns immediately. Raises the store's error if queued
+        writes that failed to commit still cannot be committed.
+        """
+        flush = getattr(self._store, "flush", None)
+        if flush is not None:
+            flush()
+    
+    def close(self):
+        """
+        Close the memory store
+        
+        Flushes pending writes; SQLite stores also refresh planner statistics
+        and PostgreSQL stores close their pooled connections.
+        """
+        close = getattr(self._store, "close", None)
+        if close is not None:
+            close()
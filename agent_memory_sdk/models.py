@@ -8,8 +8,12 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
+import sys
 import uuid
 
+# Slotted entries drop the per-instance __dict__; ``slots`` is only accepted on Python 3.10+
+_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class MemoryType(Enum):
     """Types of memory supported by the system"""
@@ -18,7 +22,7 @@ class MemoryType(Enum):
     TEMPORAL = "temporal"  # Time-based events
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class MemoryEntry:
     """Represents a single memory entry"""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
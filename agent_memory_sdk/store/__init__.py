@@ -5,8 +5,16 @@ Provides different storage implementations for memory persistence.
 """
 
 from .sqlite_store import SQLiteStore
-from .pinecone_store import PineconeStore
 from .base_store import BaseStore
 from .store_factory import StoreFactory
 
+
+def __getattr__(name):
+    """Import PineconeStore on first use, so the pinecone package stays optional"""
+    if name == "PineconeStore":
+        from .pinecone_store import PineconeStore
+        return PineconeStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["SQLiteStore", "PineconeStore", "BaseStore", "StoreFactory"] 
\ No newline at end of file
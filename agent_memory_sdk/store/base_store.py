@@ -27,6 +27,21 @@ class BaseStore(ABC):
         """
         pass
     
+    def save_memories(self, memories: List[MemoryEntry]) -> bool:
+        """
+        Save several memory entries to storage
+        
+        Backends that can write in a single round trip should override this.
+        
+        Args:
+            memories: MemoryEntry objects to save
+            
+        Returns:
+            True if every entry was saved, False otherwise
+        """
+        results = [self.save_memory(memory) for memory in memories]
+        return all(results)
+    
     @abstractmethod
     def get_memory(self, memory_id: str) -> Optional[MemoryEntry]:
         """
@@ -40,6 +55,25 @@ class BaseStore(ABC):
         """
         pass
     
+    def get_memories(self, memory_ids: List[str]) -> Dict[str, MemoryEntry]:
+        """
+        Retrieve several memory entries by ID
+        
+        Backends that can fetch several rows in one round trip should override this.
+        
+        Args:
+            memory_ids: IDs of the memories to retrieve
+            
+        Returns:
+            Dict mapping each found ID to its MemoryEntry (missing IDs are left out)
+        """
+        memories = {}
+        for memory_id in memory_ids:
+            memory = self.get_memory(memory_id)
+            if memory is not None:
+                memories[memory_id] = memory
+        return memories
+    
     @abstractmethod
     def search_memories(self, query: str = None, memory_type: Optional[MemoryType] = None,
                        agent_id: Optional[str] = None, session_id: Optional[str] = None,
@@ -59,6 +93,44 @@ class BaseStore(ABC):
         """
         pass
     
+    def search_memories_batch(self, queries: List[str], memory_type: Optional[MemoryType] = None,
+                              agent_id: Optional[str] = None,
+                              limit: int = 50) -> List[List[MemoryEntry]]:
+        """
+        Run several searches that share the same filters
+        
+        Backends that can answer several queries in one round trip should override this.
+        
+        Args:
+            queries: Search queries
+            memory_type: Filter by memory type
+            agent_id: Filter by agent ID
+            limit: Maximum number of results per query
+            
+        Returns:
+            One list of matching MemoryEntry objects per query, in query order
+        """
+        return [
+            self.search_memories(query=query, memory_type=memory_type, agent_id=agent_id, limit=limit)
+            for query in queries
+        ]
+    
+    def count_memories(self, memory_type: Optional[MemoryType] = None,
+                       agent_id: Optional[str] = None) -> int:
+        """
+        Count memories matching the filters
+        
+        Backends that can count without loading the rows should override this.
+        
+        Args:
+            memory_type: Filter by memory type
+            agent_id: Filter by agent ID
+            
+        Returns:
+            Number of matching memories (capped at 10000 by this default)
+        """
+        return len(self.search_memories(memory_type=memory_type, agent_id=agent_id, limit=10000))
+    
     @abstractmethod
     def get_timeline(self, agent_id: Optional[str] = None,
                     start_time: Optional[datetime] = None,
@@ -91,6 +163,20 @@ class BaseStore(ABC):
         """
         pass
     
+    def delete_memories(self, memory_ids: List[str]) -> int:
+        """
+        Delete several memories by ID
+        
+        Backends that can delete in a single round trip should override this.
+        
+        Args:
+            memory_ids: IDs of the memories to delete
+            
+        Returns:
+            Number of memories deleted
+        """
+        return sum(1 for memory_id in memory_ids if self.delete_memory(memory_id))
+    
     @abstractmethod
     def get_all_memories(self, limit: int = 10000) -> List[MemoryEntry]:
         """
@@ -2,6 +2,7 @@ import os
 import json
 import time
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 import uuid
 
@@ -12,6 +13,31 @@ from ..utils.embedding_utils import generate_embedding
 from .base_store import BaseStore
 
 
+@lru_cache(maxsize=None)
+def _get_pinecone_client(api_key: str):
+    """Create one Pinecone client per API key, shared by every index and store"""
+    # The client owns the HTTP connection pool, so reusing it avoids new TLS handshakes
+    return pinecone.Pinecone(api_key=api_key)
+
+
+@lru_cache(maxsize=None)
+def _get_index(api_key: str, index_name: str, dimension: int, metric: str):
+    """Connect to a Pinecone index, creating it if needed, once per process"""
+    client = _get_pinecone_client(api_key)
+
+    if index_name not in client.list_indexes().names():
+        client.create_index(
+            name=index_name,
+            dimension=dimension,
+            metric=metric,
+            spec=pinecone.ServerlessSpec(cloud="aws", region="us-east-1")
+        )
+        while not client.describe_index(index_name).status["ready"]:
+            time.sleep(1)
+
+    return client.Index(index_name)
+
+
 class PineconeStore(BaseStore):
     def __init__(self, api_key: str = None, environment: str = None,
                  index_name: str = "agent-memory-os", dimension: int = 1024,
@@ -25,23 +51,8 @@ class PineconeStore(BaseStore):
         if not self.api_key:
             raise ValueError("Pinecone API key is required. Set PINECONE_API_KEY environment variable or pass api_key parameter.")
 
-        pinecone.init(api_key=self.api_key, environment=self.environment)
-
-        existing_index_names = pinecone.list_indexes()
-        if self.index_name not in existing_index_names:
-            pinecone.create_index(
-                name=self.index_name,
-                dimension=self.dimension,
-                metric=self.metric,
-                spec=pinecone.ServerlessSpec(cloud="aws", region="us-east-1")
-            )
-            while True:
-                status = pinecone.describe_index(self.index_name).status
-                if status.get("ready"):
-                    break
-                time.sleep(1)
-
-        self.index = pinecone.Index(self.index_name)
+        # Managers for the same index share one connection
+        self.index = _get_index(self.api_key, self.index_name, self.dimension, self.metric)
 
     def upsert(self, vectors: List[dict]):
         self.index.upsert(vectors)
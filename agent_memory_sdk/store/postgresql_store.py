@@ -4,15 +4,19 @@ PostgreSQL store backend for Agent Memory OS
 Provides persistent storage using PostgreSQL database with full CRUD operations.
 """
 
+import io
 import json
 import os
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 import uuid
+import weakref
 
 try:
     import psycopg2
     from psycopg2.extras import RealDictCursor
+    from psycopg2.pool import ThreadedConnectionPool
     POSTGRESQL_AVAILABLE = True
 except ImportError:
     POSTGRESQL_AVAILABLE = False
@@ -22,16 +26,93 @@ from ..models import MemoryEntry, MemoryType
 from ..utils.embedding_utils import generate_embedding
 from .base_store import BaseStore
 
+# Columns written by save_memory and save_memories, in parameter/COPY order
+_WRITE_COLUMNS = (
+    "id, content, memory_type, agent_id, session_id, timestamp, "
+    "importance, tags, metadata, embedding, last_accessed"
+)
+
+# Columns read back into MemoryEntry; SELECT * would also ship content_tsv
+_SELECT_COLUMNS = _WRITE_COLUMNS
+
+# Compact JSON for the tags, metadata and embedding columns; an embedding
+# is about 1KB smaller on the wire without the spaces after commas
+_JSON_SEPARATORS = (",", ":")
+
+# Upsert clause shared by the single-row INSERT and the COPY staging INSERT
+_ON_CONFLICT_UPDATE = """
+ON CONFLICT (id) DO UPDATE SET
+    content = EXCLUDED.content,
+    memory_type = EXCLUDED.memory_type,
+    agent_id = EXCLUDED.agent_id,
+    session_id = EXCLUDED.session_id,
+    timestamp = EXCLUDED.timestamp,
+    importance = EXCLUDED.importance,
+    tags = EXCLUDED.tags,
+    metadata = EXCLUDED.metadata,
+    embedding = EXCLUDED.embedding,
+    last_accessed = EXCLUDED.last_accessed,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+# Non-key indexes on memories, by name; bulk_load() drops and rebuilds these
+_SECONDARY_INDEXES = {
+    "idx_memories_agent_id": "CREATE INDEX IF NOT EXISTS idx_memories_agent_id ON memories(agent_id)",
+    "idx_memories_session_id": "CREATE INDEX IF NOT EXISTS idx_memories_session_id ON memories(session_id)",
+    "idx_memories_type_ts_us": "CREATE INDEX IF NOT EXISTS idx_memories_type_ts_us ON memories(memory_type, ts_us)",
+    "idx_memories_ts_us": "CREATE INDEX IF NOT EXISTS idx_memories_ts_us ON memories(ts_us)",
+    "idx_memories_agent_ts_us": "CREATE INDEX IF NOT EXISTS idx_memories_agent_ts_us ON memories(agent_id, ts_us)",
+    "idx_memories_importance": "CREATE INDEX IF NOT EXISTS idx_memories_importance ON memories(importance)",
+    "idx_memories_content_tsv": "CREATE INDEX IF NOT EXISTS idx_memories_content_tsv ON memories USING gin(content_tsv)",
+    "idx_memories_tags": "CREATE INDEX IF NOT EXISTS idx_memories_tags ON memories USING gin(tags jsonb_path_ops)",
+}
+
+# Text search without filters, the most repeated query shape; prepared once
+# per pooled connection so later calls skip parsing and planning
+_SEARCH_TEXT_PREPARE = f"""
+PREPARE search_text (text, int) AS
+SELECT {_SELECT_COLUMNS}, ts_rank(content_tsv, websearch_to_tsquery('english', $1)) AS rank
+FROM memories
+WHERE content_tsv @@ websearch_to_tsquery('english', $1)
+ORDER BY rank DESC, ts_us DESC
+LIMIT $2
+"""
+
+# A timestamp parameter converted to ts_us, so range filters use the index
+_TS_US_PARAM = "(EXTRACT(EPOCH FROM %s::timestamp) * 1000000)::bigint"
+
+# Default bounds of each store's connection pool
+_POOL_MIN_CONNECTIONS = 1
+_POOL_MAX_CONNECTIONS = 10
+
+# bulk_load() keeps the indexes of tables larger than this unless forced
+_BULK_LOAD_MAX_ROWS = 10000
+
+
+def _copy_field(value: Any) -> str:
+    """Encode one value for COPY ... FROM STDIN text format"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
 
 class PostgreSQLStore(BaseStore):
     """PostgreSQL-based storage backend for memory entries"""
     
-    def __init__(self, connection_string: str = None, **kwargs):
+    def __init__(self, connection_string: str = None,
+                 pool_min_connections: int = _POOL_MIN_CONNECTIONS,
+                 pool_max_connections: int = _POOL_MAX_CONNECTIONS, **kwargs):
         """
         Initialize PostgreSQL store
         
         Args:
             connection_string: PostgreSQL connection string
+            pool_min_connections: Connections opened up front and kept open
+            pool_max_connections: Most connections open at once; each process
+                using the store holds up to this many
             **kwargs: Additional connection parameters (host, port, database, user, password)
         """
         if not POSTGRESQL_AVAILABLE:
@@ -50,12 +131,36 @@ class PostgreSQLStore(BaseStore):
             
             self.connection_string = f"postgresql://{user}:{password}@{host}:{port}/{database}"
         
+        # Reuse connections across calls instead of reconnecting each time
+        self._pool = ThreadedConnectionPool(
+            pool_min_connections, pool_max_connections, self.connection_string
+        )
+        # Pooled connections that already hold the search_text statement
+        self._prepared = weakref.WeakSet()
+        
         # Initialize database
         self._ensure_table_exists()
     
-    def _get_connection(self):
-        """Get a database connection"""
-        return psycopg2.connect(self.connection_string)
+    @contextmanager
+    def _get_connection(self) -> Iterator["psycopg2.extensions.connection"]:
+        """Borrow a pooled connection, committed or rolled back on exit"""
+        conn = self._pool.getconn()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.putconn(conn)
+    
+    def _prepare_search(self, conn):
+        """PREPARE the unfiltered text search on a connection that lacks it"""
+        if conn not in self._prepared:
+            with conn.cursor() as cursor:
+                cursor.execute(_SEARCH_TEXT_PREPARE)
+            self._prepared.add(conn)
+    
+    def close(self):
+        """Close all pooled connections"""
+        self._pool.closeall()
     
     def _ensure_table_exists(self):
         """Create the memories table if it doesn't exist"""
@@ -76,20 +181,61 @@ class PostgreSQLStore(BaseStore):
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
         
-        -- Create indexes for better performance
-        CREATE INDEX IF NOT EXISTS idx_memories_agent_id ON memories(agent_id);
-        CREATE INDEX IF NOT EXISTS idx_memories_session_id ON memories(session_id);
-        CREATE INDEX IF NOT EXISTS idx_memories_memory_type ON memories(memory_type);
-        CREATE INDEX IF NOT EXISTS idx_memories_timestamp ON memories(timestamp);
-        CREATE INDEX IF NOT EXISTS idx_memories_importance ON memories(importance);
-        CREATE INDEX IF NOT EXISTS idx_memories_content_gin ON memories USING gin(to_tsvector('english', content));
+        -- Integer microsecond copy of timestamp, kept in step by the server;
+        -- timelines and searches sort on it, like the SQLite store's ts_us
+        ALTER TABLE memories ADD COLUMN IF NOT EXISTS ts_us BIGINT
+            GENERATED ALWAYS AS ((EXTRACT(EPOCH FROM timestamp) * 1000000)::bigint) STORED;
+        
+        -- Full-text vector of content, stored so searches neither parse
+        -- content again for matching nor for ranking
+        ALTER TABLE memories ADD COLUMN IF NOT EXISTS content_tsv tsvector
+            GENERATED ALWAYS AS (to_tsvector('english', coalesce(content, ''))) STORED;
+        
+        -- Superseded by the ts_us and content_tsv indexes
+        DROP INDEX IF EXISTS idx_memories_timestamp;
+        DROP INDEX IF EXISTS idx_memories_agent_timestamp;
+        DROP INDEX IF EXISTS idx_memories_memory_type;
+        DROP INDEX IF EXISTS idx_memories_content_gin;
         """
         
         with self._get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(create_table_sql)
+                # Create indexes for better performance
+                for sql in _SECONDARY_INDEXES.values():
+                    cursor.execute(sql)
                 conn.commit()
     
+    @contextmanager
+    def bulk_load(self, force: bool = False) -> Iterator[None]:
+        """
+        Drop the non-key indexes while loading many rows, then rebuild them
+        
+        Tables with more than 10000 rows keep their indexes unless force is
+        True, since rebuilding them can cost more than the load saves.
+        
+        Args:
+            force: Drop the indexes regardless of the table size
+        """
+        with self._get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT COUNT(*) FROM memories")
+                drop = force or cursor.fetchone()[0] <= _BULK_LOAD_MAX_ROWS
+                if drop:
+                    for name in _SECONDARY_INDEXES:
+                        cursor.execute(f"DROP INDEX IF EXISTS {name}")
+                conn.commit()
+        try:
+            yield
+        finally:
+            if drop:
+                with self._get_connection() as conn:
+                    with conn.cursor() as cursor:
+                        for sql in _SECONDARY_INDEXES.values():
+                            cursor.execute(sql)
+                        cursor.execute("ANALYZE memories")
+                        conn.commit()
+    
     def save_memory(self, memory: MemoryEntry) -> bool:
         """
         Save a memory entry to PostgreSQL
@@ -105,46 +251,81 @@ class PostgreSQLStore(BaseStore):
             if not memory.embedding:
                 memory.embedding = generate_embedding(memory.content)
             
-            insert_sql = """
-            INSERT INTO memories (
-                id, content, memory_type, agent_id, session_id, timestamp,
-                importance, tags, metadata, embedding, last_accessed
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
-                content = EXCLUDED.content,
-                memory_type = EXCLUDED.memory_type,
-                agent_id = EXCLUDED.agent_id,
-                session_id = EXCLUDED.session_id,
-                timestamp = EXCLUDED.timestamp,
-                importance = EXCLUDED.importance,
-                tags = EXCLUDED.tags,
-                metadata = EXCLUDED.metadata,
-                embedding = EXCLUDED.embedding,
-                last_accessed = EXCLUDED.last_accessed,
-                updated_at = CURRENT_TIMESTAMP
+            insert_sql = f"""
+            INSERT INTO memories ({_WRITE_COLUMNS})
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            {_ON_CONFLICT_UPDATE}
             """
             
             with self._get_connection() as conn:
                 with conn.cursor() as cursor:
-                    cursor.execute(insert_sql, (
-                        memory.id,
-                        memory.content,
-                        memory.memory_type.value,
-                        memory.agent_id,
-                        memory.session_id,
-                        memory.timestamp,
-                        memory.importance,
-                        json.dumps(memory.tags),
-                        json.dumps(memory.metadata),
-                        json.dumps(memory.embedding) if memory.embedding else None,
-                        memory.last_accessed
-                    ))
+                    cursor.execute(insert_sql, self._memory_to_row(memory))
                     conn.commit()
             return True
         except Exception as e:
             print(f"Error saving memory to PostgreSQL: {e}")
             return False
     
+    def save_memories(self, memories: List[MemoryEntry]) -> bool:
+        """
+        Save several memory entries in one transaction using COPY
+        
+        Rows are streamed into a temporary staging table with COPY ... FROM
+        STDIN, which skips per-row parsing and planning, then upserted into
+        memories with a single INSERT ... SELECT.
+        
+        Args:
+            memories: MemoryEntry objects to save
+            
+        Returns:
+            True if every entry was saved, False otherwise
+        """
+        if not memories:
+            return True
+        try:
+            # ON CONFLICT cannot touch one row twice per statement; keep the last entry per ID
+            latest = {memory.id: memory for memory in memories}
+            buffer = io.StringIO()
+            for memory in latest.values():
+                if not memory.embedding:
+                    memory.embedding = generate_embedding(memory.content)
+                buffer.write("\t".join(_copy_field(value) for value in self._memory_to_row(memory)))
+                buffer.write("\n")
+            buffer.seek(0)
+            
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        "CREATE TEMP TABLE memories_staging "
+                        "(LIKE memories INCLUDING DEFAULTS) ON COMMIT DROP"
+                    )
+                    cursor.copy_expert(f"COPY memories_staging ({_WRITE_COLUMNS}) FROM STDIN", buffer)
+                    cursor.execute(
+                        f"INSERT INTO memories ({_WRITE_COLUMNS}) "
+                        f"SELECT {_WRITE_COLUMNS} FROM memories_staging {_ON_CONFLICT_UPDATE}"
+                    )
+                    conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error saving memories to PostgreSQL: {e}")
+            return False
+    
+    def _memory_to_row(self, memory: MemoryEntry) -> tuple:
+        """Convert MemoryEntry to a row in _WRITE_COLUMNS order"""
+        return (
+            memory.id,
+            memory.content,
+            memory.memory_type.value,
+            memory.agent_id,
+            memory.session_id,
+            memory.timestamp,
+            memory.importance,
+            json.dumps(memory.tags, separators=_JSON_SEPARATORS),
+            json.dumps(memory.metadata, separators=_JSON_SEPARATORS),
+            json.dumps(memory.embedding, separators=_JSON_SEPARATORS) if memory.embedding else None,
+            memory.last_accessed
+        )
+    
     def get_memory(self, memory_id: str) -> Optional[MemoryEntry]:
         """
         Retrieve a memory entry by ID
@@ -156,8 +337,8 @@ class PostgreSQLStore(BaseStore):
             MemoryEntry if found, None otherwise
         """
         try:
-            select_sql = """
-            SELECT * FROM memories WHERE id = %s
+            select_sql = f"""
+            SELECT {_SELECT_COLUMNS} FROM memories WHERE id = %s
             """
             
             with self._get_connection() as conn:
@@ -172,6 +353,36 @@ class PostgreSQLStore(BaseStore):
             print(f"Error retrieving memory from PostgreSQL: {e}")
             return None
     
+    def get_memories(self, memory_ids: List[str]) -> Dict[str, MemoryEntry]:
+        """
+        Retrieve several memory entries by ID in one query
+        
+        Args:
+            memory_ids: IDs of the memories to retrieve
+            
+        Returns:
+            Dict mapping each found ID to its MemoryEntry (missing IDs are left out)
+        """
+        if not memory_ids:
+            return {}
+        try:
+            select_sql = f"""
+            SELECT {_SELECT_COLUMNS} FROM memories WHERE id = ANY(%s)
+            """
+            
+            memories = {}
+            with self._get_connection() as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    cursor.execute(select_sql, (list(memory_ids),))
+                    for row in cursor.fetchall():
+                        memory = self._row_to_memory(row)
+                        if memory:
+                            memories[memory.id] = memory
+            return memories
+        except Exception as e:
+            print(f"Error retrieving memories from PostgreSQL: {e}")
+            return {}
+    
     def search_memories(self, query: str = None, memory_type: Optional[MemoryType] = None,
                        agent_id: Optional[str] = None, session_id: Optional[str] = None,
                        limit: int = 50) -> List[MemoryEntry]:
@@ -194,7 +405,7 @@ class PostgreSQLStore(BaseStore):
             params = []
             
             if query:
-                conditions.append("to_tsvector('english', content) @@ plainto_tsquery('english', %s)")
+                conditions.append("content_tsv @@ websearch_to_tsquery('english', %s)")
                 params.append(query)
             
             if memory_type:
@@ -215,24 +426,29 @@ class PostgreSQLStore(BaseStore):
             if query:
                 # Use full-text search with ranking
                 select_sql = f"""
-                SELECT *, ts_rank(to_tsvector('english', content), plainto_tsquery('english', %s)) as rank
+                SELECT {_SELECT_COLUMNS}, ts_rank(content_tsv, websearch_to_tsquery('english', %s)) as rank
                 FROM memories 
                 WHERE {where_clause}
-                ORDER BY rank DESC, timestamp DESC
+                ORDER BY rank DESC, ts_us DESC
                 LIMIT %s
                 """
                 params.insert(0, query)  # Add query at the beginning for ts_rank
             else:
                 select_sql = f"""
-                SELECT * FROM memories 
+                SELECT {_SELECT_COLUMNS} FROM memories 
                 WHERE {where_clause}
-                ORDER BY timestamp DESC
+                ORDER BY ts_us DESC
                 LIMIT %s
                 """
             
             params.append(limit)
             
             with self._get_connection() as conn:
+                if query and len(conditions) == 1:
+                    # Text search alone: run this connection's prepared plan
+                    self._prepare_search(conn)
+                    select_sql, params = "EXECUTE search_text(%s, %s)", [query, limit]
+                
                 with conn.cursor(cursor_factory=RealDictCursor) as cursor:
                     cursor.execute(select_sql, params)
                     rows = cursor.fetchall()
@@ -248,6 +464,141 @@ class PostgreSQLStore(BaseStore):
             print(f"Error searching memories in PostgreSQL: {e}")
             return []
     
+    def search_memories_batch(self, queries: List[str], memory_type: Optional[MemoryType] = None,
+                              agent_id: Optional[str] = None,
+                              limit: int = 50) -> List[List[MemoryEntry]]:
+        """
+        Run several full-text searches in one statement
+        
+        The queries are sent as one array; a LATERAL subquery ranks the top
+        matches of each, so the whole batch costs a single round trip.
+        
+        Args:
+            queries: Search queries; empty ones return the newest memories
+            memory_type: Filter by memory type
+            agent_id: Filter by agent ID
+            limit: Maximum number of results per query
+            
+        Returns:
+            One list of matching MemoryEntry objects per query, in query order
+        """
+        results: List[List[MemoryEntry]] = [[] for _ in queries]
+        text_queries = [query for query in queries if query]
+        
+        conditions = []
+        params: List[Any] = [text_queries]
+        if memory_type:
+            conditions.append("AND memory_type = %s")
+            params.append(memory_type.value)
+        if agent_id:
+            conditions.append("AND agent_id = %s")
+            params.append(agent_id)
+        params.append(limit)
+        filters = " ".join(conditions)
+        
+        select_sql = f"""
+        SELECT q.ord, m.*
+        FROM unnest(%s::text[]) WITH ORDINALITY AS q(query, ord)
+        CROSS JOIN LATERAL (
+            SELECT {_SELECT_COLUMNS}, ts_us,
+                   ts_rank(content_tsv, websearch_to_tsquery('english', q.query)) AS rank
+            FROM memories
+            WHERE content_tsv @@ websearch_to_tsquery('english', q.query) {filters}
+            ORDER BY rank DESC, ts_us DESC
+            LIMIT %s
+        ) m
+        ORDER BY q.ord, m.rank DESC, m.ts_us DESC
+        """
+        
+        try:
+            if text_queries:
+                with self._get_connection() as conn:
+                    with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                        cursor.execute(select_sql, params)
+                        found = [[] for _ in text_queries]
+                        for row in cursor:
+                            memory = self._row_to_memory(row)
+                            if memory:
+                                found[row['ord'] - 1].append(memory)
+                
+                matches = iter(found)
+                for i, query in enumerate(queries):
+                    if query:
+                        results[i] = next(matches)
+            
+            for i, query in enumerate(queries):
+                if not query:
+                    results[i] = self.search_memories(query=query, memory_type=memory_type,
+                                                      agent_id=agent_id, limit=limit)
+            return results
+        except Exception as e:
+            print(f"Error searching memories in PostgreSQL: {e}")
+            return [[] for _ in queries]
+    
+    def search_by_tag(self, tag: str, limit: int = 50) -> List[MemoryEntry]:
+        """
+        Find memories carrying a tag
+        
+        The containment test (tags @> '["tag"]') is answered by the
+        jsonb_path_ops GIN index on tags rather than a table scan.
+        
+        Args:
+            tag: Tag to look for (exact, case-sensitive match)
+            limit: Maximum number of results
+            
+        Returns:
+            List of matching MemoryEntry objects, newest first
+        """
+        select_sql = f"""
+        SELECT {_SELECT_COLUMNS} FROM memories
+        WHERE tags @> %s::jsonb
+        ORDER BY ts_us DESC
+        LIMIT %s
+        """
+        
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    cursor.execute(select_sql, [json.dumps([tag]), limit])
+                    return [memory for memory in map(self._row_to_memory, cursor.fetchall()) if memory]
+        except Exception as e:
+            print(f"Error searching memories by tag in PostgreSQL: {e}")
+            return []
+    
+    def count_memories(self, memory_type: Optional[MemoryType] = None,
+                       agent_id: Optional[str] = None) -> int:
+        """
+        Count memories matching the filters with SELECT COUNT(*)
+        
+        Args:
+            memory_type: Filter by memory type
+            agent_id: Filter by agent ID
+            
+        Returns:
+            Number of matching memories
+        """
+        try:
+            conditions = []
+            params = []
+            
+            if memory_type:
+                conditions.append("memory_type = %s")
+                params.append(memory_type.value)
+            
+            if agent_id:
+                conditions.append("agent_id = %s")
+                params.append(agent_id)
+            
+            where_clause = " AND ".join(conditions) if conditions else "1=1"
+            
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(f"SELECT COUNT(*) FROM memories WHERE {where_clause}", params)
+                    return cursor.fetchone()[0]
+        except Exception as e:
+            print(f"Error counting memories in PostgreSQL: {e}")
+            return 0
+    
     def get_timeline(self, agent_id: Optional[str] = None,
                     start_time: Optional[datetime] = None,
                     end_time: Optional[datetime] = None,
@@ -273,19 +624,19 @@ class PostgreSQLStore(BaseStore):
                 params.append(agent_id)
             
             if start_time:
-                conditions.append("timestamp >= %s")
+                conditions.append(f"ts_us >= {_TS_US_PARAM}")
                 params.append(start_time)
             
             if end_time:
-                conditions.append("timestamp <= %s")
+                conditions.append(f"ts_us <= {_TS_US_PARAM}")
                 params.append(end_time)
             
             where_clause = " AND ".join(conditions) if conditions else "1=1"
             
             select_sql = f"""
-            SELECT * FROM memories 
+            SELECT {_SELECT_COLUMNS} FROM memories 
             WHERE {where_clause}
-            ORDER BY timestamp ASC
+            ORDER BY ts_us ASC
             LIMIT %s
             """
             params.append(limit)
@@ -328,6 +679,28 @@ class PostgreSQLStore(BaseStore):
             print(f"Error deleting memory from PostgreSQL: {e}")
             return False
     
+    def delete_memories(self, memory_ids: List[str]) -> int:
+        """
+        Delete several memories with a single DELETE statement
+        
+        Args:
+            memory_ids: IDs of the memories to delete
+            
+        Returns:
+            Number of memories deleted
+        """
+        if not memory_ids:
+            return 0
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("DELETE FROM memories WHERE id = ANY(%s)", (list(memory_ids),))
+                    conn.commit()
+                    return cursor.rowcount
+        except Exception as e:
+            print(f"Error deleting memories from PostgreSQL: {e}")
+            return 0
+    
     def get_all_memories(self, limit: int = 10000) -> List[MemoryEntry]:
         """
         Get all memories in the system
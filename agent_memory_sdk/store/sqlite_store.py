@@ -4,33 +4,389 @@ SQLite storage backend for Agent Memory OS
 Provides persistent storage using SQLite database.
 """
 
+import atexit
+import os
+import queue
+import re
 import sqlite3
 import json
-import sqlite3
-from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pathlib import Path
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Callable, Iterator, List, Optional, Dict, Any, Sequence, Tuple, Union
+
+import numpy as np
 
 from ..models import MemoryEntry, MemoryType
+from ..utils.time_utils import parse_iso_datetime
 from .base_store import BaseStore
 
+# Columns selected when decoding full MemoryEntry rows
+_SELECT_COLUMNS = "id, content, memory_type, agent_id, session_id, timestamp, metadata, embedding, importance, tags, last_accessed"
+
+# Frozen full-row statements for the common searches without a text query,
+# keyed by (memory_type?, agent_id?, session_id?)
+_SEARCH_ALL_SQL = f"SELECT {_SELECT_COLUMNS} FROM memories ORDER BY ts_us DESC LIMIT ?"
+_SEARCH_BY_AGENT_SQL = f"SELECT {_SELECT_COLUMNS} FROM memories WHERE agent_id = ? ORDER BY ts_us DESC LIMIT ?"
+_SEARCH_BY_TYPE_SQL = f"SELECT {_SELECT_COLUMNS} FROM memories WHERE memory_type = ? ORDER BY ts_us DESC LIMIT ?"
+_SEARCH_BY_TYPE_AGENT_SQL = f"SELECT {_SELECT_COLUMNS} FROM memories WHERE memory_type = ? AND agent_id = ? ORDER BY ts_us DESC LIMIT ?"
+_SEARCH_BY_AGENT_SESSION_SQL = f"SELECT {_SELECT_COLUMNS} FROM memories WHERE agent_id = ? AND session_id = ? ORDER BY ts_us DESC LIMIT ?"
+_SPECIALIZED_SEARCHES = {
+    (False, False, False): _SEARCH_ALL_SQL,
+    (False, True, False): _SEARCH_BY_AGENT_SQL,
+    (True, False, False): _SEARCH_BY_TYPE_SQL,
+    (True, True, False): _SEARCH_BY_TYPE_AGENT_SQL,
+    (False, True, True): _SEARCH_BY_AGENT_SESSION_SQL,
+}
+
+# Size of each connection's prepared statement cache
+_CACHED_STATEMENTS = 256
+
+# Write-behind batching: commit after this many queued rows or this many seconds
+_WRITE_BATCH_SIZE = 200
+_WRITE_BATCH_INTERVAL = 0.2
+
+# Queued by close() to stop the write-behind thread once earlier rows are written
+_STOP_WRITER = object()
+
+_INSERT_SQL = """
+    INSERT OR REPLACE INTO memories 
+    (id, content, memory_type, agent_id, session_id, timestamp, metadata, embedding, importance, tags, last_accessed, ts_us)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Compact JSON for the tags, metadata and embedding columns; an embedding
+# is about 1KB smaller per row without the spaces after commas. Metadata
+# values in memory_metadata keep json.dumps defaults, since lookups compare
+# their encoded form.
+_JSON_SEPARATORS = (",", ":")
+
+_DELETE_METADATA_SQL = "DELETE FROM memory_metadata WHERE memory_id = ?"
+_INSERT_METADATA_SQL = "INSERT INTO memory_metadata (memory_id, key, value) VALUES (?, ?, ?)"
+
+_DELETE_TAGS_SQL = "DELETE FROM memory_tags WHERE memory_id = ?"
+_INSERT_TAG_SQL = "INSERT INTO memory_tags (memory_id, tag) VALUES (?, ?)"
+
+# Full-text index over memories.content (external content, synced by triggers)
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE memories_fts USING fts5(content, content='memories', content_rowid='rowid')",
+    """CREATE TRIGGER memories_fts_insert AFTER INSERT ON memories BEGIN
+        INSERT INTO memories_fts(rowid, content) VALUES (new.rowid, new.content);
+    END""",
+    """CREATE TRIGGER memories_fts_delete AFTER DELETE ON memories BEGIN
+        INSERT INTO memories_fts(memories_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+    END""",
+    """CREATE TRIGGER memories_fts_update AFTER UPDATE OF content ON memories BEGIN
+        INSERT INTO memories_fts(memories_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+        INSERT INTO memories_fts(rowid, content) VALUES (new.rowid, new.content);
+    END""",
+)
+
+# Words passed to FTS5 MATCH; each is quoted so query punctuation is never syntax
+_FTS_TERM = re.compile(r"\w+")
+
+# Secondary indexes, by name; bulk_load() drops and rebuilds these (never the
+# primary key or the full-text index)
+_SECONDARY_INDEXES = {
+    "idx_session_id": "CREATE INDEX IF NOT EXISTS idx_session_id ON memories(session_id)",
+    "idx_ts_us": "CREATE INDEX IF NOT EXISTS idx_ts_us ON memories(ts_us)",
+    "idx_agent_ts_us": "CREATE INDEX IF NOT EXISTS idx_agent_ts_us ON memories(agent_id, ts_us)",
+    "idx_type_ts_us": "CREATE INDEX IF NOT EXISTS idx_type_ts_us ON memories(memory_type, ts_us)",
+    "idx_meta_kv": "CREATE INDEX IF NOT EXISTS idx_meta_kv ON memory_metadata(key, value)",
+    "idx_tag": "CREATE INDEX IF NOT EXISTS idx_tag ON memory_tags(tag)",
+}
+
+# bulk_load() keeps the indexes of tables larger than this unless forced
+_BULK_LOAD_MAX_ROWS = 10000
+
+# IDs per "WHERE id IN (...)" lookup, below SQLite's default 999-variable limit
+_ID_BATCH_SIZE = 500
+
+# Number of rows pulled from a cursor per fetchmany() call when streaming
+_FETCH_BATCH_SIZE = 1024
+
+# Database files whose schema has already been created/migrated in this process
+_INITIALIZED_DATABASES = set()
+_INIT_LOCK = threading.Lock()
+
+# Bound once at import time; these run for every decoded row
+_fromisoformat = parse_iso_datetime
+_json_loads = json.loads
+
+# Direct value -> member lookup, bypassing Enum.__call__ for every row
+_MEMORY_TYPES = {memory_type.value: memory_type for memory_type in MemoryType}
+
+
+def _memory_type(value: str) -> MemoryType:
+    """Map a stored memory_type value to its enum member"""
+    try:
+        return _MEMORY_TYPES[value]
+    except KeyError:
+        return MemoryType(value)  # raises the usual ValueError
+
+
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    """Intern agent/session IDs, which repeat across many rows"""
+    return sys.intern(value) if value else value
+
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_us(dt: datetime) -> int:
+    """Convert a datetime to integer microseconds since the epoch (naive = UTC wall clock)"""
+    delta = dt - (_EPOCH_UTC if dt.tzinfo is not None else _EPOCH)
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _loads_dict(blob: Optional[str]) -> Dict[str, Any]:
+    """Decode a JSON object column, skipping the parser for empty values"""
+    if not blob or blob == "{}":
+        return {}
+    return _json_loads(blob)
+
+
+def _loads_list(blob: Optional[str]) -> list:
+    """Decode a JSON array column, skipping the parser for empty values"""
+    if not blob or blob == "[]":
+        return []
+    return _json_loads(blob)
+
+
+def _pack_embedding(embedding: Sequence[float]) -> bytes:
+    """Encode an embedding as a float32 scale followed by one int8 code per value"""
+    values = np.asarray(embedding, dtype=np.float32)
+    scale = float(np.abs(values).max()) / 127 or 1.0
+    codes = np.rint(values / scale).astype(np.int8)
+    return np.float32(scale).tobytes() + codes.tobytes()
+
+
+def _loads_embedding(blob: Optional[Union[str, bytes]]) -> Optional[List[float]]:
+    """Decode an embedding column stored as JSON text or as a packed int8 blob"""
+    if not blob:
+        return None
+    if isinstance(blob, bytes):
+        scale = np.frombuffer(blob, dtype=np.float32, count=1)[0]
+        return (np.frombuffer(blob, dtype=np.int8, offset=4) * scale).tolist()
+    return _json_loads(blob)
+
+
+def _parse_optional_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a nullable ISO timestamp column"""
+    return _fromisoformat(value) if value else None
+
+
+def _importance_or_default(value: Optional[float]) -> float:
+    """Fill in the default importance for rows written before the column existed"""
+    return value if value is not None else 5.0
+
+
+# Decoder applied to each column when returning partial rows (None = use as-is)
+_FIELD_DECODERS: Dict[str, Optional[Callable[[Any], Any]]] = {
+    "id": None,
+    "content": None,
+    "memory_type": _memory_type,
+    "agent_id": _intern_optional,
+    "session_id": _intern_optional,
+    "timestamp": _fromisoformat,
+    "metadata": _loads_dict,
+    "embedding": _loads_embedding,
+    "importance": _importance_or_default,
+    "tags": _loads_list,
+    "last_accessed": _parse_optional_datetime,
+}
+
+
+def _normalize_fields(fields: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    """Validate a projection and return it as a hashable tuple"""
+    if fields is None:
+        return None
+    fields = tuple(fields)
+    unknown = [name for name in fields if name not in _FIELD_DECODERS]
+    if unknown or not fields:
+        raise ValueError(f"Unsupported fields: {unknown}. "
+                         f"Supported fields: {', '.join(_FIELD_DECODERS)}")
+    return fields
+
 
 class SQLiteStore(BaseStore):
     """SQLite-based storage backend for memory entries"""
     
-    def __init__(self, db_path: str = "agent_memory.db"):
+    def __init__(self, db_path: str = "agent_memory.db", write_behind: bool = False,
+                 trace_callback: Optional[Callable[[str], None]] = None,
+                 quantize_embeddings: bool = False):
         """
         Initialize SQLite store
         
         Args:
             db_path: Path to SQLite database file
+            write_behind: Queue saves and commit them in batches from a background
+                thread. save_memory then returns as soon as the entry is queued;
+                reads on this store wait for queued writes first. Up to one
+                batch (~200 ms of writes) can be lost if the process crashes.
+                Batches that fail to commit are kept and retried by flush(),
+                which raises if they still fail. close() stops the thread.
+            trace_callback: Called with every SQL statement executed (e.g. print),
+                useful for checking which statements and indexes are used
+            quantize_embeddings: Write embeddings as int8 codes with one float32
+                scale (about 1 KB for 1024 dimensions instead of ~20 KB of JSON).
+                Values read back are approximate. Rows written either way can
+                be read by any store.
         """
         self.db_path = db_path
+        self.trace_callback = trace_callback
+        self.quantize_embeddings = quantize_embeddings
+        # SQL text per (statement kind, active filters); only a handful of variants exist
+        self._stmt_cache: Dict[tuple, str] = {}
+        # Connection of the transaction() block open on each thread, if any
+        self._local = threading.local()
         self._init_database()
+        
+        self._write_queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        # Rows of write-behind batches that failed to commit, retried by flush()
+        self._failed_writes: List[tuple] = []
+        self._failed_lock = threading.Lock()
+        if write_behind:
+            self._write_queue = queue.Queue()
+            self._writer = threading.Thread(
+                target=self._flush_loop, args=(self._write_queue,),
+                name="sqlite-write-behind", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self._stop_writer)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database"""
+        conn = sqlite3.connect(self.db_path, cached_statements=_CACHED_STATEMENTS)
+        # INSERT OR REPLACE must fire the delete trigger that keeps memories_fts in sync
+        conn.execute("PRAGMA recursive_triggers = ON")
+        # With WAL, NORMAL syncs at checkpoints rather than on every commit
+        conn.execute("PRAGMA synchronous = NORMAL")
+        # Keep temporary tables and sort spills in memory
+        conn.execute("PRAGMA temp_store = MEMORY")
+        if self.trace_callback is not None:
+            conn.set_trace_callback(self.trace_callback)
+        return conn
+    
+    def _in_transaction(self) -> bool:
+        """Whether this thread is inside a transaction() block"""
+        return getattr(self._local, "conn", None) is not None
+    
+    def _queues_writes(self) -> bool:
+        """Whether saves on this thread go to the write-behind queue"""
+        return self._write_queue is not None and not self._in_transaction()
+    
+    @contextmanager
+    def _write_connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield the open transaction's connection, or a new one committed on exit"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Commit every write made on this thread inside the block at once
+        
+        save_memory, save_memories and delete_memory calls share one
+        connection and transaction, committed when the block exits (rolled
+        back if it raises). With write_behind, the queue is drained when the
+        block starts, and saves inside the block skip the queue and are
+        written on that connection too. Reads inside the block do not see
+        the pending writes. Nested blocks join the outer transaction.
+        """
+        if self._in_transaction():
+            yield
+            return
+        self.flush()
+        conn = self._connect()
+        self._local.conn = conn
+        try:
+            with conn:
+                yield
+        finally:
+            self._local.conn = None
+            conn.close()
+    
+    @contextmanager
+    def bulk_load(self, force: bool = False) -> Iterator[None]:
+        """
+        Drop the secondary indexes while loading many rows, then rebuild them
+        
+        Each index is built once over the final data instead of being updated
+        row by row. Reads inside the block scan the table. Tables with more
+        than 10000 rows keep their indexes unless force is True, since
+        rebuilding them can cost more than the load saves.
+        
+        Args:
+            force: Drop the indexes regardless of the table size
+        """
+        self.flush()
+        with self._connect() as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+            drop = force or rows <= _BULK_LOAD_MAX_ROWS
+            if drop:
+                for name in _SECONDARY_INDEXES:
+                    conn.execute(f"DROP INDEX IF EXISTS {name}")
+        try:
+            yield
+        finally:
+            if drop:
+                self.flush()
+                with self._connect() as conn:
+                    for sql in _SECONDARY_INDEXES.values():
+                        conn.execute(sql)
+                    conn.execute("ANALYZE")
+    
+    def close(self):
+        """
+        Flush pending writes and refresh query planner statistics
+        
+        Stops the write-behind thread (later saves are written directly) and
+        runs PRAGMA optimize, which re-analyzes only the tables whose
+        statistics have gone stale since the last analysis.
+        
+        Raises:
+            sqlite3.Error: If queued writes could not be committed
+        """
+        self._stop_writer()
+        self.flush()
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA optimize")
+        except Exception as e:
+            print(f"Warning: Could not optimize database: {e}")
+        finally:
+            conn.close()
     
     def _init_database(self):
-        """Initialize database tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        """Initialize database tables (once per database file per process)"""
+        # In-memory databases are fresh on every connection, so never skip them
+        key = os.path.abspath(self.db_path) if self.db_path != ":memory:" else None
+        with _INIT_LOCK:
+            if key in _INITIALIZED_DATABASES and os.path.exists(key):
+                return
+            self._create_schema()
+            if key is not None:
+                _INITIALIZED_DATABASES.add(key)
+    
+    def _create_schema(self):
+        """Create tables and indexes and migrate older schemas"""
+        with self._connect() as conn:
+            # Persistent per database file: readers no longer block the writer
+            # and commits append to the log instead of rewriting pages
+            conn.execute("PRAGMA journal_mode = WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS memories (
                     id TEXT PRIMARY KEY,
@@ -43,21 +399,59 @@ class SQLiteStore(BaseStore):
                     embedding TEXT,
                     importance REAL DEFAULT 5.0,
                     tags TEXT,
-                    last_accessed TEXT
+                    last_accessed TEXT,
+                    ts_us INTEGER
                 )
             """)
             
             # Create indexes for better query performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_memory_type ON memories(memory_type)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_agent_id ON memories(agent_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_session_id ON memories(session_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON memories(timestamp)")
+            conn.execute(_SECONDARY_INDEXES["idx_session_id"])
             
             # Add new columns if they don't exist (migration)
             self._migrate_database(conn)
+            
+            # Ordering and time ranges use the integer timestamp column
+            conn.execute("DROP INDEX IF EXISTS idx_timestamp")
+            conn.execute(_SECONDARY_INDEXES["idx_ts_us"])
+            
+            # Per-agent timelines and searches become a range scan in ts_us order;
+            # the composite index also serves plain agent_id lookups
+            conn.execute("DROP INDEX IF EXISTS idx_agent_id")
+            conn.execute(_SECONDARY_INDEXES["idx_agent_ts_us"])
+            
+            # Same for searches filtered by memory type
+            conn.execute("DROP INDEX IF EXISTS idx_memory_type")
+            conn.execute(_SECONDARY_INDEXES["idx_type_ts_us"])
+            
+            self._create_fts(conn)
+            
+            # Gather planner statistics once for databases that were never analyzed
+            cursor = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                conn.execute("ANALYZE")
+    
+    def _create_fts(self, conn):
+        """Create the full-text index used by search_keywords and fill it from existing rows"""
+        cursor = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'memories_fts'")
+        if cursor.fetchone() is not None:
+            return
+        try:
+            for statement in _FTS_SCHEMA:
+                conn.execute(statement)
+            conn.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5; keyword search is then unavailable
+            print(f"Warning: Could not create full-text index: {e}")
     
     def _migrate_database(self, conn):
-        """Migrate database schema to add new columns"""
+        """
+        Migrate database schema to add new columns and side tables
+        
+        Runs inside a savepoint: if a step fails, every step is rolled back
+        and the error raised, so no column or table is left added but only
+        partly filled. The next store opened on the file retries.
+        """
+        conn.execute("SAVEPOINT migrate")
         try:
             # Check if importance column exists
             cursor = conn.execute("PRAGMA table_info(memories)")
@@ -71,9 +465,57 @@ class SQLiteStore(BaseStore):
             
             if 'last_accessed' not in columns:
                 conn.execute("ALTER TABLE memories ADD COLUMN last_accessed TEXT")
-                
-        except Exception as e:
-            print(f"Warning: Database migration failed: {e}")
+            
+            if 'ts_us' not in columns:
+                conn.execute("ALTER TABLE memories ADD COLUMN ts_us INTEGER")
+            
+            # Rows from before the column existed; once filled this is an
+            # idx_ts_us lookup that finds nothing
+            rows = conn.execute("SELECT id, timestamp FROM memories WHERE ts_us IS NULL").fetchall()
+            conn.executemany(
+                "UPDATE memories SET ts_us = ? WHERE id = ?",
+                [(_to_us(_fromisoformat(timestamp)), memory_id) for memory_id, timestamp in rows]
+            )
+            
+            # Metadata key/value table for indexed lookups; the JSON column is
+            # kept as the source for MemoryEntry.metadata
+            cursor = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_metadata'"
+            )
+            if cursor.fetchone() is None:
+                conn.execute("""
+                    CREATE TABLE memory_metadata (
+                        memory_id TEXT NOT NULL,
+                        key TEXT NOT NULL,
+                        value TEXT,
+                        PRIMARY KEY (memory_id, key)
+                    )
+                """)
+                conn.execute(_SECONDARY_INDEXES["idx_meta_kv"])
+                for memory_id, metadata in conn.execute("SELECT id, metadata FROM memories").fetchall():
+                    conn.executemany(_INSERT_METADATA_SQL, self._metadata_rows(memory_id, _loads_dict(metadata)))
+            
+            # Same for tags, one row per (memory, tag); the JSON column stays
+            # the source for MemoryEntry.tags
+            cursor = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_tags'"
+            )
+            if cursor.fetchone() is None:
+                conn.execute("""
+                    CREATE TABLE memory_tags (
+                        memory_id TEXT NOT NULL,
+                        tag TEXT NOT NULL,
+                        PRIMARY KEY (memory_id, tag)
+                    )
+                """)
+                conn.execute(_SECONDARY_INDEXES["idx_tag"])
+                for memory_id, tags in conn.execute("SELECT id, tags FROM memories").fetchall():
+                    conn.executemany(_INSERT_TAG_SQL, self._tag_rows(memory_id, json.loads(tags) if tags else []))
+        except Exception:
+            conn.execute("ROLLBACK TO migrate")
+            conn.execute("RELEASE migrate")
+            raise
+        conn.execute("RELEASE migrate")
     
     def save_memory(self, memory: MemoryEntry) -> bool:
         """
@@ -83,32 +525,227 @@ class SQLiteStore(BaseStore):
             memory: MemoryEntry to save
             
         Returns:
-            True if successful, False otherwise
+            True if successful (or queued, with write_behind), False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO memories 
-                    (id, content, memory_type, agent_id, session_id, timestamp, metadata, embedding, importance, tags, last_accessed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    memory.id,
-                    memory.content,
-                    memory.memory_type.value,
-                    memory.agent_id,
-                    memory.session_id,
-                    memory.timestamp.isoformat(),
-                    json.dumps(memory.metadata),
-                    json.dumps(memory.embedding) if memory.embedding else None,
-                    memory.importance,
-                    json.dumps(memory.tags),
-                    memory.last_accessed.isoformat() if memory.last_accessed else None
-                ))
+            write = self._memory_write(memory)
+            if self._queues_writes():
+                self._write_queue.put(write)
+                return True
+            with self._write_connection() as conn:
+                self._write(conn, [write])
                 return True
         except Exception as e:
             print(f"Error saving memory: {e}")
             return False
     
+    def save_memories(self, memories: List[MemoryEntry]) -> bool:
+        """
+        Save several memory entries in one transaction
+        
+        Args:
+            memories: MemoryEntry objects to save
+            
+        Returns:
+            True if successful (or queued, with write_behind), False otherwise
+        """
+        try:
+            writes = [self._memory_write(memory) for memory in memories]
+            if self._queues_writes():
+                for write in writes:
+                    self._write_queue.put(write)
+                return True
+            with self._write_connection() as conn:
+                self._write(conn, writes)
+                return True
+        except Exception as e:
+            print(f"Error saving memories: {e}")
+            return False
+    
+    def flush(self):
+        """
+        Block until all queued write-behind saves are committed
+        
+        Batches the background thread failed to commit are retried here.
+        Returns at once inside a transaction() block: the queue was drained
+        when the block began, and once the block has written, the writer
+        thread cannot commit until the block ends, so waiting could deadlock.
+        
+        Raises:
+            sqlite3.Error: If failed batches still cannot be committed; they
+                are kept for the next flush
+        """
+        if self._in_transaction():
+            return
+        self._wait_for_writes()
+        
+        with self._failed_lock:
+            writes, self._failed_writes = self._failed_writes, []
+        if not writes:
+            return
+        try:
+            with self._write_connection() as conn:
+                self._write(conn, writes)
+        except Exception:
+            with self._failed_lock:
+                self._failed_writes[:0] = writes
+            raise
+    
+    def _wait_for_writes(self):
+        """Wait for the write-behind queue to drain, without retrying failed batches"""
+        write_queue = self._write_queue
+        if write_queue is not None and not self._in_transaction():
+            write_queue.join()
+    
+    def _stop_writer(self):
+        """Write the queued rows, then end the write-behind thread"""
+        write_queue, self._write_queue = self._write_queue, None
+        if write_queue is None:
+            return
+        atexit.unregister(self._stop_writer)
+        write_queue.put(_STOP_WRITER)
+        self._writer.join()
+    
+    def _flush_loop(self, write_queue: queue.Queue):
+        """Background writer: commit queued rows in batches until _STOP_WRITER"""
+        while True:
+            batch = [write_queue.get()]
+            deadline = time.monotonic() + _WRITE_BATCH_INTERVAL
+            while len(batch) < _WRITE_BATCH_SIZE and batch[-1] is not _STOP_WRITER:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            stop = batch[-1] is _STOP_WRITER
+            writes = batch[:-1] if stop else batch
+            try:
+                if writes:
+                    # Closed after each batch so an idle writer holds no connection
+                    # and the WAL can be checkpointed and removed at exit
+                    with self._write_connection() as conn:
+                        self._write(conn, writes)
+            except Exception as e:
+                # save_memory already returned True: keep the rows for flush()
+                with self._failed_lock:
+                    self._failed_writes.extend(writes)
+                print(f"Error saving memories (kept for retry on flush): {e}")
+            finally:
+                for _ in batch:
+                    write_queue.task_done()
+            if stop:
+                return
+    
+    def _memory_write(self, memory: MemoryEntry) -> tuple:
+        """Build the memory row, metadata rows and tag rows _write stores for memory"""
+        return (
+            self._memory_to_row(memory),
+            self._metadata_rows(memory.id, memory.metadata),
+            self._tag_rows(memory.id, memory.tags),
+        )
+    
+    def _write(self, conn: sqlite3.Connection, writes: List[tuple]):
+        """Upsert memory rows and replace their metadata and tag rows in one transaction"""
+        conn.executemany(_INSERT_SQL, [row for row, _, _ in writes])
+        memory_ids = [(row[0],) for row, _, _ in writes]
+        conn.executemany(_DELETE_METADATA_SQL, memory_ids)
+        conn.executemany(
+            _INSERT_METADATA_SQL,
+            [metadata_row for _, metadata_rows, _ in writes for metadata_row in metadata_rows]
+        )
+        conn.executemany(_DELETE_TAGS_SQL, memory_ids)
+        conn.executemany(
+            _INSERT_TAG_SQL,
+            [tag_row for _, _, tag_rows in writes for tag_row in tag_rows]
+        )
+    
+    def _memory_to_row(self, memory: MemoryEntry) -> tuple:
+        """Convert MemoryEntry to the parameter tuple for _INSERT_SQL"""
+        return (
+            memory.id,
+            memory.content,
+            memory.memory_type.value,
+            memory.agent_id,
+            memory.session_id,
+            memory.timestamp.isoformat(),
+            json.dumps(memory.metadata, separators=_JSON_SEPARATORS),
+            self._dumps_embedding(memory.embedding),
+            memory.importance,
+            json.dumps(memory.tags, separators=_JSON_SEPARATORS),
+            memory.last_accessed.isoformat() if memory.last_accessed else None,
+            _to_us(memory.timestamp)
+        )
+    
+    def _dumps_embedding(self, embedding: Optional[List[float]]) -> Optional[Union[str, bytes]]:
+        """Encode an embedding for the embedding column"""
+        if not embedding:
+            return None
+        if self.quantize_embeddings:
+            return _pack_embedding(embedding)
+        return json.dumps(embedding, separators=_JSON_SEPARATORS)
+    
+    def _metadata_rows(self, memory_id: str, metadata: Dict[str, Any]) -> List[tuple]:
+        """Convert metadata to memory_metadata rows (values stored as JSON)"""
+        return [(memory_id, str(key), json.dumps(value)) for key, value in metadata.items()]
+    
+    def _tag_rows(self, memory_id: str, tags: List[Any]) -> List[tuple]:
+        """Convert tags to memory_tags rows, dropping repeats"""
+        return [(memory_id, tag) for tag in dict.fromkeys(str(tag) for tag in tags)]
+    
+    def search_by_tag(self, tag: str, limit: int = 50) -> List[MemoryEntry]:
+        """
+        Find memories carrying a tag
+        
+        Uses the tag index on memory_tags instead of scanning and decoding
+        every tags list.
+        
+        Args:
+            tag: Tag to look for (exact, case-sensitive match)
+            limit: Maximum number of results
+            
+        Returns:
+            List of matching MemoryEntry objects, newest first
+        """
+        try:
+            return list(self._iter_rows(
+                f"SELECT {_SELECT_COLUMNS} FROM memories WHERE id IN "
+                "(SELECT memory_id FROM memory_tags WHERE tag = ?) "
+                "ORDER BY ts_us DESC LIMIT ?",
+                [tag, limit]
+            ))
+        except Exception as e:
+            print(f"Error searching memories by tag: {e}")
+            return []
+    
+    def search_by_metadata(self, key: str, value: Any,
+                           limit: int = 50) -> List[MemoryEntry]:
+        """
+        Find memories whose metadata has key set to value
+        
+        Uses the (key, value) index on memory_metadata instead of scanning
+        and decoding every metadata blob.
+        
+        Args:
+            key: Metadata key
+            value: Metadata value (compared by its JSON encoding, so 1 != "1")
+            limit: Maximum number of results
+            
+        Returns:
+            List of matching MemoryEntry objects, newest first
+        """
+        try:
+            return list(self._iter_rows(
+                f"SELECT {_SELECT_COLUMNS} FROM memories WHERE id IN "
+                "(SELECT memory_id FROM memory_metadata WHERE key = ? AND value = ?) "
+                "ORDER BY ts_us DESC LIMIT ?",
+                [key, json.dumps(value), limit]
+            ))
+        except Exception as e:
+            print(f"Error searching memories by metadata: {e}")
+            return []
+    
     def get_memory(self, memory_id: str) -> Optional[MemoryEntry]:
         """
         Retrieve a memory entry by ID
@@ -120,12 +757,11 @@ class SQLiteStore(BaseStore):
             MemoryEntry if found, None otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT id, content, memory_type, agent_id, session_id, 
-                           timestamp, metadata, embedding, importance, tags, last_accessed
-                    FROM memories WHERE id = ?
-                """, (memory_id,))
+            self._wait_for_writes()
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    f"SELECT {_SELECT_COLUMNS} FROM memories WHERE id = ?", (memory_id,)
+                )
                 
                 row = cursor.fetchone()
                 if row:
@@ -135,56 +771,187 @@ class SQLiteStore(BaseStore):
             print(f"Error retrieving memory: {e}")
             return None
     
+    def get_memories(self, memory_ids: List[str]) -> Dict[str, MemoryEntry]:
+        """
+        Retrieve several memory entries by ID over one connection
+        
+        Args:
+            memory_ids: IDs of the memories to retrieve
+            
+        Returns:
+            Dict mapping each found ID to its MemoryEntry (missing IDs are left out)
+        """
+        memories = {}
+        try:
+            self._wait_for_writes()
+            with self._connect() as conn:
+                for start in range(0, len(memory_ids), _ID_BATCH_SIZE):
+                    batch = memory_ids[start:start + _ID_BATCH_SIZE]
+                    placeholders = ", ".join("?" * len(batch))
+                    cursor = conn.execute(
+                        f"SELECT {_SELECT_COLUMNS} FROM memories WHERE id IN ({placeholders})", batch
+                    )
+                    for row in cursor:
+                        memories[row[0]] = self._row_to_memory_entry(row)
+        except Exception as e:
+            print(f"Error retrieving memories: {e}")
+        return memories
+    
     def search_memories(self, query: str = None, memory_type: Optional[MemoryType] = None,
                        agent_id: Optional[str] = None, session_id: Optional[str] = None,
-                       limit: int = 50) -> List[MemoryEntry]:
+                       limit: int = 50, fields: Optional[Sequence[str]] = None
+                       ) -> List[Union[MemoryEntry, Dict[str, Any]]]:
         """
         Search for memories with various filters
         
         Args:
-            query: Text search in content (simple LIKE search for now)
+            query: Case-insensitive substring search in content
             memory_type: Filter by memory type
             agent_id: Filter by agent ID
             session_id: Filter by session ID
             limit: Maximum number of results
+            fields: Only read and decode these columns (e.g. ["id", "content"]);
+                results are then dicts instead of MemoryEntry objects
             
         Returns:
-            List of matching MemoryEntry objects
+            List of matching MemoryEntry objects (or dicts when fields is given)
         """
+        fields = _normalize_fields(fields)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                sql = "SELECT id, content, memory_type, agent_id, session_id, timestamp, metadata, embedding, importance, tags, last_accessed FROM memories WHERE 1=1"
-                params = []
-                
-                if query:
-                    sql += " AND content LIKE ?"
-                    params.append(f"%{query}%")
-                
-                if memory_type:
-                    sql += " AND memory_type = ?"
-                    params.append(memory_type.value)
-                
-                if agent_id:
-                    sql += " AND agent_id = ?"
-                    params.append(agent_id)
-                
-                if session_id:
-                    sql += " AND session_id = ?"
-                    params.append(session_id)
-                
-                sql += " ORDER BY timestamp DESC LIMIT ?"
+            return list(self.iter_search_memories(
+                query=query,
+                memory_type=memory_type,
+                agent_id=agent_id,
+                session_id=session_id,
+                limit=limit,
+                fields=fields
+            ))
+        except Exception as e:
+            print(f"Error searching memories: {e}")
+            return []
+    
+    def iter_search_memories(self, query: str = None, memory_type: Optional[MemoryType] = None,
+                             agent_id: Optional[str] = None, session_id: Optional[str] = None,
+                             limit: int = 50, fields: Optional[Sequence[str]] = None
+                             ) -> Iterator[Union[MemoryEntry, Dict[str, Any]]]:
+        """
+        Lazily search for memories with various filters
+        
+        Takes the same filters as search_memories, but yields entries as rows
+        are fetched instead of building the full result list. Database errors
+        are raised to the caller.
+        
+        Yields:
+            Matching MemoryEntry objects (or dicts when fields is given), newest first
+        """
+        if fields is None and not query:
+            # Fast path: frozen SQL for the common filter shapes
+            sql = _SPECIALIZED_SEARCHES.get((bool(memory_type), bool(agent_id), bool(session_id)))
+            if sql is not None:
+                params = [value for value in (memory_type and memory_type.value, agent_id, session_id) if value]
                 params.append(limit)
-                
-                cursor = conn.execute(sql, params)
-                return [self._row_to_memory_entry(row) for row in cursor.fetchall()]
+                yield from self._iter_rows(sql, params)
+                return
+        
+        fields = _normalize_fields(fields)
+        params = []
+        
+        if query:
+            params.append(query)
+        
+        if memory_type:
+            params.append(memory_type.value)
+        
+        if agent_id:
+            params.append(agent_id)
+        
+        if session_id:
+            params.append(session_id)
+        
+        params.append(limit)
+        
+        sql = self._search_sql(fields, bool(query), bool(memory_type), bool(agent_id), bool(session_id))
+        yield from self._iter_rows(sql, params, fields)
+    
+    def search_memories_batch(self, queries: List[str], memory_type: Optional[MemoryType] = None,
+                              agent_id: Optional[str] = None,
+                              limit: int = 50) -> List[List[MemoryEntry]]:
+        """
+        Run several text searches over one connection and prepared statement
+        
+        Args:
+            queries: Case-insensitive substring searches in content
+            memory_type: Filter by memory type
+            agent_id: Filter by agent ID
+            limit: Maximum number of results per query
+            
+        Returns:
+            One list of matching MemoryEntry objects per query, newest first
+        """
+        sql = self._search_sql(None, True, bool(memory_type), bool(agent_id), False)
+        filters = [value for value in (memory_type and memory_type.value, agent_id) if value]
+        try:
+            self._wait_for_writes()
+            conn = self._connect()
+            try:
+                return [
+                    [self._row_to_memory_entry(row) for row in conn.execute(sql, [query, *filters, limit])]
+                    for query in queries
+                ]
+            finally:
+                conn.close()
         except Exception as e:
             print(f"Error searching memories: {e}")
+            return [[] for _ in queries]
+    
+    def search_keywords(self, query: str, memory_type: Optional[MemoryType] = None,
+                        agent_id: Optional[str] = None, limit: int = 50) -> List[MemoryEntry]:
+        """
+        Rank memories by BM25 relevance to the words in a query
+        
+        Unlike search_memories, the query does not have to appear verbatim:
+        any memory containing one of its words matches, and memories
+        containing rarer words rank higher.
+        
+        Args:
+            query: Free text; punctuation is ignored
+            memory_type: Filter by memory type
+            agent_id: Filter by agent ID
+            limit: Maximum number of results
+            
+        Returns:
+            List of matching MemoryEntry objects, most relevant first
+        """
+        terms = _FTS_TERM.findall(query.lower())
+        if not terms:
+            return []
+        
+        params: list = [" OR ".join(f'"{term}"' for term in terms)]
+        sql = (
+            f"SELECT {_SELECT_COLUMNS} FROM memories JOIN "
+            "(SELECT rowid AS fts_rowid, rank FROM memories_fts WHERE memories_fts MATCH ?) "
+            "ON memories.rowid = fts_rowid WHERE 1=1"
+        )
+        if memory_type:
+            sql += " AND memory_type = ?"
+            params.append(memory_type.value)
+        if agent_id:
+            sql += " AND agent_id = ?"
+            params.append(agent_id)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        
+        try:
+            return list(self._iter_rows(sql, params))
+        except Exception as e:
+            print(f"Error searching memories by keyword: {e}")
             return []
     
     def get_timeline(self, agent_id: Optional[str] = None,
                     start_time: Optional[datetime] = None,
                     end_time: Optional[datetime] = None,
-                    limit: int = 100) -> List[MemoryEntry]:
+                    limit: int = 100, fields: Optional[Sequence[str]] = None
+                    ) -> List[Union[MemoryEntry, Dict[str, Any]]]:
         """
         Get chronological timeline of memories
         
@@ -193,36 +960,127 @@ class SQLiteStore(BaseStore):
             start_time: Start of time range
             end_time: End of time range
             limit: Maximum number of results
+            fields: Only read and decode these columns (e.g. ["timestamp", "content"]);
+                results are then dicts instead of MemoryEntry objects
             
         Returns:
-            List of MemoryEntry objects in chronological order
+            List of MemoryEntry objects (or dicts when fields is given) in chronological order
         """
+        fields = _normalize_fields(fields)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                sql = "SELECT id, content, memory_type, agent_id, session_id, timestamp, metadata, embedding, importance, tags, last_accessed FROM memories WHERE 1=1"
-                params = []
-                
-                if agent_id:
-                    sql += " AND agent_id = ?"
-                    params.append(agent_id)
-                
-                if start_time:
-                    sql += " AND timestamp >= ?"
-                    params.append(start_time.isoformat())
-                
-                if end_time:
-                    sql += " AND timestamp <= ?"
-                    params.append(end_time.isoformat())
-                
-                sql += " ORDER BY timestamp ASC LIMIT ?"
-                params.append(limit)
-                
-                cursor = conn.execute(sql, params)
-                return [self._row_to_memory_entry(row) for row in cursor.fetchall()]
+            return list(self.iter_timeline(
+                agent_id=agent_id,
+                start_time=start_time,
+                end_time=end_time,
+                limit=limit,
+                fields=fields
+            ))
         except Exception as e:
             print(f"Error getting timeline: {e}")
             return []
     
+    def iter_timeline(self, agent_id: Optional[str] = None,
+                      start_time: Optional[datetime] = None,
+                      end_time: Optional[datetime] = None,
+                      limit: int = 100, fields: Optional[Sequence[str]] = None
+                      ) -> Iterator[Union[MemoryEntry, Dict[str, Any]]]:
+        """
+        Lazily walk the chronological timeline of memories
+        
+        Takes the same filters as get_timeline, but yields entries as rows
+        are fetched instead of building the full result list. Database errors
+        are raised to the caller.
+        
+        Yields:
+            MemoryEntry objects (or dicts when fields is given) in chronological order
+        """
+        fields = _normalize_fields(fields)
+        params = []
+        
+        if agent_id:
+            params.append(agent_id)
+        
+        if start_time:
+            params.append(_to_us(start_time))
+        
+        if end_time:
+            params.append(_to_us(end_time))
+        
+        params.append(limit)
+        
+        sql = self._timeline_sql(fields, bool(agent_id), bool(start_time), bool(end_time))
+        yield from self._iter_rows(sql, params, fields)
+    
+    def _search_sql(self, fields: Optional[Tuple[str, ...]], has_query: bool,
+                    has_type: bool, has_agent: bool, has_session: bool) -> str:
+        """Build (once) the search statement for the given projection and active filters"""
+        key = ("search", fields, has_query, has_type, has_agent, has_session)
+        sql = self._stmt_cache.get(key)
+        if sql is None:
+            columns = ", ".join(fields) if fields else _SELECT_COLUMNS
+            sql = f"SELECT {columns} FROM memories WHERE 1=1"
+            if has_query:
+                # Plain substring scan; avoids LIKE's pattern matcher and treats
+                # % and _ in the query literally. lower() keeps LIKE's ASCII
+                # case-insensitivity.
+                sql += " AND instr(lower(content), lower(?)) > 0"
+            if has_type:
+                sql += " AND memory_type = ?"
+            if has_agent:
+                sql += " AND agent_id = ?"
+            if has_session:
+                sql += " AND session_id = ?"
+            sql += " ORDER BY ts_us DESC LIMIT ?"
+            self._stmt_cache[key] = sql
+        return sql
+    
+    def _timeline_sql(self, fields: Optional[Tuple[str, ...]], has_agent: bool,
+                      has_start: bool, has_end: bool) -> str:
+        """Build (once) the timeline statement for the given projection and active filters"""
+        key = ("timeline", fields, has_agent, has_start, has_end)
+        sql = self._stmt_cache.get(key)
+        if sql is None:
+            columns = ", ".join(fields) if fields else _SELECT_COLUMNS
+            sql = f"SELECT {columns} FROM memories WHERE 1=1"
+            if has_agent:
+                sql += " AND agent_id = ?"
+            if has_start:
+                sql += " AND ts_us >= ?"
+            if has_end:
+                sql += " AND ts_us <= ?"
+            sql += " ORDER BY ts_us ASC LIMIT ?"
+            self._stmt_cache[key] = sql
+        return sql
+    
+    def _iter_rows(self, sql: str, params: list,
+                   fields: Optional[Tuple[str, ...]] = None
+                   ) -> Iterator[Union[MemoryEntry, Dict[str, Any]]]:
+        """Execute a SELECT and yield decoded rows batch by batch"""
+        self._wait_for_writes()
+        conn = self._connect()
+        try:
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(_FETCH_BATCH_SIZE)
+                if not rows:
+                    break
+                if fields:
+                    for row in rows:
+                        yield self._row_to_partial(row, fields)
+                else:
+                    for row in rows:
+                        yield self._row_to_memory_entry(row)
+        finally:
+            conn.close()
+    
+    def _row_to_partial(self, row, fields: Tuple[str, ...]) -> Dict[str, Any]:
+        """Convert a projected database row to a dict of the requested fields"""
+        partial = {}
+        for name, value in zip(fields, row):
+            decoder = _FIELD_DECODERS[name]
+            partial[name] = decoder(value) if decoder is not None else value
+        return partial
+    
     def _row_to_memory_entry(self, row) -> MemoryEntry:
         """Convert database row to MemoryEntry"""
         # Handle both old and new schema (backward compatibility)
@@ -230,27 +1088,27 @@ class SQLiteStore(BaseStore):
             return MemoryEntry(
                 id=row[0],
                 content=row[1],
-                memory_type=MemoryType(row[2]),
-                agent_id=row[3],
-                session_id=row[4],
-                timestamp=datetime.fromisoformat(row[5]),
-                metadata=json.loads(row[6]) if row[6] else {},
-                embedding=json.loads(row[7]) if row[7] else None,
-                importance=row[8] if row[8] is not None else 5.0,
-                tags=json.loads(row[9]) if row[9] else [],
-                last_accessed=datetime.fromisoformat(row[10]) if row[10] else None
+                memory_type=_memory_type(row[2]),
+                agent_id=_intern_optional(row[3]),
+                session_id=_intern_optional(row[4]),
+                timestamp=_fromisoformat(row[5]),
+                metadata=_loads_dict(row[6]),
+                embedding=_loads_embedding(row[7]),
+                importance=_importance_or_default(row[8]),
+                tags=_loads_list(row[9]),
+                last_accessed=_parse_optional_datetime(row[10])
             )
         else:  # Old schema
-                            return MemoryEntry(
-                    id=row[0],
-                    content=row[1],
-                    memory_type=MemoryType(row[2]),
-                    agent_id=row[3],
-                    session_id=row[4],
-                    timestamp=datetime.fromisoformat(row[5]),
-                    metadata=json.loads(row[6]) if row[6] else {},
-                    embedding=json.loads(row[7]) if row[7] else None
-                )
+            return MemoryEntry(
+                id=row[0],
+                content=row[1],
+                memory_type=_memory_type(row[2]),
+                agent_id=_intern_optional(row[3]),
+                session_id=_intern_optional(row[4]),
+                timestamp=_fromisoformat(row[5]),
+                metadata=_loads_dict(row[6]),
+                embedding=_loads_embedding(row[7])
+            )
     
     def delete_memory(self, memory_id: str) -> bool:
         """
@@ -263,13 +1121,45 @@ class SQLiteStore(BaseStore):
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            self._wait_for_writes()
+            with self._write_connection() as conn:
+                conn.execute(_DELETE_METADATA_SQL, (memory_id,))
+                conn.execute(_DELETE_TAGS_SQL, (memory_id,))
                 cursor = conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
                 return cursor.rowcount > 0
         except Exception as e:
             print(f"Error deleting memory: {e}")
             return False
     
+    def count_memories(self, memory_type: Optional[MemoryType] = None,
+                       agent_id: Optional[str] = None) -> int:
+        """
+        Count memories matching the filters with SELECT COUNT(*)
+        
+        Args:
+            memory_type: Filter by memory type
+            agent_id: Filter by agent ID
+            
+        Returns:
+            Number of matching memories
+        """
+        conditions = []
+        params = []
+        if memory_type:
+            conditions.append("memory_type = ?")
+            params.append(memory_type.value)
+        if agent_id:
+            conditions.append("agent_id = ?")
+            params.append(agent_id)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        try:
+            self._wait_for_writes()
+            with self._connect() as conn:
+                return conn.execute(f"SELECT COUNT(*) FROM memories{where}", params).fetchone()[0]
+        except Exception as e:
+            print(f"Error counting memories: {e}")
+            return 0
+    
     def get_all_memories(self, limit: int = 10000) -> List[MemoryEntry]:
         """
         Get all memories in the system
@@ -1,9 +1,14 @@
+import importlib.util
 import os
 from typing import Optional, Dict, Any, List
 from .base_store import BaseStore
 from .sqlite_store import SQLiteStore
-from .pinecone_store import PineconeStore
-from .postgresql_store import PostgreSQLStore
+
+
+# Optional store dependencies, probed once at import without executing them;
+# their stores are only imported when one is created
+_HAS_PINECONE = importlib.util.find_spec("pinecone") is not None
+_HAS_PSYCOPG2 = importlib.util.find_spec("psycopg2") is not None
 
 
 class StoreFactory:
@@ -23,6 +28,7 @@ class StoreFactory:
             
         Raises:
             ValueError: If store_type is not supported
+            ImportError: If the client package for store_type is not installed
         """
         # Default to sqlite if no store_type provided
         if store_type is None:
@@ -33,8 +39,14 @@ class StoreFactory:
         if store_type == 'sqlite':
             return SQLiteStore(**kwargs)
         elif store_type == 'pinecone':
+            if not _HAS_PINECONE:
+                raise ImportError("Pinecone client not installed. Install with: pip install pinecone")
+            from .pinecone_store import PineconeStore
             return PineconeStore(**kwargs)
         elif store_type == 'postgresql':
+            if not _HAS_PSYCOPG2:
+                raise ImportError("PostgreSQL client not installed. Install with: pip install psycopg2-binary")
+            from .postgresql_store import PostgreSQLStore
             return PostgreSQLStore(**kwargs)
         else:
             raise ValueError(f"Unsupported store type: {store_type}. "
@@ -45,10 +57,18 @@ class StoreFactory:
         """
         Get list of available store types.
         
+        SQLite is always available; Pinecone and PostgreSQL are listed only
+        when their client packages are installed.
+        
         Returns:
             List of available store type names
         """
-        return ["sqlite", "pinecone", "postgresql"]
+        stores = ["sqlite"]
+        if _HAS_PINECONE:
+            stores.append("pinecone")
+        if _HAS_PSYCOPG2:
+            stores.append("postgresql")
+        return stores
     
     @staticmethod
     def create_store_from_env() -> BaseStore:
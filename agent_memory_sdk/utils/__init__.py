@@ -4,7 +4,7 @@ Utility functions for Agent Memory OS
 Provides helper functions for time handling, embeddings, and other utilities.
 """
 
-from .time_utils import format_timestamp, parse_timestamp
+from .time_utils import format_timestamp, parse_timestamp, new_session_id
 from .embedding_utils import generate_embedding, cosine_similarity
 
-__all__ = ["format_timestamp", "parse_timestamp", "generate_embedding", "cosine_similarity"] 
\ No newline at end of file
+__all__ = ["format_timestamp", "parse_timestamp", "new_session_id", "generate_embedding", "cosine_similarity"] 
\ No newline at end of file
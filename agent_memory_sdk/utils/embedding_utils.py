@@ -7,6 +7,13 @@ Provides helper functions for generating embeddings and calculating similarities
 import numpy as np
 from typing import List, Optional
 import hashlib
+import sys
+
+# Dimension of embeddings produced by the "simple" model
+EMBEDDING_DIMENSION = 1024
+
+# The hash is not used for security; ``usedforsecurity`` is only accepted on Python 3.9+
+_HASH_KWARGS = {"usedforsecurity": False} if sys.version_info >= (3, 9) else {}
 
 
 def generate_embedding(text: str, model: str = "simple") -> List[float]:
@@ -23,23 +30,14 @@ def generate_embedding(text: str, model: str = "simple") -> List[float]:
     if model == "simple":
         # Simple hash-based embedding for demo purposes
         # In production, use proper embedding models like OpenAI, sentence-transformers, etc.
-        hash_obj = hashlib.sha256(text.encode())
-        hash_hex = hash_obj.hexdigest()
-        
-        # Convert hex to list of floats
-        embedding = []
-        for i in range(0, len(hash_hex), 8):
-            chunk = hash_hex[i:i+8]
-            if len(chunk) == 8:
-                # Convert hex to float between -1 and 1
-                value = int(chunk, 16) / (16**8 - 1) * 2 - 1
-                embedding.append(value)
+        # BLAKE2b is faster than SHA-256 and the raw digest skips the hex round trip
+        digest = hashlib.blake2b(text.encode(), digest_size=32, **_HASH_KWARGS).digest()
         
-        # Pad or truncate to 1024 dimensions (for llama-text-embed-v2 compatibility)
-        while len(embedding) < 1024:
-            embedding.extend(embedding[:min(1024 - len(embedding), len(embedding))])
+        # Convert each 32-bit word to a float between -1 and 1
+        values = np.frombuffer(digest, dtype=">u4") / (2**32 - 1) * 2 - 1
         
-        return embedding[:1024]
+        # Repeat to 1024 dimensions (for llama-text-embed-v2 compatibility)
+        return np.resize(values, EMBEDDING_DIMENSION).tolist()
     
     else:
         raise ValueError(f"Unsupported embedding model: {model}")
@@ -100,14 +98,23 @@ def find_similar_embeddings(query_embedding: List[float],
     Returns:
         List of indices of similar embeddings
     """
-    similar_indices = []
+    if len(embeddings) == 0:
+        return []
     
-    for i, embedding in enumerate(embeddings):
-        similarity = cosine_similarity(query_embedding, embedding)
-        if similarity >= threshold:
-            similar_indices.append(i)
+    # Score every embedding with one matrix-vector product
+    query = np.asarray(query_embedding, dtype=np.float64)
+    try:
+        matrix = np.asarray(embeddings, dtype=np.float64)
+    except ValueError:
+        raise ValueError("Vectors must have the same length")
+    if matrix.ndim != 2 or matrix.shape[1] != query.shape[0]:
+        raise ValueError("Vectors must have the same length")
     
-    return similar_indices
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    dots = matrix @ query
+    # Zero-length vectors have similarity 0, as in cosine_similarity
+    similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
+    return np.flatnonzero(similarities >= threshold).tolist()
 
 
 def normalize_embedding(embedding: List[float]) -> List[float]:
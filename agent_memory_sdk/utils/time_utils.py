@@ -4,9 +4,20 @@ Time utility functions for Agent Memory OS
 Provides helper functions for timestamp formatting and parsing.
 """
 
+import itertools
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
+# Prefer the C-implemented ciso8601 parser when it is installed
+try:
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:
+    parse_iso_datetime = datetime.fromisoformat
+
+# Disambiguates session IDs created in the same clock tick
+_session_counter = itertools.count()
+
 
 def format_timestamp(dt: datetime, include_timezone: bool = True) -> str:
     """
@@ -35,7 +46,7 @@ def parse_timestamp(timestamp_str: str) -> Optional[datetime]:
         Parsed datetime object or None if invalid
     """
     try:
-        return datetime.fromisoformat(timestamp_str)
+        return parse_iso_datetime(timestamp_str)
     except ValueError:
         try:
             # Try parsing without timezone info
@@ -70,4 +81,17 @@ def is_recent(dt: datetime, hours: int = 24) -> bool:
         dt = dt.replace(tzinfo=timezone.utc)
     
     time_diff = now - dt
-    return time_diff.total_seconds() < (hours * 3600) 
\ No newline at end of file
+    return time_diff.total_seconds() < (hours * 3600) 
+
+
+def new_session_id() -> str:
+    """
+    Generate a unique session identifier
+    
+    Combines the wall clock in nanoseconds with a per-process counter, so
+    agents created within the same second (or clock tick) get distinct IDs.
+    
+    Returns:
+        Session ID of the form "session_<hex time>_<hex counter>"
+    """
+    return f"session_{time.time_ns():x}_{next(_session_counter):x}"
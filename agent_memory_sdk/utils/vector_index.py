@@ -0,0 +1,331 @@
+"""
+Vector index utilities for Agent Memory OS
+
+Provides in-memory nearest-neighbour indexes over memory embeddings.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+from .embedding_utils import EMBEDDING_DIMENSION
+
+# Rows scored per block when searching int8 codes, so the float32 copy stays small
+_SEARCH_BLOCK_ROWS = 4096
+
+# Smallest row capacity allocated once the brute-force index holds anything
+_MIN_CAPACITY = 64
+
+
+def _normalize_rows(embeddings: Sequence[Sequence[float]]) -> np.ndarray:
+    """Stack embeddings into a float32 matrix of unit-length rows"""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _last_per_id(memory_ids: Sequence[str], rows: np.ndarray) -> Tuple[List[str], np.ndarray]:
+    """Keep only the last row given for each memory ID, in input order"""
+    last = {memory_id: i for i, memory_id in enumerate(memory_ids)}
+    if len(last) == len(memory_ids):
+        return list(memory_ids), rows
+    keep = sorted(last.values())
+    return [memory_ids[i] for i in keep], rows[keep]
+
+
+def _quantize_rows(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Scale each row into int8 codes, returning the codes and per-row scales"""
+    scales = np.abs(matrix).max(axis=1) / 127
+    scales[scales == 0] = 1.0
+    codes = np.rint(matrix / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+class VectorIndex:
+    """Exact cosine-similarity index over memory embeddings (brute force)"""
+    
+    def __init__(self, dimension: int = EMBEDDING_DIMENSION, quantize: bool = False):
+        """
+        Initialize an empty index
+        
+        Args:
+            dimension: Length of the embeddings stored in the index
+            quantize: Store embeddings as int8 codes with one float32 scale per
+                row, a quarter of the memory at a small cost in score accuracy
+        """
+        self.dimension = dimension
+        self.quantize = quantize
+        # Row buffers with spare capacity; only the first len(self) rows are live
+        self._vectors = np.empty((0, dimension), dtype=np.int8 if quantize else np.float32)
+        self._scales = np.empty(0, dtype=np.float32)
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._rows
+    
+    def add(self, memory_ids: Sequence[str], embeddings: Sequence[Sequence[float]]):
+        """
+        Add (or replace) embeddings for the given memory IDs
+        
+        Args:
+            memory_ids: IDs of the memories, one per embedding; if an ID repeats,
+                its last embedding wins
+            embeddings: Embedding vectors
+        """
+        if len(memory_ids) == 0:
+            return
+        memory_ids, rows = _last_per_id(memory_ids, _normalize_rows(embeddings))
+        for memory_id in memory_ids:
+            self.remove(memory_id)
+        
+        start = len(self._ids)
+        end = start + len(rows)
+        self._reserve(end)
+        if self.quantize:
+            rows, scales = _quantize_rows(rows)
+            self._scales[start:end] = scales
+        self._vectors[start:end] = rows
+        for offset, memory_id in enumerate(memory_ids):
+            self._ids.append(memory_id)
+            self._rows[memory_id] = start + offset
+    
+    def _reserve(self, rows: int):
+        """Grow the row buffers to hold at least rows entries, doubling capacity"""
+        capacity = len(self._vectors)
+        if rows <= capacity:
+            return
+        self._resize(max(rows, capacity * 2, _MIN_CAPACITY))
+    
+    def _resize(self, capacity: int):
+        """Reallocate the row buffers with the given capacity, keeping the live rows"""
+        live = len(self._ids)
+        vectors = np.empty((capacity, self.dimension), dtype=self._vectors.dtype)
+        vectors[:live] = self._vectors[:live]
+        self._vectors = vectors
+        if self.quantize:
+            scales = np.empty(capacity, dtype=np.float32)
+            scales[:live] = self._scales[:live]
+            self._scales = scales
+    
+    def remove(self, memory_id: str) -> bool:
+        """
+        Remove a memory from the index
+        
+        Args:
+            memory_id: ID of the memory to remove
+        
+        Returns:
+            True if the memory was indexed, False otherwise
+        """
+        row = self._rows.pop(memory_id, None)
+        if row is None:
+            return False
+        
+        # Move the last row into the gap so the matrix stays dense
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._vectors[row] = self._vectors[last]
+            if self.quantize:
+                self._scales[row] = self._scales[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+        self._ids.pop()
+        
+        # Give memory back once the buffers are three-quarters empty; halving
+        # (not quartering) leaves room so alternating add/remove cannot thrash
+        capacity = len(self._vectors)
+        if capacity > _MIN_CAPACITY and last <= capacity // 4:
+            self._resize(capacity // 2)
+        return True
+    
+    def search(self, embedding: Sequence[float], k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Find the memories most similar to an embedding
+        
+        Args:
+            embedding: Query embedding
+            k: Maximum number of results
+        
+        Returns:
+            List of (memory ID, cosine similarity) pairs, most similar first
+        """
+        k = min(k, len(self._ids))
+        if k <= 0:
+            return []
+        
+        live = len(self._ids)
+        query = _normalize_rows(embedding)[0]
+        if self.quantize:
+            scores = np.empty(live, dtype=np.float32)
+            for start in range(0, live, _SEARCH_BLOCK_ROWS):
+                end = min(start + _SEARCH_BLOCK_ROWS, live)
+                scores[start:end] = self._vectors[start:end] @ query
+            scores *= self._scales[:live]
+        else:
+            scores = self._vectors[:live] @ query
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self._ids[row], float(scores[row])) for row in top]
+
+
+class HNSWVectorIndex(VectorIndex):
+    """Approximate cosine-similarity index backed by a FAISS HNSW graph"""
+    
+    def __init__(self, dimension: int = EMBEDDING_DIMENSION, m: int = 32,
+                 ef_construction: int = 200, ef_search: int = 64, quantize: bool = False):
+        """
+        Initialize an empty index
+        
+        Args:
+            dimension: Length of the embeddings stored in the index
+            m: Number of graph neighbours per node
+            ef_construction: Candidate list size while inserting
+            ef_search: Candidate list size while searching
+            quantize: Store embeddings as 8-bit scalar-quantized codes. The
+                quantizer range is trained on the first batch added (and
+                retrained whenever the graph is rebuilt).
+        """
+        if not FAISS_AVAILABLE:
+            raise ImportError("FAISS not installed. Install with: pip install faiss-cpu")
+        
+        self.dimension = dimension
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.quantize = quantize
+        self._labels: Dict[int, str] = {}
+        self._rows: Dict[str, int] = {}
+        self._next_label = 0
+        self._index = self._new_index()
+    
+    def _new_index(self):
+        """Create an empty HNSW index addressed by int64 labels"""
+        if self.quantize:
+            hnsw = faiss.IndexHNSWSQ(self.dimension, faiss.ScalarQuantizer.QT_8bit_uniform,
+                                     self.m, faiss.METRIC_INNER_PRODUCT)
+            # Widen the trained range so later batches are rarely clipped
+            faiss.downcast_index(hnsw.storage).sq.rangestat_arg = 0.2
+        else:
+            hnsw = faiss.IndexHNSWFlat(self.dimension, self.m, faiss.METRIC_INNER_PRODUCT)
+        hnsw.hnsw.efConstruction = self.ef_construction
+        hnsw.hnsw.efSearch = self.ef_search
+        return faiss.IndexIDMap2(hnsw)
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def add(self, memory_ids: Sequence[str], embeddings: Sequence[Sequence[float]]):
+        """
+        Add (or replace) embeddings for the given memory IDs
+        
+        Args:
+            memory_ids: IDs of the memories, one per embedding; if an ID repeats,
+                its last embedding wins
+            embeddings: Embedding vectors
+        """
+        if len(memory_ids) == 0:
+            return
+        memory_ids, vectors = _last_per_id(memory_ids, _normalize_rows(embeddings))
+        for memory_id in memory_ids:
+            self.remove(memory_id)
+        
+        labels = np.arange(self._next_label, self._next_label + len(memory_ids), dtype=np.int64)
+        self._next_label += len(memory_ids)
+        if not self._index.is_trained:
+            self._index.train(vectors)
+        self._index.add_with_ids(vectors, labels)
+        for label, memory_id in zip(labels.tolist(), memory_ids):
+            self._labels[label] = memory_id
+            self._rows[memory_id] = label
+    
+    def remove(self, memory_id: str) -> bool:
+        """
+        Remove a memory from the index
+        
+        HNSW graphs cannot drop nodes, so removed labels are skipped at search
+        time and the graph is rebuilt once they outnumber the live entries.
+        
+        Args:
+            memory_id: ID of the memory to remove
+        
+        Returns:
+            True if the memory was indexed, False otherwise
+        """
+        label = self._rows.pop(memory_id, None)
+        if label is None:
+            return False
+        
+        del self._labels[label]
+        if self._index.ntotal - len(self._labels) > max(len(self._labels), 1024):
+            self._rebuild()
+        return True
+    
+    def _rebuild(self):
+        """Rebuild the graph from the live entries only"""
+        labels = np.fromiter(self._labels, dtype=np.int64, count=len(self._labels))
+        vectors = np.empty((len(labels), self.dimension), dtype=np.float32)
+        for row, label in enumerate(labels.tolist()):
+            vectors[row] = self._index.reconstruct(label)
+        self._index = self._new_index()
+        if len(labels) and not self._index.is_trained:
+            self._index.train(vectors)
+        self._index.add_with_ids(vectors, labels)
+    
+    def search(self, embedding: Sequence[float], k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Find the memories most similar to an embedding
+        
+        Args:
+            embedding: Query embedding
+            k: Maximum number of results
+        
+        Returns:
+            List of (memory ID, cosine similarity) pairs, most similar first
+        """
+        if k <= 0 or not self._labels:
+            return []
+        
+        # Over-fetch by the number of removed labels still in the graph
+        fetch = min(k + self._index.ntotal - len(self._labels), self._index.ntotal)
+        scores, labels = self._index.search(_normalize_rows(embedding), fetch)
+        results = [
+            (self._labels[label], float(score))
+            for score, label in zip(scores[0].tolist(), labels[0].tolist())
+            if label in self._labels
+        ]
+        return results[:k]
+
+
+def create_vector_index(dimension: int = EMBEDDING_DIMENSION,
+                        use_faiss: Optional[bool] = None,
+                        quantize: bool = False) -> VectorIndex:
+    """
+    Create the best available vector index
+    
+    Args:
+        dimension: Length of the embeddings stored in the index
+        use_faiss: Force (True) or disable (False) FAISS; None uses it if installed
+        quantize: Store embeddings as 8-bit codes instead of float32
+    
+    Returns:
+        HNSWVectorIndex when FAISS is used, otherwise a brute-force VectorIndex
+    """
+    if use_faiss is None:
+        use_faiss = FAISS_AVAILABLE
+    if use_faiss:
+        return HNSWVectorIndex(dimension, quantize=quantize)
+    return VectorIndex(dimension, quantize=quantize)
@@ -5,22 +5,117 @@ Build and Distribution Script for Agent Memory OS
 This script builds the package and prepares it for PyPI distribution.
 """
 
+import argparse
+import hashlib
+import json
 import os
 import sys
 import subprocess
 import shutil
+import threading
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 
+# Files outside the package directory that change what gets built
+BUILD_INPUT_FILES = ["setup.py", "requirements.txt", "README.md", "LICENSE"]
+
+# Virtual environment reused by test_install across builds, one per Python version
+TEST_VENV_DIR = Path.home() / ".cache" / "agent_memory_os" / f"test_venv-py{sys.version_info[0]}.{sys.version_info[1]}"
+
+# Wheels (by content hash and Python version) that already passed test_install
+INSTALL_RESULTS_FILE = Path.home() / ".cache" / "agent_memory_os" / "install_results.json"
+
+# Lines of subprocess output kept for error reports
+OUTPUT_TAIL_LINES = 200
+
+
 class PackageBuilder:
     """Build and distribute the Agent Memory OS package"""
     
-    def __init__(self):
+    def __init__(self, jobs: int = None, verbose: bool = False, use_cache: bool = True):
+        # Reuse artifacts from earlier builds of identical sources
+        self.use_cache = use_cache
+        # Echo subprocess output live instead of only showing it on failure
+        self.verbose = verbose
+        # Maximum number of build steps/subprocesses run at the same time
+        self.jobs = jobs or os.cpu_count() or 1
         self.project_root = Path(__file__).parent
         self.dist_dir = self.project_root / "dist"
         self.build_dir = self.project_root / "build"
         self.egg_info_dir = self.project_root / "agent_memory_os.egg-info"
+        self.cache_dir = self.project_root / ".build_cache"
+        # Keeps output of concurrently running checks from interleaving mid-message
+        self._print_lock = threading.Lock()
+    
+    def _print(self, *lines):
+        """Print one or more lines as a single uninterrupted block"""
+        with self._print_lock:
+            for line in lines:
+                print(line)
+        
+    def _run_streaming(self, command, cwd=None, env=None):
+        """
+        Run a command, reading its combined output line by line
+        
+        Only the last OUTPUT_TAIL_LINES lines are kept (for error reports), so
+        memory stays bounded however much the command prints. With --verbose
+        every line is echoed as it arrives.
+        
+        Returns:
+            Tuple of (returncode, output tail as a single string)
+        """
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            bufsize=1, text=True, cwd=cwd, env=env
+        )
+        for line in process.stdout:
+            line = line.rstrip("\n")
+            tail.append(line)
+            if self.verbose:
+                self._print(line)
+        process.stdout.close()
+        return process.wait(), "\n".join(tail)
+    
+    def _run_hook(self, cmd, cwd=None, extra_environ=None):
+        """Run a PEP 517 backend hook subprocess (pyproject_hooks runner interface)"""
+        env = dict(os.environ, **(extra_environ or {}))
+        returncode, output = self._run_streaming(cmd, cwd=cwd, env=env)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd, output=output)
+    
+    def _source_hash(self):
+        """Hash the packaged sources and build inputs into a cache key"""
+        from setuptools import find_packages
         
+        digest = hashlib.blake2b(digest_size=16)
+        
+        # Hash every top-level package setup.py's find_packages() puts in the dists
+        roots = {name.split(".")[0] for name in find_packages(str(self.project_root))}
+        paths = []
+        stack = [self.project_root / root for root in sorted(roots)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != "__pycache__":
+                            stack.append(Path(entry.path))
+                    elif not entry.name.endswith((".pyc", ".pyo")):
+                        paths.append(Path(entry.path))
+        paths.extend(self.project_root / name for name in BUILD_INPUT_FILES)
+        
+        for path in sorted(paths):
+            if not path.exists():
+                continue
+            digest.update(path.relative_to(self.project_root).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
     def clean_build_dirs(self):
         """Clean build directories"""
         print("🧹 Cleaning build directories...")
@@ -28,47 +123,76 @@ class PackageBuilder:
         dirs_to_clean = [self.dist_dir, self.build_dir, self.egg_info_dir]
         for dir_path in dirs_to_clean:
             if dir_path.exists():
-                shutil.rmtree(dir_path)
+                self._remove_tree(dir_path)
                 print(f"  ✅ Cleaned {dir_path}")
     
+    def _remove_tree(self, path):
+        """
+        Delete a directory tree, unlinking its files in parallel
+        
+        Unlinking is syscall-bound, so a thread pool overlaps the latency of
+        the many small files under build/. Falls back to shutil.rmtree if
+        anything goes wrong.
+        """
+        try:
+            dirs, files = [], []
+            stack = [path]
+            while stack:
+                current = stack.pop()
+                dirs.append(current)
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            files.append(entry.path)
+            
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                list(executor.map(os.unlink, files))
+            
+            # Parents were visited before their children, so remove in reverse
+            for directory in reversed(dirs):
+                os.rmdir(directory)
+        except OSError:
+            shutil.rmtree(path)
+    
     def run_tests(self):
         """Run the comprehensive test suite"""
-        print("\n🧪 Running comprehensive test suite...")
+        self._print("\n🧪 Running comprehensive test suite...")
         
-        result = subprocess.run([
+        returncode, output = self._run_streaming([
             sys.executable, "run_tests.py"
-        ], capture_output=True, text=True, cwd=self.project_root)
-        
-        if result.returncode != 0:
-            print("❌ Tests failed! Cannot proceed with build.")
-            print("Test output:")
-            print(result.stdout)
-            print("Test errors:")
-            print(result.stderr)
+        ], cwd=self.project_root)
+        
+        if returncode != 0:
+            self._print(
+                "❌ Tests failed! Cannot proceed with build.",
+                "Test output:",
+                output,
+            )
             return False
         
-        print("✅ All tests passed!")
+        self._print("✅ All tests passed!")
         return True
     
     def check_setup(self):
         """Check setup.py configuration"""
-        print("\n📋 Checking setup.py configuration...")
+        self._print("\n📋 Checking setup.py configuration...")
         
         try:
             # Check if setup.py exists and is valid by running check command
-            result = subprocess.run([
+            returncode, output = self._run_streaming([
                 sys.executable, "setup.py", "check"
-            ], capture_output=True, text=True, cwd=self.project_root)
+            ], cwd=self.project_root)
             
-            if result.returncode != 0:
-                print(f"❌ setup.py has issues:")
-                print(result.stderr)
+            if returncode != 0:
+                self._print("❌ setup.py has issues:", output)
                 return False
             
-            print("✅ setup.py is valid")
+            self._print("✅ setup.py is valid")
             return True
         except Exception as e:
-            print(f"❌ setup.py check failed: {e}")
+            self._print(f"❌ setup.py check failed: {e}")
             return False
     
     def build_package(self):
@@ -78,28 +202,70 @@ class PackageBuilder:
         # Clean first
         self.clean_build_dirs()
         
-        # Build
-        result = subprocess.run([
-            sys.executable, "setup.py", "sdist", "bdist_wheel"
-        ], capture_output=True, text=True, cwd=self.project_root)
+        # Reuse the artifacts of a previous build of the same sources
+        cached_dir = self.cache_dir / self._source_hash() if self.use_cache else None
+        if cached_dir is not None and cached_dir.exists():
+            shutil.copytree(cached_dir, self.dist_dir)
+            print(f"✅ Reused cached build from {cached_dir}")
+            self._list_built_files()
+            return True
         
-        if result.returncode != 0:
+        try:
+            import build
+        except ImportError:
+            print("❌ The 'build' package is required. Install with: pip install build")
+            return False
+        try:
+            # Isolated envs shared across ProjectBuilders appeared in build 1.0
+            from build.env import DefaultIsolatedEnv  # noqa: F401
+        except ImportError:
+            print(f"❌ build>=1.0 is required, found {getattr(build, '__version__', 'an older version')}. "
+                  "Upgrade with: pip install --upgrade build")
+            return False
+        
+        try:
+            self._build_distributions(("sdist", "wheel"))
+        except Exception as e:
             print("❌ Build failed!")
             print("Build output:")
-            print(result.stdout)
-            print("Build errors:")
-            print(result.stderr)
+            # Backend errors wrap the CalledProcessError raised by _run_hook
+            print(getattr(getattr(e, "exception", None), "output", None) or e)
             return False
         
         print("✅ Package built successfully!")
         
-        # List built files
+        if cached_dir is not None:
+            shutil.copytree(self.dist_dir, cached_dir)
+        
+        self._list_built_files()
+        return True
+    
+    def _build_distributions(self, distributions):
+        """
+        Build each distribution in one shared isolated environment
+        
+        Unlike separate `python -m build` runs, the build backend and its
+        requirements are installed once and reused for every target.
+        """
+        from build import ProjectBuilder
+        from build.env import DefaultIsolatedEnv
+        
+        with warnings.catch_warnings(), DefaultIsolatedEnv() as env:
+            # Backend warnings are re-emitted in this process; only show them with --verbose
+            if not self.verbose:
+                warnings.simplefilter("ignore")
+            builder = ProjectBuilder.from_isolated_env(env, self.project_root, runner=self._run_hook)
+            env.install(builder.build_system_requires)
+            for distribution in distributions:
+                env.install(builder.get_requires_for_build(distribution))
+                builder.build(distribution, self.dist_dir)
+    
+    def _list_built_files(self):
+        """List the files in the dist directory"""
         if self.dist_dir.exists():
             print("\n📦 Built files:")
             for file_path in self.dist_dir.iterdir():
                 print(f"  📄 {file_path.name}")
-        
-        return True
     
     def check_package(self):
         """Check the built package"""
@@ -125,6 +291,28 @@ class PackageBuilder:
         print(f"✅ Found {len(wheel_files)} wheel file(s) and {len(source_files)} source distribution(s)")
         return True
     
+    def _venv_paths(self, venv_dir):
+        """Get the pip and python executables of a virtual environment"""
+        if os.name == 'nt':  # Windows
+            return venv_dir / "Scripts" / "pip", venv_dir / "Scripts" / "python"
+        # Unix/Linux/macOS
+        return venv_dir / "bin" / "pip", venv_dir / "bin" / "python"
+    
+    def _get_or_create_test_venv(self):
+        """
+        Get the cached test virtual environment, creating it if needed
+        
+        Returns:
+            Tuple of (venv path, True if the venv was just created)
+        """
+        _, python_path = self._venv_paths(TEST_VENV_DIR)
+        if python_path.exists():
+            return TEST_VENV_DIR, False
+        
+        import venv
+        venv.EnvBuilder(with_pip=True, symlinks=(os.name != 'nt')).create(TEST_VENV_DIR)
+        return TEST_VENV_DIR, True
+    
     def test_install(self):
         """Test installing the built package"""
         print("\n📥 Testing package installation...")
@@ -137,50 +325,106 @@ class PackageBuilder:
         
         wheel_file = wheel_files[0]
         
+        if self.use_cache:
+            # Reuse one venv across builds; only the first install resolves dependencies
+            venv_dir, created = self._get_or_create_test_venv()
+            
+            # A byte-identical wheel that already passed needs no re-test
+            wheel_key = self._wheel_key(wheel_file, venv_dir)
+            passed = self._load_install_results()
+            if wheel_key is not None and wheel_key in passed:
+                print(f"✅ Wheel {wheel_file.name} already passed installation testing")
+                return True
+            
+            install_args = [] if created else ["--force-reinstall", "--no-deps", "--quiet"]
+            if not self._install_and_import(venv_dir, wheel_file, install_args):
+                return False
+            
+            if wheel_key is not None:
+                passed[wheel_key] = wheel_file.name
+                self._save_install_results(passed)
+            return True
+        
         # Create a temporary virtual environment for testing
         import tempfile
         import venv
         
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_venv = Path(temp_dir) / "test_venv"
-            venv.create(temp_venv, with_pip=True)
-            
-            # Get pip and python paths
-            if os.name == 'nt':  # Windows
-                pip_path = temp_venv / "Scripts" / "pip"
-                python_path = temp_venv / "Scripts" / "python"
-            else:  # Unix/Linux/macOS
-                pip_path = temp_venv / "bin" / "pip"
-                python_path = temp_venv / "bin" / "python"
-            
-            # Install the package
-            result = subprocess.run([
-                str(pip_path), "install", str(wheel_file)
-            ], capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                print("❌ Package installation failed!")
-                print("Installation errors:")
-                print(result.stderr)
-                return False
-            
-            # Test import
-            result = subprocess.run([
-                str(python_path), "-c", "import agent_memory_sdk; print('✅ Import successful')"
-            ], capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                print("❌ Package import failed!")
-                print("Import errors:")
-                print(result.stderr)
-                return False
-            
-            print("✅ Package installation and import test passed!")
-            return True
+            venv.EnvBuilder(with_pip=True, symlinks=(os.name != 'nt')).create(temp_venv)
+            return self._install_and_import(temp_venv, wheel_file)
+    
+    def _wheel_key(self, wheel_file, venv_dir):
+        """
+        Identify a wheel by its contents and the Python version testing it
+        
+        The version is asked of the venv's own interpreter, since that is the
+        one the wheel gets installed into.
+        
+        Returns:
+            The key, or None if the venv's Python version could not be determined
+        """
+        _, python_path = self._venv_paths(venv_dir)
+        returncode, output = self._run_streaming([
+            str(python_path), "-I", "-c", "import sys; print('%d.%d' % sys.version_info[:2])"
+        ])
+        if returncode != 0:
+            return None
+        
+        digest = hashlib.sha256(wheel_file.read_bytes()).hexdigest()[:16]
+        return f"{digest}-py{output.strip()}"
+    
+    def _load_install_results(self):
+        """Load the record of wheels that passed test_install"""
+        try:
+            return json.loads(INSTALL_RESULTS_FILE.read_text())
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_install_results(self, results):
+        """Save the test_install record, replacing the file atomically"""
+        try:
+            INSTALL_RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = INSTALL_RESULTS_FILE.with_name(f"{INSTALL_RESULTS_FILE.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(results, indent=2))
+            os.replace(temp_file, INSTALL_RESULTS_FILE)
+        except OSError as e:
+            print(f"⚠️  Could not record install test result: {e}")
+    
+    def _install_and_import(self, venv_dir, wheel_file, install_args=()):
+        """Install the wheel into a virtual environment and import the package"""
+        pip_path, python_path = self._venv_paths(venv_dir)
+        
+        # Install the package (a prebuilt wheel needs no build env or pip self-check)
+        returncode, output = self._run_streaming([
+            str(pip_path), "install", "--no-build-isolation", "--disable-pip-version-check",
+            "--no-input", *install_args, str(wheel_file)
+        ])
+        
+        if returncode != 0:
+            print("❌ Package installation failed!")
+            print("Installation errors:")
+            print(output)
+            return False
+        
+        # Test import; -I skips user site-packages and keeps the current
+        # directory off sys.path, so the installed wheel is what gets imported
+        returncode, output = self._run_streaming([
+            str(python_path), "-I", "-c", "import agent_memory_sdk; print('✅ Import successful')"
+        ])
+        
+        if returncode != 0:
+            print("❌ Package import failed!")
+            print("Import errors:")
+            print(output)
+            return False
+        
+        print("✅ Package installation and import test passed!")
+        return True
     
     def validate_metadata(self):
         """Validate package metadata"""
-        print("\n📊 Validating package metadata...")
+        self._print("\n📊 Validating package metadata...")
         
         try:
             # Read setup.py to check for required fields
@@ -190,14 +434,14 @@ class PackageBuilder:
             required_fields = ['name=', 'version=', 'description=', 'author=']
             for field in required_fields:
                 if field not in setup_content:
-                    print(f"❌ Missing {field} in setup.py")
+                    self._print(f"❌ Missing {field} in setup.py")
                     return False
             
-            print("✅ Package metadata is valid")
+            self._print("✅ Package metadata is valid")
             return True
             
         except Exception as e:
-            print(f"❌ Metadata validation failed: {e}")
+            self._print(f"❌ Metadata validation failed: {e}")
             return False
     
     def prepare_for_upload(self):
@@ -223,14 +467,37 @@ class PackageBuilder:
         
         return True
     
+    def run_checks(self):
+        """Run the independent read-only checks concurrently"""
+        checks = {
+            "Running Tests": self.run_tests,
+            "Checking Setup": self.check_setup,
+            "Validating Metadata": self.validate_metadata,
+        }
+        
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(checks))) as executor:
+            futures = {executor.submit(check): name for name, check in checks.items()}
+            for future in as_completed(futures):
+                if not future.result():
+                    self._print(f"\n❌ Build process failed at: {futures[future]}")
+                    for pending in futures:
+                        pending.cancel()
+                    return False
+        
+        return True
+    
     def build_all(self):
         """Run the complete build process"""
         print("🔨 AGENT MEMORY OS - PACKAGE BUILD PROCESS")
         print("=" * 60)
         
+        # Phase 1: checks that don't depend on each other run in parallel
+        print(f"\n{'='*20} Running Checks {'='*20}")
+        if not self.run_checks():
+            return False
+        
+        # Phase 2: each step consumes the previous step's artifacts
         steps = [
-            ("Running Tests", self.run_tests),
-            ("Checking Setup", self.check_setup),
             ("Building Package", self.build_package),
             ("Checking Package", self.check_package),
             ("Testing Installation", self.test_install),
@@ -250,7 +517,16 @@ class PackageBuilder:
 
 def main():
     """Main entry point"""
-    builder = PackageBuilder()
+    parser = argparse.ArgumentParser(description="Build Agent Memory OS for distribution")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Maximum number of steps/builds to run in parallel (default: CPU count)")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Stream output from tests, builds and installs as it is produced")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always rebuild and test in a fresh virtualenv instead of reusing caches")
+    args = parser.parse_args()
+    
+    builder = PackageBuilder(jobs=args.jobs, verbose=args.verbose, use_cache=not args.no_cache)
     
     try:
         success = builder.build_all()
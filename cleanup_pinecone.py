@@ -4,6 +4,8 @@ Cleanup script to delete all existing Pinecone memories
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import pinecone
 from agent_memory_sdk import MemoryManager, MemoryType
 
@@ -28,7 +30,8 @@ def cleanup_pinecone():
     
     # List all indexes
     indexes = pc.list_indexes()
-    print(f"📋 Found {len(indexes.names())} indexes: {list(indexes.names())}")
+    existing = set(indexes.names())
+    print(f"📋 Found {len(existing)} indexes: {sorted(existing)}")
     
     # Delete specific indexes that we created
     indexes_to_delete = [
@@ -38,16 +41,25 @@ def cleanup_pinecone():
         "agent-memory-os"
     ]
     
+    targets = [index_name for index_name in indexes_to_delete if index_name in existing]
     for index_name in indexes_to_delete:
-        if index_name in indexes.names():
+        if index_name not in existing:
+            print(f"ℹ️  Index {index_name} not found, skipping")
+    
+    # Deletes are independent network round-trips, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(targets) or 1)) as executor:
+        futures = {}
+        for index_name in targets:
             print(f"🗑️  Deleting index: {index_name}")
+            futures[executor.submit(pc.delete_index, index_name)] = index_name
+        
+        for future in as_completed(futures):
+            index_name = futures[future]
             try:
-                pc.delete_index(index_name)
+                future.result()
                 print(f"✅ Deleted index: {index_name}")
             except Exception as e:
                 print(f"❌ Error deleting index {index_name}: {e}")
-        else:
-            print(f"ℹ️  Index {index_name} not found, skipping")
     
     print("\n🎉 Cleanup completed!")
     print("💡 You can now run the demo again with a fresh start")
@@ -4,8 +4,13 @@ Debug script to check Pinecone index status
 """
 
 import os
+import numpy as np
 import pinecone
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Probe vector for querying the 1024-dimension debug index, allocated once
+_ZERO_VEC = np.zeros(1024, dtype=np.float32)
 
 def debug_index():
     """Debug Pinecone index status"""
@@ -28,32 +33,41 @@ def debug_index():
     
     # List all indexes
     indexes = pc.list_indexes()
-    print(f"📋 Found {len(indexes.names())} indexes: {list(indexes.names())}")
+    names = set(indexes.names())
+    print(f"📋 Found {len(names)} indexes: {sorted(names)}")
     
     # Check specific index
     index_name = "debug-test"
-    if index_name in indexes.names():
+    if index_name in names:
         print(f"\n🔍 Checking index: {index_name}")
         
-        # Get index stats
-        try:
-            index = pc.Index(index_name)
-            stats = index.describe_index_stats()
-            print(f"✅ Index stats: {stats}")
-        except Exception as e:
-            print(f"❌ Error getting index stats: {e}")
+        index = pc.Index(index_name)
         
-        # Try to fetch any vectors
-        try:
-            # Try to get all vectors (this might not work with empty index)
-            response = index.query(
-                vector=[0] * 1024,
-                top_k=10,
-                include_metadata=True
-            )
-            print(f"✅ Query response: {len(response.get('matches', []))} matches")
-        except Exception as e:
-            print(f"❌ Error querying index: {e}")
+        # Stats and a probe query are independent round trips; run them together
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                executor.submit(index.describe_index_stats): "stats",
+                executor.submit(
+                    index.query,
+                    vector=_ZERO_VEC.tolist(),
+                    top_k=10,
+                    include_metadata=True
+                ): "query",
+            }
+            for future in as_completed(futures):
+                kind = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if kind == "stats":
+                        print(f"❌ Error getting index stats: {e}")
+                    else:
+                        print(f"❌ Error querying index: {e}")
+                    continue
+                if kind == "stats":
+                    print(f"✅ Index stats: {result}")
+                else:
+                    print(f"✅ Query response: {len(result.get('matches', []))} matches")
     else:
         print(f"❌ Index {index_name} not found")
 
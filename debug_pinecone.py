@@ -5,6 +5,18 @@ Debug script for Pinecone configuration
 
 import os
 import sys
+from types import MappingProxyType
+
+# Legacy Pinecone environment names and the region each one maps to
+ENV_TO_REGION = MappingProxyType({
+    "gcp-starter": "us-east1",
+    "gcp-west1-gcp": "us-west1",
+    "us-east1-gcp": "us-east1",
+    "us-west1-gcp": "us-west1",
+    "us-central1-gcp": "us-central1",
+    "eu-west1-gcp": "eu-west1",
+    "ap-southeast1-gcp": "ap-southeast1"
+})
 
 def debug_pinecone_config():
     """Debug Pinecone configuration"""
@@ -39,21 +51,12 @@ def debug_pinecone_config():
         
         # List existing indexes
         indexes = pc.list_indexes()
-        print(f"📋 Existing indexes: {list(indexes.names())}")
+        names = set(indexes.names())
+        print(f"📋 Existing indexes: {sorted(names)}")
         
         # Test environment mapping
-        env_to_region = {
-            "gcp-starter": "us-east1",
-            "gcp-west1-gcp": "us-west1",
-            "us-east1-gcp": "us-east1",
-            "us-west1-gcp": "us-west1",
-            "us-central1-gcp": "us-central1",
-            "eu-west1-gcp": "eu-west1",
-            "ap-southeast1-gcp": "ap-southeast1"
-        }
-        
-        if environment in env_to_region:
-            region = env_to_region[environment]
+        region = ENV_TO_REGION.get(environment)
+        if region:
             print(f"🗺️  Environment '{environment}' maps to region '{region}'")
         else:
             print(f"⚠️  Unknown environment '{environment}'")
@@ -40,21 +40,21 @@ def debug_pinecone_search():
     results = memory_manager.search_memory("artificial intelligence", limit=5)
     print(f"Search results: {len(results)} found")
     for i, result in enumerate(results):
-        print(f"  {i+1}. {result.content[:50]}...")
+        print(f"  {i+1}. {result.content:.50}...")
     
     # Try search without query (get all)
     print("\n🔍 Testing search without query...")
     all_results = memory_manager.search_memory("", limit=10)
     print(f"All memories: {len(all_results)} found")
     for i, result in enumerate(all_results):
-        print(f"  {i+1}. {result.content[:50]}...")
+        print(f"  {i+1}. {result.content:.50}...")
     
     # Check store directly
     print("\n🔍 Testing store directly...")
     store_results = memory_manager._store.search_memories(limit=10)
     print(f"Store search results: {len(store_results)} found")
     for i, result in enumerate(store_results):
-        print(f"  {i+1}. {result.content[:50]}...")
+        print(f"  {i+1}. {result.content:.50}...")
 
 if __name__ == "__main__":
     debug_pinecone_search() 
\ No newline at end of file
@@ -14,7 +14,9 @@ import json
 import time
 import subprocess
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
+from requests.adapters import HTTPAdapter
 
 from agent_memory_sdk.api import MemoryAPIClient, AsyncMemoryAPIClient
 from agent_memory_sdk.api.models import (
@@ -24,8 +26,52 @@ from agent_memory_sdk.api.models import (
 )
 from agent_memory_sdk.models import MemoryType
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def demo_direct_http_requests():
+try:
+    # libuv-based event loop; not available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Upper bound on in-flight requests issued by the async demo
+MAX_CONCURRENT_REQUESTS = 8
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize a request body, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def loads_json(content: bytes) -> Any:
+    """Parse a response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def pretty_json(data: Any) -> str:
+    """Format parsed JSON for display"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def create_client() -> MemoryAPIClient:
+    """Create the API client shared by the sync demos, with a keep-alive pool"""
+    client = MemoryAPIClient("http://localhost:8000")
+    client.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return client
+
+
+def demo_direct_http_requests(session: requests.Session):
     """Demo using direct HTTP requests"""
     print("🌐 Demo: Direct HTTP Requests")
     print("=" * 50)
@@ -34,9 +80,9 @@ def demo_direct_http_requests():
     
     # Health check
     print("1. Health Check")
-    response = requests.get(f"{base_url}/health")
+    response = session.get(f"{base_url}/health")
     print(f"   Status: {response.status_code}")
-    print(f"   Response: {json.dumps(response.json(), indent=2)}")
+    print(f"   Response: {pretty_json(loads_json(response.content))}")
     print()
     
     # Create a memory
@@ -49,9 +95,9 @@ def demo_direct_http_requests():
         "tags": ["preferences", "ui"],
         "metadata": {"source": "user_feedback"}
     }
-    response = requests.post(f"{base_url}/memories", json=memory_data)
+    response = session.post(f"{base_url}/memories", data=dumps_json(memory_data), headers=JSON_HEADERS)
     print(f"   Status: {response.status_code}")
-    created_memory = response.json()
+    created_memory = loads_json(response.content)
     print(f"   Created Memory ID: {created_memory['id']}")
     print()
     
@@ -61,34 +107,34 @@ def demo_direct_http_requests():
         "query": "user preferences",
         "limit": 5
     }
-    response = requests.post(f"{base_url}/memories/search", json=search_data)
+    response = session.post(f"{base_url}/memories/search", data=dumps_json(search_data), headers=JSON_HEADERS)
     print(f"   Status: {response.status_code}")
-    search_results = response.json()
+    search_results = loads_json(response.content)
     print(f"   Found {search_results['total_count']} memories")
     print(f"   Search time: {search_results['search_time_ms']:.2f}ms")
     print()
     
     # Quick search
     print("4. Quick Search")
-    response = requests.get(f"{base_url}/memories/search?q=dark mode")
+    response = session.get(f"{base_url}/memories/search?q=dark mode")
     print(f"   Status: {response.status_code}")
-    quick_results = response.json()
+    quick_results = loads_json(response.content)
     print(f"   Found {quick_results['total_count']} memories")
     print()
     
     # Get agent memories
     print("5. Get Agent Memories")
-    response = requests.get(f"{base_url}/agents/demo_agent/memories")
+    response = session.get(f"{base_url}/agents/demo_agent/memories")
     print(f"   Status: {response.status_code}")
-    agent_memories = response.json()
+    agent_memories = loads_json(response.content)
     print(f"   Agent has {agent_memories['total_count']} memories")
     print()
     
     # Get statistics
     print("6. Get Statistics")
-    response = requests.get(f"{base_url}/stats")
+    response = session.get(f"{base_url}/stats")
     print(f"   Status: {response.status_code}")
-    stats = response.json()
+    stats = loads_json(response.content)
     print(f"   Total memories: {stats['total_memories']}")
     print(f"   By type: {stats['by_type']}")
     print()
@@ -96,77 +142,102 @@ def demo_direct_http_requests():
     return created_memory['id']
 
 
-def demo_python_client():
+def demo_python_client(client: MemoryAPIClient):
     """Demo using the Python client library"""
     print("🐍 Demo: Python Client Library")
     print("=" * 50)
     
-    with MemoryAPIClient("http://localhost:8000") as client:
-        # Health check
-        print("1. Health Check")
-        health = client.health_check()
-        print(f"   Status: {health.status}")
-        print(f"   Version: {health.version}")
-        print(f"   Memory count: {health.memory_count}")
-        print()
-        
-        # Create memories
-        print("2. Create Multiple Memories")
-        memories = []
-        for i in range(3):
-            request = MemoryCreateRequest(
-                content=f"Memory {i+1}: This is a test memory for demonstration",
-                memory_type=MemoryType.EPISODIC if i % 2 == 0 else MemoryType.SEMANTIC,
-                agent_id="python_client_demo",
-                importance=7.0 + i,
-                tags=[f"demo_{i+1}", "test"],
-                metadata={"demo_round": i+1}
-            )
-            memory = client.create_memory(request)
-            memories.append(memory)
-            print(f"   Created memory {i+1}: {memory.id}")
-        print()
-        
-        # Search memories
-        print("3. Search Memories")
-        search_request = MemorySearchRequest(
-            query="test memory",
-            limit=10,
-            min_importance=5.0
+    # Health check
+    print("1. Health Check")
+    health = client.health_check()
+    print(f"   Status: {health.status}")
+    print(f"   Version: {health.version}")
+    print(f"   Memory count: {health.memory_count}")
+    print()
+    
+    # Create memories
+    print("2. Create Multiple Memories")
+    create_requests = [
+        MemoryCreateRequest(
+            content=f"Memory {i+1}: This is a test memory for demonstration",
+            memory_type=MemoryType.EPISODIC if i % 2 == 0 else MemoryType.SEMANTIC,
+            agent_id="python_client_demo",
+            importance=7.0 + i,
+            tags=[f"demo_{i+1}", "test"],
+            metadata={"demo_round": i+1}
         )
-        search_results = client.search_memories(search_request)
-        print(f"   Found {search_results.total_count} memories")
-        for memory in search_results.memories[:3]:  # Show first 3
-            print(f"   - {memory.content[:50]}... (importance: {memory.importance})")
-        print()
-        
-        # Update a memory
-        print("4. Update Memory")
-        if memories:
-            update_request = MemoryUpdateRequest(
-                content="Updated: This memory has been modified",
-                importance=9.0,
-                tags=["updated", "demo"]
-            )
-            updated_memory = client.update_memory(memories[0].id, update_request)
-            print(f"   Updated memory: {updated_memory.content[:50]}...")
-            print(f"   New importance: {updated_memory.importance}")
-            print()
-        
-        # Get agent memories
-        print("5. Get Agent Memories")
-        agent_memories = client.get_agent_memories("python_client_demo")
-        print(f"   Agent has {agent_memories.total_count} memories")
-        print(f"   Recent memories: {len(agent_memories.recent_memories)}")
-        print()
-        
-        # List memories with pagination
-        print("6. List Memories with Pagination")
-        all_memories = client.list_memories(skip=0, limit=5)
-        print(f"   Showing {len(all_memories['memories'])} of {all_memories['total_count']} memories")
-        for memory in all_memories['memories']:
-            print(f"   - {memory['content'][:40]}...")
+        for i in range(3)
+    ]
+    memories = client.create_memories(create_requests)
+    for i, memory in enumerate(memories):
+        print(f"   Created memory {i+1}: {memory.id}")
+    print()
+    
+    # Search memories
+    print("3. Search Memories")
+    search_request = MemorySearchRequest(
+        query="test memory",
+        limit=10,
+        min_importance=5.0
+    )
+    search_results = client.search_memories(search_request)
+    print(f"   Found {search_results.total_count} memories")
+    for memory in search_results.memories[:3]:  # Show first 3
+        print(f"   - {memory.content:.50}... (importance: {memory.importance})")
+    print()
+    
+    # Update a memory
+    print("4. Update Memory")
+    if memories:
+        update_request = MemoryUpdateRequest(
+            content="Updated: This memory has been modified",
+            importance=9.0,
+            tags=["updated", "demo"]
+        )
+        updated_memory = client.update_memory(memories[0].id, update_request)
+        print(f"   Updated memory: {updated_memory.content:.50}...")
+        print(f"   New importance: {updated_memory.importance}")
         print()
+    
+    # Get agent memories
+    print("5. Get Agent Memories")
+    agent_memories = client.get_agent_memories("python_client_demo")
+    print(f"   Agent has {agent_memories.total_count} memories")
+    print(f"   Recent memories: {len(agent_memories.recent_memories)}")
+    print()
+    
+    # List memories with pagination
+    print("6. List Memories with Pagination")
+    all_memories = client.list_memories(skip=0, limit=5)
+    print(f"   Showing {len(all_memories['memories'])} of {all_memories['total_count']} memories")
+    for memory in all_memories['memories']:
+        print(f"   - {memory['content']:.40}...")
+    print()
+
+
+def demo_bulk_create(client: MemoryAPIClient):
+    """Demo creating many memories with a single request"""
+    print("📦 Demo: Bulk Create")
+    print("=" * 50)
+    
+    create_requests = [
+        MemoryCreateRequest(
+            content=f"Bulk memory {i+1}: Imported in a single request",
+            memory_type=MemoryType.SEMANTIC,
+            agent_id="bulk_demo",
+            importance=5.0,
+            tags=["bulk"],
+            metadata={"position": i}
+        )
+        for i in range(32)
+    ]
+    
+    # N items, one round trip: the server saves them in one transaction
+    start = time.perf_counter()
+    memories = client.create_memories(create_requests)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"   Created {len(memories)} memories in {elapsed_ms:.2f}ms")
+    print()
 
 
 async def demo_async_client():
@@ -174,7 +245,9 @@ async def demo_async_client():
     print("⚡ Demo: Async Client Library")
     print("=" * 50)
     
-    async with AsyncMemoryAPIClient("http://localhost:8000") as client:
+    async with AsyncMemoryAPIClient(
+        "http://localhost:8000", max_connections=MAX_CONCURRENT_REQUESTS
+    ) as client:
         # Health check
         print("1. Health Check")
         health = await client.health_check()
@@ -182,32 +255,38 @@ async def demo_async_client():
         print(f"   Uptime: {health.uptime_seconds:.2f}s")
         print()
         
-        # Create memories concurrently
-        print("2. Create Memories Concurrently")
-        tasks = []
-        for i in range(3):
-            request = MemoryCreateRequest(
-                content=f"Async memory {i+1}: Created concurrently",
+        # Create memories in one request
+        print("2. Create Memories in Bulk")
+        create_requests = [
+            MemoryCreateRequest(
+                content=f"Async memory {i+1}: Created in bulk",
                 memory_type=MemoryType.SEMANTIC,
                 agent_id="async_demo",
                 importance=6.0 + i,
                 tags=["async", f"batch_{i+1}"],
                 metadata={"async_demo": True}
             )
-            tasks.append(client.create_memory(request))
-        
-        memories = await asyncio.gather(*tasks)
+            for i in range(3)
+        ]
+        memories = await client.create_memories(create_requests)
         for i, memory in enumerate(memories):
             print(f"   Created async memory {i+1}: {memory.id}")
         print()
         
         # Concurrent search operations
         print("3. Concurrent Search Operations")
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+        
         search_queries = ["async", "concurrent", "demo"]
-        search_tasks = [client.quick_search(query, limit=5) for query in search_queries]
-        search_results = await asyncio.gather(*search_tasks)
+        search_results = await asyncio.gather(
+            *(bounded(client.quick_search(query, limit=5)) for query in search_queries)
+        )
         
-        for i, (query, results) in enumerate(zip(search_queries, search_results)):
+        for query, results in zip(search_queries, search_results):
             print(f"   Query '{query}': {results.total_count} results")
         print()
         
@@ -226,35 +305,29 @@ async def demo_async_client():
         print()
 
 
-def demo_error_handling():
+def demo_error_handling(client: MemoryAPIClient):
     """Demo error handling"""
     print("⚠️  Demo: Error Handling")
     print("=" * 50)
     
-    with MemoryAPIClient("http://localhost:8000") as client:
-        # Try to get non-existent memory
-        print("1. Get Non-existent Memory")
-        try:
-            client.get_memory("non-existent-id")
-        except requests.exceptions.HTTPError as e:
-            print(f"   Expected error: {e.response.status_code} - {e.response.json()['error']}")
-        print()
-        
-        # Try to update non-existent memory
-        print("2. Update Non-existent Memory")
-        try:
-            update_request = MemoryUpdateRequest(content="This won't work")
-            client.update_memory("non-existent-id", update_request)
-        except requests.exceptions.HTTPError as e:
-            print(f"   Expected error: {e.response.status_code} - {e.response.json()['error']}")
-        print()
-        
-        # Try to delete non-existent memory
-        print("3. Delete Non-existent Memory")
-        try:
-            client.delete_memory("non-existent-id")
-        except requests.exceptions.HTTPError as e:
-            print(f"   Expected error: {e.response.status_code} - {e.response.json()['error']}")
+    update_request = MemoryUpdateRequest(content="This won't work")
+    checks = [
+        ("1. Get Non-existent Memory", lambda: client.get_memory("non-existent-id")),
+        ("2. Update Non-existent Memory", lambda: client.update_memory("non-existent-id", update_request)),
+        ("3. Delete Non-existent Memory", lambda: client.delete_memory("non-existent-id")),
+    ]
+    
+    # The calls are independent, so issue them together and report in order
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(call) for _, call in checks]
+    
+    for (title, _), future in zip(checks, futures):
+        print(title)
+        e = future.exception()
+        if isinstance(e, requests.exceptions.HTTPError):
+            print(f"   Expected error: {e.response.status_code} - {loads_json(e.response.content)['error']}")
+        elif e is not None:
+            raise e
         print()
 
 
@@ -264,52 +337,58 @@ def main():
     print("=" * 60)
     print()
     
-    # Check if server is running
-    try:
-        response = requests.get("http://localhost:8000/health", timeout=5)
-        if response.status_code == 200:
-            print("✅ API server is running!")
-        else:
-            print("❌ API server is not responding properly")
+    with create_client() as client:
+        # Check if server is running; the connection stays open for the demos
+        try:
+            response = client.session.get(f"{client.base_url}/health", timeout=5)
+            if response.status_code == 200:
+                print("✅ API server is running!")
+            else:
+                print("❌ API server is not responding properly")
+                return
+        except requests.exceptions.RequestException:
+            print("❌ API server is not running!")
+            print("   Please start the server first:")
+            print("   python run_api.py")
             return
-    except requests.exceptions.RequestException:
-        print("❌ API server is not running!")
-        print("   Please start the server first:")
-        print("   python run_api.py")
-        return
-    
-    print()
-    
-    # Run demos
-    try:
-        # Demo 1: Direct HTTP requests
-        memory_id = demo_direct_http_requests()
-        print()
         
-        # Demo 2: Python client
-        demo_python_client()
         print()
         
-        # Demo 3: Async client
-        asyncio.run(demo_async_client())
-        print()
+        # Run demos
+        try:
+            # Demo 1: Direct HTTP requests
+            memory_id = demo_direct_http_requests(client.session)
+            print()
         
-        # Demo 4: Error handling
-        demo_error_handling()
-        print()
+            # Demo 2: Python client
+            demo_python_client(client)
+            print()
         
-        print("🎉 All demos completed successfully!")
-        print()
-        print("📚 Next steps:")
-        print("   - Explore the API documentation at http://localhost:8000/docs")
-        print("   - Try the interactive API at http://localhost:8000/redoc")
-        print("   - Check the health endpoint at http://localhost:8000/health")
-        print("   - View statistics at http://localhost:8000/stats")
+            # Demo 3: Bulk create
+            demo_bulk_create(client)
+            print()
+        
+            # Demo 4: Async client
+            run = uvloop.run if uvloop is not None else asyncio.run
+            run(demo_async_client())
+            print()
+        
+            # Demo 5: Error handling
+            demo_error_handling(client)
+            print()
+        
+            print("🎉 All demos completed successfully!")
+            print()
+            print("📚 Next steps:")
+            print("   - Explore the API documentation at http://localhost:8000/docs")
+            print("   - Try the interactive API at http://localhost:8000/redoc")
+            print("   - Check the health endpoint at http://localhost:8000/health")
+            print("   - View statistics at http://localhost:8000/stats")
         
-    except Exception as e:
-        print(f"❌ Demo failed: {e}")
-        import traceback
-        traceback.print_exc()
+        except Exception as e:
+            print(f"❌ Demo failed: {e}")
+            import traceback
+            traceback.print_exc()
 
 
 if __name__ == "__main__":
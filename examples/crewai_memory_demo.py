@@ -7,12 +7,14 @@ to provide persistent memory across sessions.
 
 import sys
 import os
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 
 # Add the parent directory to the path so we can import our SDK
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from agent_memory_sdk import MemoryManager, MemoryEntry, MemoryType
+from agent_memory_sdk.utils import new_session_id
 
 
 class MemoryAwareAgent:
@@ -28,7 +30,7 @@ class MemoryAwareAgent:
         """
         self.agent_id = agent_id
         self.memory_manager = memory_manager
-        self.session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.session_id = new_session_id()
     
     def process_task(self, task: str) -> str:
         """
@@ -49,25 +51,26 @@ class MemoryAwareAgent:
             metadata={"task_type": "user_input"}
         )
         
-        # Search for relevant past memories
-        relevant_memories = self.memory_manager.search_memory(
-            query=task,
-            limit=5
-        )
-        
-        # Build context from relevant memories
-        context = self._build_context(relevant_memories)
+        # Pick the response first so memory is only searched when it is used
+        handler, uses_context = self._select_handler(task)
+        context = ""
+        if uses_context:
+            relevant_memories = self.memory_manager.search_similar(
+                query=task,
+                limit=5
+            )
+            context = self._build_context(relevant_memories)
         
         # Generate response (simplified for demo)
-        response = self._generate_response(task, context)
+        response = handler(self, task, context)
         
         # Store the response as episodic memory
         self.memory_manager.add_memory(
-            content=f"Generated response: {response}",
+            content=response,
             memory_type=MemoryType.EPISODIC,
             agent_id=self.agent_id,
             session_id=self.session_id,
-            metadata={"task_type": "response", "original_task": task}
+            metadata={"role": "assistant", "task_type": "response", "original_task": task}
         )
         
         return response
@@ -84,29 +87,49 @@ class MemoryAwareAgent:
             content=fact,
             memory_type=MemoryType.SEMANTIC,
             agent_id=self.agent_id,
-            metadata={"category": category, "learned_at": datetime.now().isoformat()}
+            metadata={"category": category, "learned_at_ns": time.time_ns()}
         )
         print(f"Learned fact: {fact}")
     
-    def get_timeline(self, hours: int = 24) -> list:
+    def learn_facts(self, facts: list):
+        """
+        Learn several facts at once with a single store write
+        
+        Args:
+            facts: List of (fact, category) pairs
+        """
+        learned_at_ns = time.time_ns()
+        self.memory_manager.add_memories([
+            {
+                "content": fact,
+                "memory_type": MemoryType.SEMANTIC,
+                "agent_id": self.agent_id,
+                "metadata": {"category": category, "learned_at_ns": learned_at_ns}
+            }
+            for fact, category in facts
+        ])
+        for fact, _ in facts:
+            print(f"Learned fact: {fact}")
+    
+    def get_timeline(self, hours: int = 24, limit: int = 100) -> list:
         """
         Get recent timeline of activities
         
         Args:
             hours: Number of hours to look back
+            limit: Maximum number of memories to return
             
         Returns:
             List of recent memories
         """
-        from datetime import timedelta
-        
         end_time = datetime.now()
         start_time = end_time - timedelta(hours=hours)
         
         return self.memory_manager.get_timeline(
             agent_id=self.agent_id,
             start_time=start_time,
-            end_time=end_time
+            end_time=end_time,
+            limit=limit
         )
     
     def _build_context(self, memories: list) -> str:
@@ -114,63 +137,89 @@ class MemoryAwareAgent:
         if not memories:
             return "No relevant past context found."
         
-        context_parts = ["Relevant past context:"]
-        for memory in memories:
-            context_parts.append(f"- {memory.content} ({memory.timestamp.strftime('%Y-%m-%d %H:%M')})")
-        
-        return "\n".join(context_parts)
+        return "Relevant past context:\n" + "\n".join(
+            f"- {m.content} ({m.timestamp:%Y-%m-%d %H:%M})" for m in memories
+        )
     
-    def _generate_response(self, task: str, context: str) -> str:
-        """Generate response based on task and context"""
-        # This is a simplified response generator
-        # In a real implementation, this would use an LLM
+    def _select_handler(self, task: str):
+        """
+        Pick the response handler for a task
+        
+        This is a simplified keyword classifier; in a real implementation an
+        LLM would generate the response.
         
-        if "hello" in task.lower():
-            return f"Hello! I'm agent {self.agent_id}. I have access to my memory and can help you with tasks."
-        elif "remember" in task.lower():
-            return f"I can remember things! Here's some context from my memory:\n{context}"
-        elif "timeline" in task.lower():
-            timeline = self.get_timeline()
-            if timeline:
-                return f"Here's my recent timeline:\n" + "\n".join([
-                    f"- {m.content} ({m.timestamp.strftime('%H:%M')})" 
-                    for m in timeline[:5]
-                ])
-            else:
-                return "No recent activities in my timeline."
-        else:
-            return f"I processed your task: '{task}'. I have access to my memory and can learn from our interactions."
+        Returns:
+            (handler, whether the handler reads the memory context)
+        """
+        task_lower = task.lower()
+        for keyword, handler, uses_context in self._RESPONSE_HANDLERS:
+            if keyword in task_lower:
+                return handler, uses_context
+        return MemoryAwareAgent._respond_default, False
+    
+    def _respond_default(self, task: str, context: str) -> str:
+        """Acknowledge a task without a dedicated handler"""
+        return f"I processed your task: '{task}'. I have access to my memory and can learn from our interactions."
+    
+    def _respond_hello(self, task: str, context: str) -> str:
+        """Greet the user"""
+        return f"Hello! I'm agent {self.agent_id}. I have access to my memory and can help you with tasks."
+    
+    def _respond_remember(self, task: str, context: str) -> str:
+        """Answer with the retrieved memory context"""
+        return f"I can remember things! Here's some context from my memory:\n{context}"
+    
+    def _respond_timeline(self, task: str, context: str) -> str:
+        """List the agent's most recent activities"""
+        timeline = self.get_timeline(limit=5)
+        if not timeline:
+            return "No recent activities in my timeline."
+        return "Here's my recent timeline:\n" + "\n".join(
+            f"- {m.content} ({m.timestamp:%H:%M})" for m in timeline
+        )
+    
+    # (keyword, response handler, reads memory context), checked in order
+    # against the lowercased task
+    _RESPONSE_HANDLERS = (
+        ("hello", _respond_hello, False),
+        ("remember", _respond_remember, True),
+        ("timeline", _respond_timeline, False),
+    )
 
 
 def demo_basic_memory():
     """Demonstrate basic memory functionality"""
     print("=== Agent Memory OS Demo ===\n")
     
-    # Initialize memory manager
-    memory_manager = MemoryManager()
+    # Initialize memory manager with an in-memory vector index for similarity search
+    memory_manager = MemoryManager(vector_index=True)
     
     # Create an agent with memory
     agent = MemoryAwareAgent("demo_agent", memory_manager)
     
     # Learn some facts
     print("Learning some facts...")
-    agent.learn_fact("The user prefers to work in the morning", "preferences")
-    agent.learn_fact("Python is the primary programming language used", "technical")
-    agent.learn_fact("The project is called Agent Memory OS", "project")
+    agent.learn_facts([
+        ("The user prefers to work in the morning", "preferences"),
+        ("Python is the primary programming language used", "technical"),
+        ("The project is called Agent Memory OS", "project"),
+    ])
     
     print("\n" + "="*50 + "\n")
     
     # Simulate some interactions
     print("Simulating agent interactions...")
     
-    responses = [
-        agent.process_task("Hello, can you help me?"),
-        agent.process_task("What do you remember about me?"),
-        agent.process_task("Show me your recent timeline"),
-        agent.process_task("What programming language do I use?"),
+    tasks = [
+        "Hello, can you help me?",
+        "What do you remember about me?",
+        "Show me your recent timeline",
+        "What programming language do I use?",
     ]
     
-    for i, response in enumerate(responses, 1):
+    # Print each response as soon as it is ready
+    for i, task in enumerate(tasks, 1):
+        response = agent.process_task(task)
         print(f"Interaction {i}:")
         print(f"Response: {response}")
         print("-" * 30)
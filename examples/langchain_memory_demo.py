@@ -8,6 +8,7 @@ chains, and tools for persistent memory capabilities.
 import sys
 import os
 from datetime import datetime
+from functools import lru_cache
 
 # Add the parent directory to the path so we can import our SDK
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -26,12 +27,19 @@ from agent_memory_sdk import (
 )
 
 
+@lru_cache(maxsize=None)
+def get_memory_manager() -> MemoryManager:
+    """Return the memory manager shared by all the demos"""
+    # Each demo uses its own agent_id, so one manager (and one vector index)
+    # serves them all; the vector index enables MemoryChain's hybrid search
+    return MemoryManager(vector_index=True)
+
+
 def demo_memory_chain():
     """Demonstrate MemoryChain integration"""
     print("=== MemoryChain Demo ===\n")
     
-    # Initialize memory manager
-    memory_manager = MemoryManager()
+    memory_manager = get_memory_manager()
     
     # Create a simple LLM (you can replace this with any LangChain LLM)
     from langchain_community.llms.fake import FakeListLLM
@@ -49,14 +57,17 @@ def demo_memory_chain():
         llm=llm,
         agent_id="demo_chain",
         retrieve_memories=True,
-        memory_limit=3
+        memory_limit=3,
+        hybrid_search=True
     )
     
     # Learn some facts first
     print("Learning some facts...")
-    memory_chain.learn_fact("The user prefers Python programming", "preferences")
-    memory_chain.learn_fact("The user is working on Agent Memory OS project", "project")
-    memory_chain.learn_fact("The user is interested in AI agents and memory systems", "interests")
+    memory_chain.learn_facts([
+        ("The user prefers Python programming", "preferences"),
+        ("The user is working on Agent Memory OS project", "project"),
+        ("The user is interested in AI agents and memory systems", "interests"),
+    ])
     
     print("\n" + "="*50 + "\n")
     
@@ -88,8 +99,7 @@ def demo_memory_tool():
     """Demonstrate MemoryTool integration"""
     print("\n=== MemoryTool Demo ===\n")
     
-    # Initialize memory manager
-    memory_manager = MemoryManager()
+    memory_manager = get_memory_manager()
     
     # Create memory tool
     memory_tool = MemoryTool(
@@ -117,8 +127,7 @@ def demo_memory_callback():
     """Demonstrate MemoryCallbackHandler integration"""
     print("\n=== MemoryCallbackHandler Demo ===\n")
     
-    # Initialize memory manager
-    memory_manager = MemoryManager()
+    memory_manager = get_memory_manager()
     
     # Create memory callback handler
     memory_callback = MemoryCallbackHandler(
@@ -161,8 +170,7 @@ def demo_memory_aware_agent():
     """Demonstrate MemoryAwareAgent integration with a simpler LLMChain approach"""
     print("\n=== MemoryAwareAgent Demo (Simple LLMChain Pattern) ===\n")
     
-    # Initialize memory manager
-    memory_manager = MemoryManager()
+    memory_manager = get_memory_manager()
     
     # Create a simple LLM
     from langchain_community.llms.fake import FakeListLLM
@@ -205,8 +213,10 @@ Please provide a helpful response that takes into account the memory context whe
     
     # Learn some facts
     print("Teaching the agent some facts...")
-    memory_agent.learn_fact("The user is testing simple memory-aware agents", "testing")
-    memory_agent.learn_fact("The user prefers Python over JavaScript", "preferences")
+    memory_agent.learn_facts([
+        ("The user is testing simple memory-aware agents", "testing"),
+        ("The user prefers Python over JavaScript", "preferences"),
+    ])
     
     print("\n" + "="*50 + "\n")
     
@@ -239,8 +249,7 @@ def demo_integration_workflow():
     """Demonstrate a complete workflow using all integration components"""
     print("\n=== Complete Integration Workflow Demo ===\n")
     
-    # Initialize shared memory manager
-    memory_manager = MemoryManager()
+    memory_manager = get_memory_manager()
     
     # Create a simple LLM
     from langchain_community.llms.fake import FakeListLLM
@@ -262,9 +271,11 @@ def demo_integration_workflow():
     
     # Learn initial facts
     print("Setting up initial knowledge...")
-    memory_chain.learn_fact("The user is building an AI memory system", "project")
-    memory_chain.learn_fact("The user prefers Python for development", "preferences")
-    memory_chain.learn_fact("The user is interested in LangChain integration", "interests")
+    memory_chain.learn_facts([
+        ("The user is building an AI memory system", "project"),
+        ("The user prefers Python for development", "preferences"),
+        ("The user is interested in LangChain integration", "interests"),
+    ])
     
     print("\n" + "="*50 + "\n")
     
@@ -298,13 +309,19 @@ if __name__ == "__main__":
     print("LangChain Memory Integration Demo")
     print("=" * 50)
     
+    demos = [
+        demo_memory_chain,
+        demo_memory_tool,
+        demo_memory_callback,
+        demo_memory_aware_agent,
+        demo_integration_workflow,
+    ]
+    
     try:
-        # Run all demos
-        demo_memory_chain()
-        demo_memory_tool()
-        demo_memory_callback()
-        demo_memory_aware_agent()
-        demo_integration_workflow()
+        # Run in order in this process, so every demo reuses the one memory
+        # manager (and vector index) instead of each rebuilding it
+        for demo in demos:
+            demo()
         
         print("\n" + "="*50)
         print("All demos completed successfully!")
@@ -6,9 +6,12 @@ This demo showcases the integration of Agent Memory OS with LangGraph,
 demonstrating how to create memory-aware workflows and state machines.
 """
 
+import asyncio
 import os
 import sys
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
 
 # Add the parent directory to the path to import the SDK
@@ -33,14 +36,34 @@ from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
 import uuid
 
 
+# Turns of conversation history kept in the workflow state; older turns are
+# dropped (they remain in memory storage)
+MAX_HISTORY_TURNS = 1024
+
+
+@lru_cache(maxsize=None)
+def get_chat_model(model: str = "gpt-3.5-turbo", temperature: float = 0):
+    """Return one ChatOpenAI client per (model, temperature) for this process"""
+    # Reusing the client keeps its HTTP connection pool (and TLS sessions) warm
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(model=model, temperature=temperature,
+                      openai_api_key=os.environ["OPENAI_API_KEY"])
+
+
+async def invoke_concurrently(compiled_graph, inputs):
+    """Invoke a compiled graph on independent inputs at the same time."""
+    return await asyncio.gather(*(compiled_graph.ainvoke(state) for state in inputs))
+
+
 def demo_basic_memory_graph():
     """Demo 1: Basic memory graph with simple state management."""
     print("\n" + "="*60)
     print("DEMO 1: Basic Memory Graph")
     print("="*60)
     
-    # Initialize memory manager
-    memory_manager = MemoryManager()
+    # Initialize memory manager; nodes only queue their writes, which a
+    # background thread commits in batches
+    memory_manager = MemoryManager(write_behind=True)
     
     # Create memory graph
     memory_graph = MemoryGraph(
@@ -78,12 +101,17 @@ def demo_basic_memory_graph():
     # Compile the graph
     compiled_graph = graph.compile()
     
-    # Run the graph
+    # Run the graph on independent inputs concurrently
     print("Running basic memory graph...")
-    result = compiled_graph.invoke({"input": "Hello, this is my first memory!"})
-    print(f"Result: {result}")
-    
-    # Check memory
+    inputs = [
+        {"input": "Hello, this is my first memory!"},
+        {"input": "And this is another, unrelated memory."},
+    ]
+    for result in asyncio.run(invoke_concurrently(compiled_graph, inputs)):
+        print(f"Result: {result}")
+    
+    # Check memory once the queued writes are committed
+    memory_manager.flush()
     memories = memory_graph.search_memories("first memory")
     print(f"Found memories: {memories}")
     
@@ -159,16 +187,12 @@ def demo_memory_tools():
         "id": tool_call_id2,
         "type": "tool_call"
     }
-    print("\nSearching memories...")
     state2 = {
         "messages": [
             HumanMessage(content="Search for memories about Python programming."),
             AIMessage(content="", tool_calls=[tool_call2])
         ]
     }
-    result2 = compiled_graph.invoke(state2)
-    print(f"Search result: {result2}")
-    
     # Prepare a tool call for get_memory_stats
     tool_call_id3 = str(uuid.uuid4())
     tool_call3 = {
@@ -177,15 +201,18 @@ def demo_memory_tools():
         "id": tool_call_id3,
         "type": "tool_call"
     }
-    print("\nGetting memory stats...")
     state3 = {
         "messages": [
             HumanMessage(content="Get memory stats."),
             AIMessage(content="", tool_calls=[tool_call3])
         ]
     }
-    result3 = compiled_graph.invoke(state3)
-    print(f"Stats result: {result3}")
+    
+    # Both calls only read what store_memory wrote, so they run concurrently
+    print("\nSearching memories and getting memory stats...")
+    result2, result3 = asyncio.run(invoke_concurrently(compiled_graph, [state2, state3]))
+    print(f"Search result: {result2}")
+    print(f"\nStats result: {result3}")
 
 
 def demo_agent_with_memory():
@@ -210,9 +237,8 @@ def demo_agent_with_memory():
         print("OPENAI_API_KEY is not set. Please set it to run this demo.")
         return
     
-    # Use actual OpenAI LLM
-    from langchain_openai import ChatOpenAI
-    llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0, openai_api_key=openai_api_key)
+    # Use actual OpenAI LLM, shared with any other caller in this process
+    llm = get_chat_model()
     
     # Create a prompt template
     prompt = ChatPromptTemplate.from_messages([
@@ -276,8 +302,8 @@ def demo_memory_state():
     print("DEMO 4: Memory State in Workflows")
     print("="*60)
     
-    # Initialize memory manager
-    memory_manager = MemoryManager()
+    # Initialize memory manager; message writes are queued off the node's path
+    memory_manager = MemoryManager(write_behind=True)
     agent_id = "demo_agent_4"
     session_id = "session_4"
     
@@ -288,7 +314,11 @@ def demo_memory_state():
     def process_message(state: dict) -> dict:
         """Process a message and store it in memory."""
         message = state.get("message", "")
-        conversation_history = state.get("conversation_history", [])
+        # A bounded deque: appends are O(1) and the history never outgrows
+        # MAX_HISTORY_TURNS, however long the session runs
+        conversation_history = state.get("conversation_history")
+        if not isinstance(conversation_history, deque):
+            conversation_history = deque(conversation_history or (), maxlen=MAX_HISTORY_TURNS)
         user_preferences = state.get("user_preferences", {})
         
         # Store the message
@@ -324,13 +354,15 @@ def demo_memory_state():
         conversation_history = state.get("conversation_history", [])
         user_preferences = state.get("user_preferences", {})
         
-        # Search for preference-related memories
+        # Search for this agent's preference-related memories, including the
+        # ones process_message just queued
+        memory_manager.flush()
         preferences = memory_manager.search_memory(
             query="prefer like want need",
+            agent_id=agent_id,
             limit=5
         )
-        # Filter to only include memories for this agent
-        preference_contents = [m.content for m in preferences if m.agent_id == agent_id]
+        preference_contents = [m.content for m in preferences]
         if preference_contents:
             user_preferences["extracted"] = preference_contents
             memory_manager.add_memory(
@@ -362,7 +394,7 @@ def demo_memory_state():
     # First message
     result1 = compiled_graph.invoke({
         "message": "I prefer dark chocolate over milk chocolate",
-        "conversation_history": [],
+        "conversation_history": deque(maxlen=MAX_HISTORY_TURNS),
         "user_preferences": {}
     })
     print(f"Response: {result1.get('response')}")
@@ -370,7 +402,7 @@ def demo_memory_state():
     # Second message
     result2 = compiled_graph.invoke({
         "message": "I also like coffee in the morning",
-        "conversation_history": result1.get("conversation_history", []),
+        "conversation_history": result1.get("conversation_history", deque(maxlen=MAX_HISTORY_TURNS)),
         "user_preferences": result1.get("user_preferences", {})
     })
     print(f"Response: {result2.get('response')}")
@@ -379,8 +411,8 @@ def demo_memory_state():
     print(f"Extracted preferences: {result2.get('user_preferences')}")
     
     # Get memory stats
-    stats = memory_manager.get_episodic_memories(agent_id=agent_id, limit=1000)
-    print(f"Memory stats: {{'episodic_memories': {len(stats)}}}")
+    episodic_count = memory_manager.count_memories(agent_id=agent_id, memory_type=MemoryType.EPISODIC)
+    print(f"Memory stats: {{'episodic_memories': {episodic_count}}}")
 
 
 def main():
@@ -26,28 +26,30 @@ async def main():
     
     # Add some sample memories
     print("📝 Adding sample memories...")
-    memory_manager.add_memory(
-        content="User prefers dark mode in applications",
-        memory_type=MemoryType.SEMANTIC,
-        agent_id="demo-agent",
-        importance=8.0,
-        tags=["preferences", "ui"]
-    )
-    memory_manager.add_memory(
-        content="User asked about Python async programming",
-        memory_type=MemoryType.EPISODIC,
-        agent_id="demo-agent",
-        importance=7.0,
-        tags=["programming", "python"]
-    )
-    memory_manager.add_memory(
-        content="User's birthday is March 15th",
-        memory_type=MemoryType.SEMANTIC,
-        agent_id="demo-agent",
-        importance=9.0,
-        tags=["personal", "birthday"]
-    )
-    print(f"✅ Added {len(memory_manager.get_all_memories())} sample memories")
+    memory_manager.add_memories([
+        {
+            "content": "User prefers dark mode in applications",
+            "memory_type": MemoryType.SEMANTIC,
+            "agent_id": "demo-agent",
+            "importance": 8.0,
+            "tags": ["preferences", "ui"]
+        },
+        {
+            "content": "User asked about Python async programming",
+            "memory_type": MemoryType.EPISODIC,
+            "agent_id": "demo-agent",
+            "importance": 7.0,
+            "tags": ["programming", "python"]
+        },
+        {
+            "content": "User's birthday is March 15th",
+            "memory_type": MemoryType.SEMANTIC,
+            "agent_id": "demo-agent",
+            "importance": 9.0,
+            "tags": ["personal", "birthday"]
+        },
+    ])
+    print(f"✅ Added sample memories ({memory_manager.count_memories()} stored in total)")
     
     # Create MCP server
     print("🔧 Creating MCP server...")
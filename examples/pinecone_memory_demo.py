@@ -13,6 +13,11 @@ from datetime import datetime, timedelta
 from agent_memory_sdk import MemoryManager, MemoryType, StoreFactory
 
 
+def _preview(text: str, width: int = 60) -> str:
+    """Shorten text for display, adding an ellipsis only when it was cut"""
+    return text if len(text) <= width else text[:width] + "..."
+
+
 def check_pinecone_setup():
     """Check if Pinecone is properly configured"""
     api_key = os.getenv("PINECONE_API_KEY")
@@ -69,16 +74,20 @@ def demo_pinecone_memory():
             "John shared his experience with transformer architectures"
         ]
         
+        # One store write for the whole list
+        memory_manager.add_memories([
+            {
+                "content": content,
+                "memory_type": MemoryType.EPISODIC,
+                "agent_id": "demo-agent",
+                "session_id": "conversation-1",
+                "importance": 7.0,
+                "tags": ["conversation", "john", "ml"]
+            }
+            for content in episodic_memories
+        ])
         for i, content in enumerate(episodic_memories, 1):
-            memory = memory_manager.add_memory(
-                content=content,
-                memory_type=MemoryType.EPISODIC,
-                agent_id="demo-agent",
-                session_id="conversation-1",
-                importance=7.0,
-                tags=["conversation", "john", "ml"]
-            )
-            print(f"   {i}. Added episodic memory: {content[:50]}...")
+            print(f"   {i}. Added episodic memory: {_preview(content, 50)}")
         
         # Semantic memories (facts)
         semantic_memories = [
@@ -89,15 +98,18 @@ def demo_pinecone_memory():
             "Computer vision deals with understanding visual information"
         ]
         
+        memory_manager.add_memories([
+            {
+                "content": content,
+                "memory_type": MemoryType.SEMANTIC,
+                "agent_id": "demo-agent",
+                "importance": 8.0,
+                "tags": ["fact", "ml", "ai"]
+            }
+            for content in semantic_memories
+        ])
         for i, content in enumerate(semantic_memories, 1):
-            memory = memory_manager.add_memory(
-                content=content,
-                memory_type=MemoryType.SEMANTIC,
-                agent_id="demo-agent",
-                importance=8.0,
-                tags=["fact", "ml", "ai"]
-            )
-            print(f"   {i+5}. Added semantic memory: {content[:50]}...")
+            print(f"   {i+5}. Added semantic memory: {_preview(content, 50)}")
         
         # Demo 2: Semantic Search
         print("\n🔍 Demo 2: Semantic Search")
@@ -110,12 +122,13 @@ def demo_pinecone_memory():
             "Computer vision applications"
         ]
         
-        for query in search_queries:
+        # All queries go to the store in one call
+        results_per_query = memory_manager.search_memory_batch(search_queries, limit=3)
+        for query, results in zip(search_queries, results_per_query):
             print(f"\n   Query: '{query}'")
-            results = memory_manager.search_memory(query, limit=3)
             print(f"   Results ({len(results)} found):")
             for i, memory in enumerate(results, 1):
-                print(f"     {i}. [{memory.memory_type.value}] {memory.content[:60]}...")
+                print(f"     {i}. [{memory.memory_type.value}] {_preview(memory.content)}")
                 print(f"        Score: {getattr(memory, 'score', 'N/A')}")
         
         # Demo 3: Filtered Search
@@ -130,7 +143,7 @@ def demo_pinecone_memory():
             limit=5
         )
         for i, memory in enumerate(episodic_results, 1):
-            print(f"     {i}. {memory.content[:60]}...")
+            print(f"     {i}. {_preview(memory.content)}")
         
         # Search only semantic memories
         print("\n   Searching only semantic memories:")
@@ -140,22 +153,27 @@ def demo_pinecone_memory():
             limit=5
         )
         for i, memory in enumerate(semantic_results, 1):
-            print(f"     {i}. {memory.content[:60]}...")
+            print(f"     {i}. {_preview(memory.content)}")
         
         # Demo 4: Timeline
         print("\n⏰ Demo 4: Timeline")
         print("-" * 30)
         
+        # PineconeStore has no count_memories or streaming timeline of its own,
+        # so one get_timeline() call gives both the entries and their count
         timeline = memory_manager.get_timeline(agent_id="demo-agent", limit=10)
         print(f"   Timeline ({len(timeline)} memories):")
         for i, memory in enumerate(timeline, 1):
-            time_str = memory.timestamp.strftime("%H:%M:%S")
-            print(f"     {i}. [{time_str}] {memory.content[:50]}...")
+            # isoformat skips strftime's per-call format parsing
+            time_str = memory.timestamp.time().isoformat("seconds")
+            print(f"     {i}. [{time_str}] {_preview(memory.content, 50)}")
         
         # Demo 5: Memory Statistics
         print("\n📊 Demo 5: Memory Statistics")
         print("-" * 30)
         
+        # PineconeStore has no count_memories of its own (each call would be a
+        # full search), so fetch the memories once and count them here
         all_memories = memory_manager.get_all_memories()
         episodic_count = len([m for m in all_memories if m.memory_type == MemoryType.EPISODIC])
         semantic_count = len([m for m in all_memories if m.memory_type == MemoryType.SEMANTIC])
@@ -10,11 +10,11 @@ This demo:
 
 import time
 import webbrowser
-import subprocess
-import sys
-from pathlib import Path
+
+import uvicorn
 
 from agent_memory_sdk import MemoryManager, MemoryType
+from agent_memory_sdk.api import create_app
 
 
 def create_sample_data():
@@ -89,34 +89,6 @@ def create_sample_data():
         }
     ]
     
-    # Create memories
-    for memory in episodic_memories:
-        memory_manager.add_memory(
-            content=memory["content"],
-            memory_type=MemoryType.EPISODIC,
-            agent_id=memory["agent_id"],
-            importance=memory["importance"],
-            tags=memory["tags"]
-        )
-    
-    for memory in semantic_memories:
-        memory_manager.add_memory(
-            content=memory["content"],
-            memory_type=MemoryType.SEMANTIC,
-            agent_id=memory["agent_id"],
-            importance=memory["importance"],
-            tags=memory["tags"]
-        )
-    
-    for memory in temporal_memories:
-        memory_manager.add_memory(
-            content=memory["content"],
-            memory_type=MemoryType.TEMPORAL,
-            agent_id=memory["agent_id"],
-            importance=memory["importance"],
-            tags=memory["tags"]
-        )
-    
     # Add some memories from different agents
     other_agents = [
         ("research_agent", "Found relevant papers on memory systems for AI agents"),
@@ -124,13 +96,23 @@ def create_sample_data():
         ("documentation_agent", "Updated README with new REST API and web UI features")
     ]
     
-    for agent_id, content in other_agents:
-        memory_manager.add_memory(
-            content=content,
-            memory_type=MemoryType.EPISODIC,
-            agent_id=agent_id,
-            importance=6.5,
-            tags=["collaboration", "multi-agent"]
+    # Create all memories with one batched store write, building the
+    # indexes once afterwards instead of row by row
+    with memory_manager.bulk_load():
+        memory_manager.add_memories(
+            [{**memory, "memory_type": MemoryType.EPISODIC} for memory in episodic_memories]
+            + [{**memory, "memory_type": MemoryType.SEMANTIC} for memory in semantic_memories]
+            + [{**memory, "memory_type": MemoryType.TEMPORAL} for memory in temporal_memories]
+            + [
+                {
+                    "content": content,
+                    "memory_type": MemoryType.EPISODIC,
+                    "agent_id": agent_id,
+                    "importance": 6.5,
+                    "tags": ["collaboration", "multi-agent"]
+                }
+                for agent_id, content in other_agents
+            ]
         )
     
     total_memories = len(episodic_memories) + len(semantic_memories) + len(temporal_memories) + len(other_agents)
@@ -141,7 +123,7 @@ def create_sample_data():
     print(f"   - {len(other_agents)} other agent memories")
 
 
-def launch_web_ui(run_api_path):
+def launch_web_ui():
     """Launch the web UI server"""
     print("\n🚀 Launching Web UI server...")
     print("📍 Server will be available at: http://localhost:8000")
@@ -167,13 +149,9 @@ def launch_web_ui(run_api_path):
     
     print("\n🔄 Server is running. Press Ctrl+C to stop.")
     
-    # Start the server
+    # Start the server in this process rather than spawning run_api.py
     try:
-        subprocess.run([
-            sys.executable, str(run_api_path), 
-            "--host", "127.0.0.1", 
-            "--port", "8000"
-        ])
+        uvicorn.run(create_app("agent_memory.db"), host="127.0.0.1", port=8000, log_level="info")
     except KeyboardInterrupt:
         print("\n👋 Web UI demo stopped.")
 
@@ -183,22 +161,11 @@ def main():
     print("🎨 Agent Memory OS - Web UI Demo")
     print("=" * 50)
     
-    # Check if we're in the right directory and find run_api.py
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    run_api_path = project_root / "run_api.py"
-    
-    if not run_api_path.exists():
-        print("❌ Error: run_api.py not found!")
-        print(f"   Looked for: {run_api_path}")
-        print("   Please run this script from the project root directory.")
-        return
-    
     # Create sample data
     create_sample_data()
     
     # Launch web UI
-    launch_web_ui(run_api_path)
+    launch_web_ui()
 
 
 if __name__ == "__main__":
@@ -15,40 +15,49 @@ def migrate_database(db_path: str = "agent_memory.db"):
         print("Database file does not exist. Nothing to migrate.")
         return
     
+    conn = sqlite3.connect(db_path, isolation_level=None)
     try:
-        with sqlite3.connect(db_path) as conn:
-            # Check if new columns exist
-            cursor = conn.execute("PRAGMA table_info(memories)")
-            columns = [column[1] for column in cursor.fetchall()]
-            
-            print(f"Existing columns: {columns}")
-            
-            # Add new columns if they don't exist
-            if 'importance' not in columns:
-                print("Adding importance column...")
-                conn.execute("ALTER TABLE memories ADD COLUMN importance REAL DEFAULT 5.0")
-            
-            if 'tags' not in columns:
-                print("Adding tags column...")
-                conn.execute("ALTER TABLE memories ADD COLUMN tags TEXT")
-            
-            if 'last_accessed' not in columns:
-                print("Adding last_accessed column...")
-                conn.execute("ALTER TABLE memories ADD COLUMN last_accessed TEXT")
-            
-            # Update existing records to have default values
-            print("Updating existing records...")
-            conn.execute("UPDATE memories SET importance = 5.0 WHERE importance IS NULL")
-            conn.execute("UPDATE memories SET tags = '[]' WHERE tags IS NULL")
-            
-            # Commit changes
-            conn.commit()
-            
-            print("Database migration completed successfully!")
-            
+        # Run the whole migration as one write transaction, so it is
+        # journaled and synced once and never left half applied
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("BEGIN IMMEDIATE")
+        
+        # Check if new columns exist
+        columns = {column[1] for column in conn.execute("PRAGMA table_info(memories)")}
+        
+        print(f"Existing columns: {sorted(columns)}")
+        
+        # Add new columns if they don't exist
+        if 'importance' not in columns:
+            print("Adding importance column...")
+            conn.execute("ALTER TABLE memories ADD COLUMN importance REAL DEFAULT 5.0")
+        
+        if 'tags' not in columns:
+            print("Adding tags column...")
+            conn.execute("ALTER TABLE memories ADD COLUMN tags TEXT")
+        
+        if 'last_accessed' not in columns:
+            print("Adding last_accessed column...")
+            conn.execute("ALTER TABLE memories ADD COLUMN last_accessed TEXT")
+        
+        # Update existing records to have default values in one table scan
+        print("Updating existing records...")
+        conn.execute(
+            "UPDATE memories SET importance = COALESCE(importance, 5.0), tags = COALESCE(tags, '[]') "
+            "WHERE importance IS NULL OR tags IS NULL"
+        )
+        
+        conn.execute("COMMIT")
+        
+        print("Database migration completed successfully!")
+        
     except Exception as e:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
         print(f"Error during migration: {e}")
         raise
+    finally:
+        conn.close()
 
 if __name__ == "__main__":
     migrate_database() 
\ No newline at end of file
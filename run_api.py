@@ -4,12 +4,9 @@ CLI script to run the Agent Memory OS REST API server
 """
 
 import argparse
-import uvicorn
 import os
 from pathlib import Path
 
-from agent_memory_sdk.api import create_app
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -28,6 +25,10 @@ Examples:
 
   # Run in development mode with auto-reload
   python run_api.py --reload
+
+  # Run 4 workers; the server then accepts up to 4 x --max-concurrency
+  # connections in total
+  python run_api.py --workers 4 --max-concurrency 256
         """
     )
     
@@ -70,6 +71,20 @@ Examples:
         help="Number of worker processes (default: 1)"
     )
     
+    parser.add_argument(
+        "--keep-alive",
+        type=int,
+        default=30,
+        help="Seconds to keep idle HTTP connections open (default: 30)"
+    )
+    
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=1024,
+        help="Connections and tasks per worker before new requests get HTTP 503 (default: 1024)"
+    )
+    
     args = parser.parse_args()
     
     # Validate database path
@@ -86,18 +101,27 @@ Examples:
     print(f"❤️  Health Check: http://{args.host}:{args.port}/health")
     print()
     
-    # Create the app with the specified database path
-    from agent_memory_sdk.api.server import create_app
-    app = create_app(str(db_path))
+    # Pass the app factory as an import string so --workers and --reload
+    # take effect; each worker process reads the database path from the
+    # environment. uvicorn picks uvloop and httptools when installed
+    # (uvicorn[standard]) and falls back to asyncio and h11 otherwise.
+    os.environ["AGENT_MEMORY_DB"] = str(db_path)
+    
+    # Imported only now so --help and argument errors return immediately
+    import uvicorn
     
     # Run the server
     uvicorn.run(
-        app,
+        "agent_memory_sdk.api.server:create_app",
+        factory=True,
         host=args.host,
         port=args.port,
         reload=args.reload,
         log_level=args.log_level,
         workers=args.workers if not args.reload else 1,
+        timeout_keep_alive=args.keep_alive,
+        limit_concurrency=args.max_concurrency,
+        backlog=2048,
         access_log=True,
     )
 
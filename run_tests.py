@@ -5,6 +5,7 @@ Comprehensive Test Runner for Agent Memory OS
 This script runs all test suites and generates detailed reports for PyPI readiness.
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
@@ -62,31 +63,46 @@ class TestRunner:
                 'stderr': str(e)
             }
     
+    def pytest_command(self, path):
+        """
+        Build the pytest command line for a test file or directory
+        
+        With pytest-xdist installed, tests are spread over worker processes,
+        one test file per worker so tests sharing module state stay together.
+        Set AGENT_MEMORY_TEST_WORKERS to a number to cap the workers (0 runs
+        serially); the default "auto" uses one worker per CPU core.
+        """
+        command = [sys.executable, "-m", "pytest", path, "-v"]
+        if importlib.util.find_spec("xdist") is not None:
+            workers = os.environ.get("AGENT_MEMORY_TEST_WORKERS", "auto")
+            command += ["-n", workers, "--dist=loadfile"]
+        return command
+    
     def run_unit_tests(self):
         """Run unit tests"""
         return self.run_command(
-            [sys.executable, "-m", "pytest", "tests/test_memory.py", "-v"],
+            self.pytest_command("tests/test_memory.py"),
             "Running Unit Tests"
         )
     
     def run_regression_tests(self):
         """Run regression tests"""
         return self.run_command(
-            [sys.executable, "-m", "pytest", "tests/test_regression.py", "-v"],
+            self.pytest_command("tests/test_regression.py"),
             "Running Regression Tests"
         )
     
     def run_integration_tests(self):
         """Run integration tests"""
         return self.run_command(
-            [sys.executable, "-m", "pytest", "tests/test_integrations.py", "-v"],
+            self.pytest_command("tests/test_integrations.py"),
             "Running Integration Tests"
         )
     
     def run_all_tests(self):
         """Run all tests"""
         return self.run_command(
-            [sys.executable, "-m", "pytest", "tests/", "-v"],
+            self.pytest_command("tests/"),
             "Running All Tests"
         )
     
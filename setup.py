@@ -53,9 +53,18 @@ extras_require = {
     'mcp': [
         'mcp>=1.0.0',
     ],
+    'speedups': [
+        'ciso8601>=2.0.0',
+        'orjson>=3.9.0',
+        'uvloop>=0.18.0; sys_platform != "win32"',
+    ],
+    'vector': [
+        'faiss-cpu>=1.7.4',
+    ],
     'dev': [
         'pytest>=7.0.0',
         'pytest-asyncio>=0.21.0',
+        'pytest-xdist>=3.0.0',
         'black>=23.0.0',
         'flake8>=6.0.0',
         'mypy>=1.0.0',
@@ -71,6 +80,7 @@ extras_require = {
         'uvicorn[standard]>=0.20.0',
         'httpx>=0.24.0',
         'mcp>=1.0.0',
+        'faiss-cpu>=1.7.4',
     ]
 }
 
@@ -159,6 +159,32 @@ class TestLangGraphIntegration:
         except ImportError:
             pytest.skip("LangGraph not available")
     
+    def test_memory_graph_arun_many(self):
+        """Test MemoryGraph runs independent inputs concurrently"""
+        try:
+            from agent_memory_sdk.integrations.langgraph import MemoryGraph
+            from langgraph.graph import StateGraph, END
+        except ImportError:
+            pytest.skip("LangGraph not available")
+        
+        memory_manager = MemoryManager(store_type="sqlite", db_path=self.db_path)
+        memory_graph = MemoryGraph(memory_manager=memory_manager, agent_id="test_agent")
+        
+        graph = StateGraph(dict)
+        graph.add_node("echo", lambda state: {"output": f"echo: {state['input']}"})
+        graph.set_entry_point("echo")
+        graph.add_edge("echo", END)
+        memory_graph.graph = graph
+        
+        results = asyncio.run(memory_graph.arun_many([{"input": "first"}, {"input": "second"}]))
+        assert [r["output"] for r in results] == ["echo: first", "echo: second"]
+        
+        stored = memory_manager.get_memories_by_agent("test_agent")
+        assert sorted(m.content for m in stored) == [
+            "Graph input: first", "Graph input: second",
+            "Graph output: echo: first", "Graph output: echo: second",
+        ]
+    
     def test_memory_state_creation(self):
         """Test MemoryState creation and functionality"""
         try:
@@ -280,6 +306,52 @@ class TestRESTAPIIntegration:
             
         except ImportError:
             pytest.skip("FastAPI not available")
+    
+    def test_bulk_create_endpoint(self):
+        """Test creating several memories with one request"""
+        try:
+            from fastapi.testclient import TestClient
+            from agent_memory_sdk.api.server import create_app
+        except ImportError:
+            pytest.skip("FastAPI not available")
+        
+        payload = {
+            "memories": [
+                {"content": f"Bulk memory {i}", "memory_type": "semantic", "agent_id": "bulk_agent"}
+                for i in range(5)
+            ]
+        }
+        with TestClient(create_app(self.db_path)) as client:
+            response = client.post("/memories/bulk", json=payload)
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total_count"] == 5
+            assert [m["content"] for m in data["memories"]] == [f"Bulk memory {i}" for i in range(5)]
+            
+            agent_memories = client.get("/agents/bulk_agent/memories").json()
+            assert agent_memories["total_count"] == 5
+            
+            assert client.post("/memories/bulk", json={"memories": []}).status_code == 422
+    
+    def test_api_client_create_memories(self):
+        """Test the client bulk-create round trip against the app"""
+        try:
+            from fastapi.testclient import TestClient
+            from agent_memory_sdk.api import MemoryAPIClient
+            from agent_memory_sdk.api.models import MemoryCreateRequest
+            from agent_memory_sdk.api.server import create_app
+        except ImportError:
+            pytest.skip("FastAPI not available")
+        
+        with TestClient(create_app(self.db_path)) as test_client:
+            client = MemoryAPIClient("http://testserver")
+            client.session = test_client
+            memories = client.create_memories([
+                MemoryCreateRequest(content=f"Client memory {i}", memory_type=MemoryType.EPISODIC)
+                for i in range(3)
+            ])
+            assert [m.content for m in memories] == [f"Client memory {i}" for i in range(3)]
+            assert memories[0].memory_type == MemoryType.EPISODIC
 
 
 class TestStoreIntegrations:
@@ -383,6 +455,23 @@ class TestUtilityIntegrations:
         except ImportError as e:
             pytest.fail(f"Failed to import embedding utilities: {e}")
     
+    def test_find_similar_embeddings(self):
+        """Test similarity filtering matches pairwise cosine similarity"""
+        from agent_memory_sdk.utils.embedding_utils import (
+            generate_embedding, cosine_similarity, find_similar_embeddings
+        )
+        
+        query = generate_embedding("query")
+        embeddings = [generate_embedding(f"text {i}") for i in range(50)]
+        embeddings += [query, [0.0] * len(query)]
+        
+        expected = [i for i, e in enumerate(embeddings) if cosine_similarity(query, e) >= 0.05]
+        assert find_similar_embeddings(query, embeddings, threshold=0.05) == expected
+        assert len(embeddings) - 2 in expected
+        assert find_similar_embeddings(query, [], threshold=0.05) == []
+        with pytest.raises(ValueError):
+            find_similar_embeddings(query, [[1.0, 2.0]])
+    
     def test_time_utils_integration(self):
         """Test time utilities integration"""
         try:
@@ -401,6 +490,14 @@ class TestUtilityIntegrations:
             
         except ImportError as e:
             pytest.fail(f"Failed to import time utilities: {e}")
+    
+    def test_new_session_id_is_unique(self):
+        """Test session IDs created back to back never collide"""
+        from agent_memory_sdk.utils import new_session_id
+        
+        session_ids = {new_session_id() for _ in range(1000)}
+        assert len(session_ids) == 1000
+        assert all(session_id.startswith("session_") for session_id in session_ids)
 
 
 class TestEndToEndIntegration:
@@ -5,10 +5,18 @@ Unit tests for Agent Memory OS core functionality
 import pytest
 import tempfile
 import os
+import shutil
+import sqlite3
+import sys
+import time
+import numpy as np
 from datetime import datetime, timedelta
 
 from agent_memory_sdk import MemoryManager, MemoryEntry, MemoryType
+from agent_memory_sdk.memory import _query_embedding
 from agent_memory_sdk.store import SQLiteStore
+from agent_memory_sdk.utils.embedding_utils import EMBEDDING_DIMENSION, generate_embedding
+from agent_memory_sdk.utils.vector_index import create_vector_index
 
 
 class TestMemoryEntry:
@@ -44,6 +52,11 @@ class TestMemoryEntry:
         assert data["session_id"] == "test_session"
         assert "timestamp" in data
     
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_memory_entry_has_no_instance_dict(self):
+        """Test memory entries are slotted"""
+        assert not hasattr(MemoryEntry(content="Test memory"), "__dict__")
+    
     def test_memory_entry_from_dict(self):
         """Test creating memory entry from dictionary"""
         data = {
@@ -72,10 +85,8 @@ class TestSQLiteStore:
         self.store = SQLiteStore(self.db_path)
     
     def teardown_method(self):
-        """Clean up test database"""
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        os.rmdir(self.temp_dir)
+        """Clean up test database and its WAL files"""
+        shutil.rmtree(self.temp_dir)
     
     def test_save_and_retrieve_memory(self):
         """Test saving and retrieving a memory entry"""
@@ -114,6 +125,33 @@ class TestSQLiteStore:
         # Filter by memory type
         semantic_results = self.store.search_memories(memory_type=MemoryType.SEMANTIC)
         assert len(semantic_results) == 2
+
+    def test_search_memories_substring_matching(self):
+        """Test that text search is case-insensitive and treats wildcards literally"""
+        self.store.save_memory(MemoryEntry(content="Discount of 50% applied"))
+        self.store.save_memory(MemoryEntry(content="Discount of 500 applied"))
+
+        assert len(self.store.search_memories(query="DISCOUNT")) == 2
+        assert len(self.store.search_memories(query="50%")) == 1
+        assert len(self.store.search_memories(query="of_5")) == 0
+    
+    def test_search_keywords(self):
+        """Test BM25 keyword search matches individual words and follows updates"""
+        python = MemoryEntry(content="The user prefers Python programming", memory_type=MemoryType.SEMANTIC)
+        self.store.save_memory(python)
+        self.store.save_memory(MemoryEntry(content="The user is working on a project"))
+        
+        results = self.store.search_keywords("What programming language do I use?")
+        assert [m.id for m in results] == [python.id]
+        assert self.store.search_keywords("programming", memory_type=MemoryType.EPISODIC) == []
+        
+        python.content = "The user prefers Rust"
+        self.store.save_memory(python)
+        assert self.store.search_keywords("programming") == []
+        assert [m.id for m in self.store.search_keywords("rust")] == [python.id]
+        
+        self.store.delete_memory(python.id)
+        assert self.store.search_keywords("rust") == []
     
     def test_timeline_retrieval(self):
         """Test timeline retrieval"""
@@ -137,6 +175,288 @@ class TestSQLiteStore:
         assert len(timeline) == 2
         assert timeline[0].content == "First memory"  # Should be chronological
 
+    @pytest.mark.parametrize("agent_id, index", [("test_agent", "idx_agent_ts_us"), (None, "idx_ts_us")])
+    def test_timeline_range_uses_index(self, agent_id, index):
+        """Test timeline time ranges are answered by an index range scan"""
+        statements = []
+        store = SQLiteStore(self.db_path, trace_callback=statements.append)
+        now = datetime.now()
+        store.get_timeline(agent_id=agent_id, start_time=now - timedelta(hours=1), end_time=now)
+        
+        select = next(sql for sql in statements if sql.lstrip().startswith("SELECT"))
+        conn = sqlite3.connect(self.db_path)
+        try:
+            plan = " ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + select))
+        finally:
+            conn.close()
+        assert f"USING INDEX {index}" in plan
+        assert "ts_us>?" in plan and "ts_us<?" in plan
+    
+    def test_search_by_type_avoids_sort(self):
+        """Test type-filtered searches read the type index in ts_us order"""
+        statements = []
+        store = SQLiteStore(self.db_path, trace_callback=statements.append)
+        store.search_memories(memory_type=MemoryType.EPISODIC, limit=10)
+        
+        select = next(sql for sql in statements if sql.lstrip().startswith("SELECT"))
+        conn = sqlite3.connect(self.db_path)
+        try:
+            plan = " ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + select))
+        finally:
+            conn.close()
+        assert "USING INDEX idx_type_ts_us" in plan
+        assert "TEMP B-TREE" not in plan
+    
+    def test_iter_search_memories(self):
+        """Test streaming search results"""
+        for i in range(5):
+            self.store.save_memory(MemoryEntry(content=f"Streamed memory {i}"))
+
+        results = self.store.iter_search_memories(query="Streamed", limit=3)
+        assert not isinstance(results, list)
+
+        memories = list(results)
+        assert len(memories) == 3
+        assert [m.id for m in memories] == [
+            m.id for m in self.store.search_memories(query="Streamed", limit=3)
+        ]
+
+    def test_search_memories_with_fields(self):
+        """Test projecting search and timeline results onto selected fields"""
+        memory = MemoryEntry(content="Projected memory", tags=["a"])
+        self.store.save_memory(memory)
+
+        results = self.store.search_memories(query="Projected", fields=["id", "tags"])
+        assert results == [{"id": memory.id, "tags": ["a"]}]
+
+        timeline = self.store.get_timeline(fields=["timestamp"])
+        assert timeline == [{"timestamp": memory.timestamp}]
+
+        with pytest.raises(ValueError):
+            self.store.search_memories(fields=["not_a_column"])
+
+    def test_search_by_metadata(self):
+        """Test indexed metadata lookups follow saves and deletes"""
+        memory = MemoryEntry(content="Tagged", metadata={"source": "chat", "turn": 1})
+        other = MemoryEntry(content="Other", metadata={"source": "email"})
+        self.store.save_memory(memory)
+        self.store.save_memory(other)
+
+        assert [m.id for m in self.store.search_by_metadata("source", "chat")] == [memory.id]
+        assert len(self.store.search_by_metadata("turn", 1)) == 1
+        assert self.store.search_by_metadata("turn", "1") == []
+
+        memory.metadata = {"source": "email"}
+        self.store.save_memory(memory)
+        assert self.store.search_by_metadata("source", "chat") == []
+        assert len(self.store.search_by_metadata("source", "email")) == 2
+
+        self.store.delete_memory(other.id)
+        assert [m.id for m in self.store.search_by_metadata("source", "email")] == [memory.id]
+
+    def test_search_by_tag(self):
+        """Test indexed tag lookups follow saves and deletes"""
+        memory = MemoryEntry(content="Tagged", tags=["python", "sqlite", "python"])
+        other = MemoryEntry(content="Other", tags=["python"])
+        self.store.save_memories([memory, other])
+
+        assert [m.id for m in self.store.search_by_tag("sqlite")] == [memory.id]
+        assert len(self.store.search_by_tag("python")) == 2
+        assert self.store.search_by_tag("Python") == []
+
+        memory.tags = ["postgresql"]
+        self.store.save_memory(memory)
+        assert self.store.search_by_tag("sqlite") == []
+        assert [m.id for m in self.store.search_by_tag("postgresql")] == [memory.id]
+
+        self.store.delete_memory(other.id)
+        assert self.store.search_by_tag("python") == []
+
+    def test_write_behind_saves(self):
+        """Test queued saves are visible to reads and committed on flush"""
+        store = SQLiteStore(self.db_path, write_behind=True)
+        memories = [MemoryEntry(content=f"Queued memory {i}") for i in range(10)]
+
+        for memory in memories:
+            assert store.save_memory(memory) is True
+
+        assert store.get_memory(memories[0].id) is not None
+        store.flush()
+        assert len(self.store.search_memories(query="Queued")) == 10
+
+    def test_failed_migration_rolls_back(self):
+        """Test a failed ts_us backfill leaves the old schema for the next open to retry"""
+        db_path = os.path.join(self.temp_dir, "old_schema.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE memories (id TEXT PRIMARY KEY, content TEXT NOT NULL, "
+            "memory_type TEXT NOT NULL, agent_id TEXT, session_id TEXT, "
+            "timestamp TEXT NOT NULL, metadata TEXT, embedding TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO memories (id, content, memory_type, timestamp, metadata) "
+            "VALUES ('old', 'Old memory', 'episodic', 'not a time', '{}')"
+        )
+        conn.commit()
+
+        with pytest.raises(ValueError):
+            SQLiteStore(db_path)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(memories)")}
+        assert "ts_us" not in columns
+
+        conn.execute("UPDATE memories SET timestamp = '2024-01-01T00:00:00' WHERE id = 'old'")
+        conn.commit()
+        conn.close()
+        store = SQLiteStore(db_path)
+        assert [m.id for m in store.get_timeline(start_time=datetime(2023, 12, 31))] == ["old"]
+
+    def test_write_behind_keeps_failed_batches(self):
+        """Test failed background commits are kept, raised by flush and retried"""
+        store = SQLiteStore(self.db_path, write_behind=True)
+        memory = MemoryEntry(content="Retried memory")
+
+        def fail(conn, writes):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        store._write = fail
+        assert store.save_memory(memory) is True
+        with pytest.raises(sqlite3.OperationalError):
+            store.flush()
+        assert self.store.get_memory(memory.id) is None
+
+        del store._write
+        store.flush()
+        assert self.store.get_memory(memory.id) is not None
+
+    def test_close_stops_write_behind_thread(self):
+        """Test close commits queued saves and ends the background writer"""
+        store = SQLiteStore(self.db_path, write_behind=True)
+        store.save_memories([MemoryEntry(content=f"Closing memory {i}") for i in range(5)])
+        store.close()
+
+        assert not store._writer.is_alive()
+        assert len(self.store.search_memories(query="Closing")) == 5
+        assert store.save_memory(MemoryEntry(content="Closing memory 5")) is True
+        assert len(self.store.search_memories(query="Closing")) == 6
+
+    def test_write_behind_transaction(self):
+        """Test saves inside a transaction bypass the write-behind queue"""
+        store = SQLiteStore(self.db_path, write_behind=True)
+        kept = MemoryEntry(content="Kept memory")
+        store.save_memory(kept)
+
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.save_memory(MemoryEntry(content="Rolled back memory"))
+                raise RuntimeError("abort")
+        store.flush()
+        assert self.store.search_memories(query="Rolled back") == []
+
+        start = time.monotonic()
+        with store.transaction():
+            store.save_memories([MemoryEntry(content="Committed memory")])
+            assert store.delete_memory(kept.id) is True
+        assert time.monotonic() - start < 1
+        assert len(self.store.search_memories(query="Committed")) == 1
+        assert self.store.get_memory(kept.id) is None
+
+    def test_save_memories_batch(self):
+        """Test saving several memories in one call"""
+        memories = [
+            MemoryEntry(content=f"Batched memory {i}", metadata={"batch": True})
+            for i in range(4)
+        ]
+
+        assert self.store.save_memories(memories) is True
+        assert len(self.store.search_memories(query="Batched")) == 4
+        assert len(self.store.search_by_metadata("batch", True)) == 4
+
+    def test_get_memories_batch(self):
+        """Test fetching several memories by ID in one call"""
+        memories = [MemoryEntry(content=f"Fetched memory {i}") for i in range(3)]
+        self.store.save_memories(memories)
+
+        found = self.store.get_memories([memories[2].id, "missing", memories[0].id])
+        assert set(found) == {memories[0].id, memories[2].id}
+        assert found[memories[2].id].content == "Fetched memory 2"
+        assert self.store.get_memories([]) == {}
+
+    def test_count_memories(self):
+        """Test counting memories by type and agent without loading them"""
+        self.store.save_memories([
+            MemoryEntry(content="Episode a1", memory_type=MemoryType.EPISODIC, agent_id="a"),
+            MemoryEntry(content="Episode a2", memory_type=MemoryType.EPISODIC, agent_id="a"),
+            MemoryEntry(content="Fact a", memory_type=MemoryType.SEMANTIC, agent_id="a"),
+            MemoryEntry(content="Episode b", memory_type=MemoryType.EPISODIC, agent_id="b"),
+        ])
+
+        assert self.store.count_memories() == 4
+        assert self.store.count_memories(agent_id="a") == 3
+        assert self.store.count_memories(memory_type=MemoryType.EPISODIC) == 3
+        assert self.store.count_memories(memory_type=MemoryType.EPISODIC, agent_id="a") == 2
+        assert self.store.count_memories(agent_id="missing") == 0
+
+    def test_quantized_embeddings_round_trip(self):
+        """Test int8-packed embeddings are stored compactly and decode close to the original"""
+        store = SQLiteStore(self.db_path, quantize_embeddings=True)
+        embedding = generate_embedding("quantized memory")
+        memory = MemoryEntry(content="Quantized memory", embedding=embedding)
+        assert store.save_memory(memory) is True
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            blob = conn.execute("SELECT embedding FROM memories WHERE id = ?", (memory.id,)).fetchone()[0]
+        finally:
+            conn.close()
+        assert isinstance(blob, bytes) and len(blob) == 4 + len(embedding)
+
+        # Plain stores read packed rows too
+        restored = self.store.get_memory(memory.id).embedding
+        assert len(restored) == len(embedding)
+        assert max(abs(a - b) for a, b in zip(restored, embedding)) < 0.01
+
+    def test_database_uses_wal(self):
+        """Test the schema setup switches the database to WAL journaling"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+    def test_transaction_commits_on_exit(self):
+        """Test writes inside a transaction share one commit or roll back together"""
+        with self.store.transaction():
+            self.store.save_memory(MemoryEntry(content="Transaction memory 1"))
+            self.store.save_memories([MemoryEntry(content="Transaction memory 2")])
+            assert self.store.search_memories(query="Transaction") == []
+        assert len(self.store.search_memories(query="Transaction")) == 2
+
+        with pytest.raises(RuntimeError):
+            with self.store.transaction():
+                self.store.save_memory(MemoryEntry(content="Rolled back memory"))
+                raise RuntimeError("abort")
+        assert self.store.search_memories(query="Rolled back") == []
+
+    def test_bulk_load_rebuilds_indexes(self):
+        """Test bulk_load drops secondary indexes and rebuilds them on exit"""
+        def index_names():
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+                ).fetchall()
+            return {row[0] for row in rows}
+
+        indexes = index_names()
+        assert "idx_agent_ts_us" in indexes
+
+        with self.store.bulk_load():
+            assert index_names() == set()
+            self.store.save_memories(
+                [MemoryEntry(content=f"Bulk memory {i}", agent_id="bulk") for i in range(20)]
+            )
+        assert index_names() == indexes
+        assert len(self.store.get_timeline(agent_id="bulk", limit=50)) == 20
+
 
 class TestMemoryManager:
     """Test MemoryManager class"""
@@ -172,6 +492,242 @@ class TestMemoryManager:
         results = manager.search_memory("Python")
         # For now, we expect empty results since store integration is not implemented
         assert isinstance(results, list)
+    
+    def test_search_memory_agent_filter(self):
+        """Test search_memory only returns the requested agent's memories"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = MemoryManager(store_type="sqlite", search_cache_size=4,
+                                    db_path=os.path.join(temp_dir, "agent_memory.db"))
+            mine = manager.add_memory("I prefer dark chocolate", agent_id="agent_a")
+            manager.add_memory("I prefer milk chocolate", agent_id="agent_b")
+            
+            assert len(manager.search_memory("prefer")) == 2
+            assert [m.id for m in manager.search_memory("prefer", agent_id="agent_a")] == [mine.id]
+            assert manager.search_memory_batch(["prefer"], agent_id="agent_c") == [[]]
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_search_memory_batch(self):
+        """Test batched searches match one search_memory call per query"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = MemoryManager(store_type="sqlite", search_cache_size=4,
+                                    db_path=os.path.join(temp_dir, "batch_memory.db"))
+            manager.add_memory("Python is a programming language", MemoryType.SEMANTIC)
+            manager.add_memory("User asked about Python", MemoryType.EPISODIC)
+            manager.search_memory("Python")
+            
+            queries = ["Python", "programming", "Rust"]
+            batched = manager.search_memory_batch(queries)
+            assert [len(results) for results in batched] == [2, 1, 0]
+            for query, results in zip(queries, batched):
+                assert [m.id for m in results] == [m.id for m in manager.search_memory(query)]
+            
+            episodic = manager.search_memory_batch(queries, memory_type=MemoryType.EPISODIC)
+            assert [len(results) for results in episodic] == [1, 0, 0]
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_iter_timeline_and_all_memories(self):
+        """Test the lazy timeline and all-memories walks match the list versions"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = MemoryManager(store_type="sqlite",
+                                    db_path=os.path.join(temp_dir, "iter_memory.db"))
+            for i in range(5):
+                manager.add_memory(f"Timeline entry {i}", agent_id="walker")
+            
+            timeline = manager.iter_timeline(agent_id="walker", limit=3)
+            assert not isinstance(timeline, list)
+            assert [m.id for m in timeline] == [
+                m.id for m in manager.get_timeline(agent_id="walker", limit=3)
+            ]
+            assert [m.id for m in manager.iter_all_memories()] == [
+                m.id for m in manager.get_all_memories()
+            ]
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_flush_commits_write_behind_adds(self):
+        """Test flush makes queued adds visible to other connections"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            db_path = os.path.join(temp_dir, "write_behind_memory.db")
+            manager = MemoryManager(store_type="sqlite", write_behind=True, db_path=db_path)
+            for i in range(5):
+                manager.add_memory(f"Queued note {i}", MemoryType.EPISODIC)
+            
+            manager.flush()
+            assert len(SQLiteStore(db_path).search_memories(query="Queued note")) == 5
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_delete_memories(self):
+        """Test deleting several memories removes them from the store and the vector index"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = MemoryManager(store_type="sqlite", vector_index=True,
+                                    db_path=os.path.join(temp_dir, "delete_memory.db"))
+            memories = manager.add_memories([{"content": f"Scratch note {i}"} for i in range(3)])
+            kept = manager.add_memory("Kept note", MemoryType.SEMANTIC)
+    
+            assert manager.delete_memories([m.id for m in memories] + ["missing"]) == 3
+            assert [m.id for m in manager.get_all_memories()] == [kept.id]
+            assert [m.id for m in manager.search_similar("Scratch note 1")] == [kept.id]
+            assert manager.delete_memories([]) == 0
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_search_cache(self):
+        """Test cached search results are reused until the manager writes"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = MemoryManager(store_type="sqlite", search_cache_size=2,
+                                    db_path=os.path.join(temp_dir, "cache_memory.db"))
+            manager.add_memory("Python is a programming language", MemoryType.SEMANTIC)
+            
+            first = manager.search_memory("Python")
+            assert len(first) == 1
+            first.clear()
+            assert len(manager.search_memory("Python")) == 1
+            
+            manager.search_memory("Rust")
+            manager.search_memory("Go")
+            assert len(manager._search_cache) == 2
+            
+            manager.add_memory("User asked about Python", MemoryType.EPISODIC)
+            assert len(manager._search_cache) == 0
+            assert len(manager.search_memory("Python")) == 2
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+
+class TestVectorIndex:
+    """Test in-memory vector indexes"""
+    
+    @pytest.mark.parametrize("use_faiss", [False, True])
+    @pytest.mark.parametrize("quantize", [False, True])
+    def test_add_search_remove(self, use_faiss, quantize):
+        """Test nearest-neighbour lookups follow adds, replacements and removals"""
+        if use_faiss:
+            pytest.importorskip("faiss")
+        index = create_vector_index(use_faiss=use_faiss, quantize=quantize)
+        texts = [f"memory {i}" for i in range(20)]
+        index.add(texts, [generate_embedding(t) for t in texts])
+        
+        assert len(index) == 20
+        assert index.search(generate_embedding("memory 7"), k=1)[0][0] == "memory 7"
+        
+        assert index.remove("memory 7") is True
+        assert index.remove("memory 7") is False
+        assert "memory 7" not in [i for i, _ in index.search(generate_embedding("memory 7"), k=20)]
+        
+        index.add(["memory 3"], [generate_embedding("replacement")])
+        assert len(index) == 19
+        assert index.search(generate_embedding("replacement"), k=1)[0][0] == "memory 3"
+    
+    @pytest.mark.parametrize("use_faiss", [False, True])
+    @pytest.mark.parametrize("quantize", [False, True])
+    def test_add_repeated_ids_and_empty_batches(self, use_faiss, quantize):
+        """Test a repeated ID keeps only its last embedding and empty adds are no-ops"""
+        if use_faiss:
+            pytest.importorskip("faiss")
+        index = create_vector_index(use_faiss=use_faiss, quantize=quantize)
+        index.add([], [])
+        index.add([], np.empty((0, EMBEDDING_DIMENSION), dtype=np.float32))
+        assert len(index) == 0
+        
+        index.add(["a", "a", "b"], [generate_embedding(t) for t in ("old", "new", "other")])
+        assert len(index) == 2
+        results = index.search(generate_embedding("new"), k=5)
+        assert [memory_id for memory_id, _ in results] == ["a", "b"]
+        assert results[0][1] == pytest.approx(1.0, abs=0.05)
+    
+    @pytest.mark.parametrize("quantize", [False, True])
+    def test_incremental_adds_match_batch_add(self, quantize):
+        """Test one-at-a-time adds (growing the row buffer) score like one batch add"""
+        texts = [f"memory {i}" for i in range(150)]
+        embeddings = [generate_embedding(t) for t in texts]
+        batched = create_vector_index(use_faiss=False, quantize=quantize)
+        batched.add(texts, embeddings)
+        incremental = create_vector_index(use_faiss=False, quantize=quantize)
+        for text, embedding in zip(texts, embeddings):
+            incremental.add([text], [embedding])
+        
+        query = generate_embedding("memory 42")
+        assert incremental.search(query, k=5) == batched.search(query, k=5)
+        assert len(incremental) == 150
+    
+    def test_buffer_shrinks_after_removals(self):
+        """Test the brute-force index releases buffer capacity as entries are removed"""
+        index = create_vector_index(use_faiss=False)
+        texts = [f"memory {i}" for i in range(300)]
+        index.add(texts, [generate_embedding(t) for t in texts])
+        peak = len(index._vectors)
+        
+        for text in texts[:290]:
+            index.remove(text)
+        
+        assert len(index._vectors) < peak
+        assert len(index._vectors) >= len(index)
+        assert index.search(generate_embedding("memory 295"), k=1)[0][0] == "memory 295"
+    
+    def test_memory_manager_search_hybrid(self):
+        """Test hybrid search finds keyword matches the substring search misses"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = MemoryManager(store_type="sqlite", vector_index=True,
+                                    db_path=os.path.join(temp_dir, "hybrid_memory.db"))
+            python = manager.add_memory("The user prefers Python programming", MemoryType.SEMANTIC)
+            manager.add_memory("The user is working on Agent Memory OS", MemoryType.SEMANTIC)
+            
+            query = "What programming language do I use?"
+            assert manager.search_memory(query) == []
+            assert manager.search_hybrid(query, limit=1)[0].id == python.id
+            assert len(manager.search_hybrid(query)) == 2
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_query_embeddings_are_cached(self):
+        """Test repeated similarity searches reuse the query embedding"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = MemoryManager(store_type="sqlite", vector_index=True,
+                                    db_path=os.path.join(temp_dir, "embedding_cache.db"))
+            manager.add_memory("The user prefers Python programming", MemoryType.SEMANTIC)
+            
+            _query_embedding.cache_clear()
+            first = manager.search_similar("Python programming", limit=1)
+            second = manager.search_similar("Python programming", memory_type=MemoryType.SEMANTIC, limit=1)
+            assert [m.id for m in first] == [m.id for m in second]
+            info = _query_embedding.cache_info()
+            assert (info.misses, info.hits) == (1, 1)
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_memory_manager_search_similar(self):
+        """Test MemoryManager keeps its vector index in sync with the store"""
+        temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(temp_dir, "vector_memory.db")
+        try:
+            manager = MemoryManager(store_type="sqlite", vector_index=True, db_path=db_path)
+            memory = manager.add_memory("The project is called Agent Memory OS", MemoryType.SEMANTIC)
+            manager.add_memory("The user prefers to work in the morning", MemoryType.EPISODIC)
+            
+            results = manager.search_similar("The project is called Agent Memory OS", limit=1)
+            assert [m.id for m in results] == [memory.id]
+            assert manager.search_similar("anything", memory_type=MemoryType.TEMPORAL) == []
+            
+            # A new manager rebuilds its index from the store
+            reopened = MemoryManager(store_type="sqlite", vector_index=True, db_path=db_path)
+            assert reopened.search_similar("The project is called Agent Memory OS", limit=1)[0].id == memory.id
+            
+            manager.delete_memory(memory.id)
+            assert memory.id not in [m.id for m in manager.search_similar("The project is called Agent Memory OS")]
+        finally:
+            shutil.rmtree(temp_dir)
 
 
 if __name__ == "__main__":
@@ -207,6 +207,18 @@ class TestStoreFactoryRegression:
         stores = StoreFactory.get_available_stores()
         assert "sqlite" in stores
         assert isinstance(stores, list)
+    
+    def test_missing_store_clients(self, monkeypatch):
+        """Test stores whose client package is missing are unlisted and fail with an install hint"""
+        from agent_memory_sdk.store import store_factory
+        monkeypatch.setattr(store_factory, "_HAS_PINECONE", False)
+        monkeypatch.setattr(store_factory, "_HAS_PSYCOPG2", False)
+        
+        assert StoreFactory.get_available_stores() == ["sqlite"]
+        with pytest.raises(ImportError, match="pip install pinecone"):
+            StoreFactory.create_store("pinecone")
+        with pytest.raises(ImportError, match="pip install psycopg2-binary"):
+            StoreFactory.create_store("postgresql")
 
 
 class TestMemoryEntryRegression: